@@ -60,6 +60,7 @@ from taurus.console.list import List
 from sardana.sardanadefs import State
 from sardana.util.wrap import wraps
 from sardana.util.thread import _asyncexc
+from sardana.util.profiler import get_phase_profiler, profile_phase
 
 from sardana.macroserver.msparameter import Type, ParamType, Optional
 from sardana.macroserver.msexception import StopException, AbortException, \
@@ -207,8 +208,12 @@ class Hookable(Logger):
         """
         if hint is None:
             return self._getHooks()
-        else:
-            return self._getHookHintsDict().get(hint, [])
+        hooks = self._getHookHintsDict().get(hint, [])
+        profiler = get_phase_profiler()
+        if profiler is not None:
+            phase = "hook." + hint
+            hooks = [profiler.wrap(hook, phase) for hook in hooks]
+        return hooks
 
     def appendHook(self, hook_info):
         """Append a hook according to the hook information
@@ -363,6 +368,8 @@ def mAPI(fn):
     To be used by the :class:`Macro` as a decorator for all methods.
     :param: macro method
     :return: wrapped macro method"""
+    phase = "mAPI." + fn.__name__
+
     @wraps(fn)
     def new_fn(*args, **kwargs):
         self = args[0]
@@ -373,7 +380,8 @@ def mAPI(fn):
                     self.setProcessingStop(True)
                 self.executor._waitStopDone()
                 raise StopException("stopped before calling %s" % fn.__name__)
-        ret = fn(*args, **kwargs)
+        with profile_phase(phase):
+            ret = fn(*args, **kwargs)
         if not self.isProcessingStop():
             if self._shouldRaiseStopException():
                 if is_macro_th:
@@ -92,6 +92,7 @@ class setvo(Macro):
     - **PosFormat**: used by macro wm, pwm and wa. Default value ``-1``
     - **OutputBlock**: used by scan macros. Default value ``False``
     - **DescriptionLength**: used by lsdef. Default value ``60``
+    - **RefreshRate**: used by umv, umvr and uct. Default value ``10``
 
 
     """
@@ -117,6 +118,7 @@ class usetvo(Macro):
     - **PosFormat**: used by macro wm, pwm and wa. Default value ``-1``
     - **OutputBlock**: used by scan macros. Default value ``False``
     - **DescriptionLength**: used by lsdef. Default value ``60``
+    - **RefreshRate**: used by umv, umvr and uct. Default value ``10``
 
     """
 
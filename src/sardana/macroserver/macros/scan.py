@@ -51,7 +51,6 @@ from sardana.macroserver.msexception import UnknownEnv
 from sardana.macroserver.macro import Hookable, Macro, Type, Table, List
 from sardana.macroserver.scan.gscan import SScan, CTScan, HScan, \
     MoveableDesc, CSScan, TScan
-from sardana.util.motion import MotionPath
 from sardana.util.tree import BranchNode
 
 UNCONSTRAINED = "unconstrained"
@@ -295,32 +294,24 @@ class aNscan(Hookable):
     def getTimeEstimation(self):
         gScan = self._gScan
         mode = self.mode
-        it = gScan.generator()
-        v_motors = gScan.get_virtual_motors()
-        curr_pos = gScan.motion.readPosition()
         total_time = 0.0
         if mode == StepMode:
-            # calculate motion time
-            max_step0_time, max_step_time = 0.0, 0.0
-            # first motion takes longer, all others should be "equal"
-            step0 = next(it)
-            for v_motor, start, stop, length in zip(v_motors, curr_pos,
-                                                    step0['positions'],
-                                                    self.interv_sizes):
-                path0 = MotionPath(v_motor, start, stop)
-                path = MotionPath(v_motor, 0, length)
-                max_step0_time = max(max_step0_time, path0.duration)
-                max_step_time = max(max_step_time, path.duration)
-            motion_time = max_step0_time + self.nr_interv * max_step_time
-            # calculate acquisition time
-            acq_time = self.nb_points * self.integ_time
-            total_time = motion_time + acq_time
-
+            total_time = gScan.positions_estimation(*self.getStepPositions())
         elif mode == ContinuousMode:
             total_time = gScan.waypoint_estimation()
         # TODO: add time estimation for ContinuousHwTimeMode
         return total_time
 
+    def getStepPositions(self):
+        """Positions of all the steps (number of steps x number of motors)
+        and the integration time (``None`` positions for continuous
+        scans)."""
+        if self.mode not in [StepMode, HybridMode]:
+            return None, self.integ_time
+        point_nos = numpy.arange(self.nb_points).reshape(-1, 1)
+        positions = self.starts + point_nos * self.interv_sizes
+        return positions, self.integ_time
+
     def getIntervalEstimation(self):
         mode = self.mode
         if mode in [StepMode, ContinuousHwTimeMode, HybridMode]:
@@ -771,6 +762,21 @@ class mesh(Macro, Hookable):
                 point_no += 1
                 yield step
 
+    def getStepPositions(self):
+        """Positions of all the steps (number of steps x 2) and the
+        integration time."""
+        m1start, m2start = self.starts
+        m1end, m2end = self.finals
+        points1, points2 = self.nr_intervs + 1
+        m1_pos = numpy.tile(numpy.linspace(m1start, m1end, points1),
+                            (points2, 1))
+        if self.bidirectional_mode:
+            m1_pos[1::2] = numpy.linspace(m1end, m1start, points1)
+        m2_pos = numpy.repeat(numpy.linspace(m2start, m2end, points2),
+                              points1)
+        positions = numpy.column_stack((m1_pos.ravel(), m2_pos))
+        return positions, self.integ_time
+
     def run(self, *args):
         for step in self._gScan.step_scan():
             yield step
@@ -902,6 +908,11 @@ class mesh_repeat(mesh):
                     point_no += 1
                     yield step
 
+    def getStepPositions(self):
+        positions, integ_time = mesh.getStepPositions(self)
+        positions = numpy.repeat(positions, self.nb_repetitions, axis=0)
+        return positions, integ_time
+
 
 class dmesh_repeat(mesh_repeat):
     '''same as mesh but it interprets the positions as being relative to the
@@ -1083,6 +1094,11 @@ motor2 sqrt(y*x+3)
             step["point_id"] = i
             yield step
 
+    def getStepPositions(self):
+        """Positions of all the steps (number of steps x number of motors)
+        and the integration times of all the steps."""
+        return self.paths.T, self._integ_time
+
     def run(self, *args):
         for step in self._gScan.step_scan():
             yield step
@@ -2079,19 +2095,12 @@ class scanstats(Macro):
         col_header = []
         cols = []
 
-        motor_data = []
-        channels_data = {}
+        scan_data = parent.data
+        motor_data = numpy.asarray(scan_data.column(selected_motor),
+                                   dtype='d')
         for channel_name in calc_channels:
-            channels_data[channel_name] = []
-
-        for idx, rc in parent.data.items():
-            motor_data.append(rc[selected_motor])
-            for channel_name in calc_channels:
-                channels_data[channel_name].append(rc[channel_name])
-
-        motor_data = numpy.array(motor_data)
-        for channel_name, data in channels_data.items():
-            channel_data = numpy.array(data)
+            channel_data = numpy.asarray(scan_data.column(channel_name),
+                                         dtype='d')
 
             (_min, _max, min_at, max_at, half_max, com, mean, _int,
              fwhm, cen) = self._calcStats(motor_data, channel_data)
@@ -38,6 +38,7 @@ from sardana.macroserver.macro import Macro, macro, Type, ViewOption, \
 from sardana.macroserver.msexception import StopException, UnknownEnv
 from sardana.macroserver.scan.scandata import Record
 from sardana.macroserver.macro import Optional
+from sardana.util.thread import RateLimiter
 
 __all__ = ["ct", "mstate", "mv", "mvr", "pwa", "pwm", "repeat", "set_lim",
            "set_lim_pool",
@@ -57,6 +58,45 @@ __docformat__ = 'restructuredtext'
 ##########################################################################
 
 
+def _read_positions(macro, moveables, cache_policy="auto"):
+    """Read user and dial positions of moveables with one request per Pool
+    (see Pool's ReadPositions command).
+
+    :return: dict with moveable names as keys and (user position, dial
+        position) as values - positions which could not be read are NaN,
+        moveables which could not be read this way are missing
+    :rtype: dict<str, tuple<float, float>>"""
+    nan = float('NaN')
+    pools = {}
+    for moveable in moveables:
+        try:
+            pool = moveable.getPoolObj()
+        except Exception:
+            continue
+        pool_names = pools.setdefault(pool.getFullName(), (pool, []))[1]
+        pool_names.append(moveable.getName())
+    ret = {}
+    for pool, names in pools.values():
+        try:
+            positions = pool.readPositions(names, cache_policy)
+        except Exception:
+            # e.g. Pool without ReadPositions command
+            macro.debug("Could not read positions from %s", pool.getName())
+            macro.debug("Details:", exc_info=1)
+            continue
+        for data in positions:
+            if data["error"] is not None:
+                macro.debug("Error when reading %s position(s): %s",
+                            data["name"], data["error"])
+            position, dial_position = data["position"], data["dial_position"]
+            if position is None:
+                position = nan
+            if dial_position is None:
+                dial_position = nan
+            ret[data["name"]] = position, dial_position
+    return ret
+
+
 class _wm(Macro):
     """Show motor positions"""
 
@@ -73,16 +113,11 @@ class _wm(Macro):
         motors = {}  # dict(motor name: motor obj)
         requests = {}  # dict(motor name: request id)
         data = {}  # dict(motor name: list of motor data)
-        # sending asynchronous requests: neither Taurus nor Sardana extensions
-        # allow asynchronous requests - use PyTango asynchronous request model
+        # read all positions with one request per Pool
+        positions = _read_positions(self, motor_list)
         for motor in motor_list:
             name = motor.getName()
             motors[name] = motor
-            args = ('position',)
-            if show_dial:
-                args += ('dialposition',)
-            _id = motor.read_attributes_asynch(args)
-            requests[name] = _id
             motor_width = max(motor_width, len(name))
             data[name] = []
         # get additional motor information (ctrl name & axis)
@@ -92,13 +127,28 @@ class _wm(Macro):
                 axis_nb = str(getattr(motor, "axis"))
                 data[name].extend((ctrl_name, axis_nb))
                 motor_width = max(motor_width, len(ctrl_name), len(axis_nb))
+        for name, motor in motors.items():
+            if name in positions:
+                position, dial_position = positions[name]
+                data[name].append(position)
+                if show_dial:
+                    data[name].append(dial_position)
+                continue
+            # sending asynchronous requests: neither Taurus nor Sardana
+            # extensions allow asynchronous requests - use PyTango
+            # asynchronous request model
+            args = ('position',)
+            if show_dial:
+                args += ('dialposition',)
+            requests[name] = motor.read_attributes_asynch(args)
         # collect asynchronous replies
         while len(requests) > 0:
             req2delete = []
             for name, _id in requests.items():
                 motor = motors[name]
                 try:
-                    attrs = motor.read_attributes_reply(_id)
+                    # wait for the reply (timeout 0 means no timeout)
+                    attrs = motor.read_attributes_reply(_id, 0)
                     for attr in attrs:
                         value = attr.value
                         if value is None:
@@ -170,10 +220,15 @@ class _wum(Macro):
         motor_pos = []
         motor_list = sorted(motor_list)
         pos_format = self.getViewOption(ViewOption.PosFormat)
+        # read all positions with one request per Pool
+        positions = _read_positions(self, motor_list)
         for motor in motor_list:
             name = motor.getName()
             motor_names.append([name])
-            pos = motor.getPosition(force=True)
+            if name in positions:
+                pos = positions[name][0]
+            else:
+                pos = motor.getPosition(force=True)
             if pos is None:
                 pos = float('NAN')
             motor_pos.append((pos,))
@@ -438,6 +493,8 @@ class wm(Macro):
         pos_format = self.getViewOption(ViewOption.PosFormat)
 
         self.execMacro("read_unitlimit_attrs", motor_list)
+        # read all positions with one request per Pool
+        positions = _read_positions(self, motor_list)
 
         for motor in motor_list:
 
@@ -448,6 +505,11 @@ class wm(Macro):
                 max_len = max(max_len, len(ctrl_name), len(str(axis_nb)))
             name = motor.getName()
             max_len = max(max_len, len(name))
+            if name in positions:
+                position, dial_position = positions[name]
+            else:
+                position = motor.getPosition(force=True)
+                dial_position = None
 
             max_len = max_len + 5
             if max_len < 14:
@@ -463,10 +525,10 @@ class wm(Macro):
                 fmt = '%c.%df' % ('%', int(pos_format))
 
             try:
-                val1 = fmt % motor.getPosition(force=True)
+                val1 = fmt % position
                 val1 = str_fmt % val1
             except:
-                val1 = str_fmt % motor.getPosition(force=True)
+                val1 = str_fmt % position
 
             val2 = str_fmt % posObj.getMaxRange().magnitude
             val3 = str_fmt % posObj.getMinRange().magnitude
@@ -480,11 +542,13 @@ class wm(Macro):
                 upos = list(map(str, ['', val2, val1, val3]))
             pos_data = upos
             if show_dial:
+                if dial_position is None:
+                    dial_position = motor.getDialPosition(force=True)
                 try:
-                    val1 = fmt % motor.getDialPosition(force=True)
+                    val1 = fmt % dial_position
                     val1 = str_fmt % val1
                 except Exception:
-                    val1 = str_fmt % motor.getDialPosition(force=True)
+                    val1 = str_fmt % dial_position
 
                 dPosObj = motor.getDialPositionObj()
                 val2 = str_fmt % dPosObj.getMaxRange().magnitude
@@ -594,7 +658,10 @@ class mstate(Macro):
 
 
 class umv(Macro):
-    """Move motor(s) to the specified position(s) and update"""
+    """Move motor(s) to the specified position(s) and update
+
+    The positions table is refreshed at most RefreshRate (view option)
+    times per second."""
 
     param_def = mv.param_def
 
@@ -602,6 +669,8 @@ class umv(Macro):
         self.all_names = []
         self.all_pos = []
         self.print_pos = False
+        refresh_rate = self.getViewOption(ViewOption.RefreshRate)
+        self._refresh = RateLimiter(self.printAllPos, refresh_rate)
         for motor, pos in motor_pos_list:
             self.all_names.append([motor.getName()])
             pos, posObj = motor.getPosition(force=True), motor.getPositionObj()
@@ -617,6 +686,7 @@ class umv(Macro):
 
     def finish(self):
         self._clean()
+        self._refresh.cancel()
         self.printAllPos()
 
     def _clean(self):
@@ -632,7 +702,7 @@ class umv(Macro):
         idx = self.all_names.index([motor.getName()])
         self.all_pos[idx] = [position]
         if self.print_pos:
-            self.printAllPos()
+            self._refresh()
 
     def printAllPos(self):
         motor_width = 10
@@ -848,7 +918,10 @@ class ct(Macro, Hookable, _ct):
 
 
 class uct(Macro, _ct):
-    """Count on the active measurement group and update"""
+    """Count on the active measurement group and update
+
+    The values table is refreshed at most RefreshRate (view option) times
+    per second."""
 
     param_def = [
         ['integ_time', Type.Float, 1.0, 'Integration time'],
@@ -859,6 +932,8 @@ class uct(Macro, _ct):
     def prepare(self, integ_time, countable_elem, **opts):
 
         self.print_value = False
+        refresh_rate = self.getViewOption(ViewOption.RefreshRate)
+        self._refresh = RateLimiter(self.printAllValues, refresh_rate)
 
         if countable_elem is None:
             try:
@@ -928,6 +1003,7 @@ class uct(Macro, _ct):
 
     def finish(self):
         self._clean()
+        self._refresh.cancel()
 
     def _clean(self):
         for channel in self.channels:
@@ -938,7 +1014,7 @@ class uct(Macro, _ct):
         idx = self.names.index([channel.getName()])
         self.values[idx] = [value]
         if self.print_value and not self.isStopped():
-            self.printAllValues()
+            self._refresh()
 
     def printAllValues(self):
         ch_width = 10
@@ -34,6 +34,7 @@ import re
 import os
 import sys
 import copy
+import json
 import inspect
 import logging
 import functools
@@ -68,6 +69,7 @@ from sardana.macroserver.msexception import UnknownMacroLibrary, \
     ReleaseException, MacroServerException, UnknownEnv
 from sardana.util.parser import ParamParser
 from sardana.util.thread import raise_in_thread
+from sardana.util.profiler import PhaseProfiler
 
 # These classes are imported from the "client" part of sardana, if finally
 # both the client and the server side needs them, place them in some
@@ -1050,6 +1052,101 @@ class LogMacroManager(Logger):
         return True
 
 
+class ProfileMacroManager(Logger):
+
+    """Manage the macro execution profiling. It is configurable with
+    ProfileMacro, ProfileMacroCProfile and ProfileMacroDir environment
+    variables.
+
+    The wall-clock time of the top-most macro is aggregated per execution
+    phase (macro API calls, hooks, motions, acquisitions and data
+    recording) and optionally the macro thread is profiled with cProfile.
+    At the end of the macro the summary is reported to the door, stored in
+    the ProfileMacroDir together with the cProfile statistics, and is
+    available with the Door's GetMacroProfile command.
+
+    .. note::
+        The ProfileMacroManager class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including its removal) may occur if
+        deemed necessary by the core developers.
+    """
+
+    DEFAULT_DIR = os.path.join(os.sep, "tmp")
+
+    def __init__(self, macro_obj):
+        name = macro_obj.getName() + ".ProfileMacroManager"
+        Logger.__init__(self, name)
+        self._macro_obj = macro_obj
+        self._profiler = None
+        self._profile_dir = None
+
+    def _getEnv(self, name, default):
+        try:
+            return self._macro_obj.getEnv(name)
+        except UnknownEnv:
+            return default
+
+    def enable(self):
+        """Enable macro profiling only if the following requirements are
+        fulfilled:
+            * this is the top-most macro
+            * macro profiling is enabled by user
+
+        :return: True or False, depending if profiling was enabled or not
+        :rtype: boolean
+        """
+        macro_obj = self._macro_obj
+        # enable profiling only for the top-most macros
+        if macro_obj.getParentMacro() is not None:
+            return False
+        # enable profiling only if configured by user
+        if not self._getEnv("ProfileMacro", False):
+            return False
+        use_cprofile = self._getEnv("ProfileMacroCProfile", False)
+        self._profile_dir = self._getEnv("ProfileMacroDir", self.DEFAULT_DIR)
+        self._profiler = PhaseProfiler(use_cprofile=use_cprofile)
+        self._profiler.start()
+        return True
+
+    def disable(self):
+        """Disable macro profiling only if it was enabled before and
+        publish the profile.
+
+        :return: True or False, depending if profiling was disabled or not
+        :rtype: boolean
+        """
+        profiler = self._profiler
+        if profiler is None:
+            return False
+        profiler.stop()
+        self._profiler = None
+        macro_obj = self._macro_obj
+        executor = macro_obj.executor
+        door = macro_obj.door
+        # don't call the mAPI methods of macro_obj, it may be aborted already
+        profile = dict(macro=macro_obj._getName(),
+                       summary=profiler.get_summary(),
+                       cprofile=profiler.get_cprofile_stats())
+        executor._last_macro_profile = profile
+        door.info("Profile of %s:\n%s", profile["macro"],
+                  profiler.format_summary())
+        profile_dir = self._profile_dir
+        door_name = door.name.replace(":", "_").replace("/", "_")
+        base_name = os.path.join(profile_dir, "profile_" + door_name)
+        try:
+            with open(base_name + ".json", "w") as summary_file:
+                json.dump(dict(macro=profile["macro"],
+                               summary=profile["summary"]), summary_file)
+            if profile["cprofile"] is not None:
+                with open(base_name + ".prof", "wb") as stats_file:
+                    stats_file.write(profile["cprofile"])
+        except OSError:
+            self.warning("Could not store the profile in %s", profile_dir)
+            self.debug("Details:", exc_info=True)
+        return True
+
+
 class MacroExecutor(Logger):
 
     """ """
@@ -1095,6 +1192,7 @@ class MacroExecutor(Logger):
         self._paused = False
         self._released = False
         self._last_macro_status = None
+        self._last_macro_profile = None
         # threading events for synchronization of stopping/abortting of
         # reserved objects
         self._stop_done = None
@@ -1109,6 +1207,17 @@ class MacroExecutor(Logger):
 
     door = property(getDoor)
 
+    def getLastMacroProfile(self):
+        """Returns the profile of the last profiled macro (see
+        :class:`ProfileMacroManager`).
+
+        :return: dictionary with the macro name, the phases summary and the
+            cProfile statistics (None if cProfile was not used) or None if
+            no macro was profiled
+        :rtype: :obj:`dict`
+        """
+        return self._last_macro_profile
+
     def getMacroServer(self):
         return self.door.macro_server
 
@@ -1645,6 +1754,9 @@ class MacroExecutor(Logger):
         elif self._stopped:
             self.sendMacroStatusStop()
             raise StopException("stopped between macros (before %s)" % name)
+
+        profile_macro_manager = ProfileMacroManager(macro_obj)
+        profile_macro_manager.enable()
         macro_exp, tb, result = None, None, None
         try:
             self.debug("[START] runMacro %s" % desc)
@@ -1682,6 +1794,8 @@ class MacroExecutor(Logger):
                         'traceback': traceback.format_exc()}
             macro_exp = MacroServerException(exp_pars)
 
+        profile_macro_manager.disable()
+
         # make sure the macro's on_abort is called and that a proper macro
         # status is sent
         if self._aborted:
@@ -43,7 +43,8 @@ class ViewOption(object, metaclass=ViewOptionMeta):
         'ShowCtrlAxis': False,
         'PosFormat': -1,
         'OutputBlock': False,
-        'DescriptionLength': 60
+        'DescriptionLength': 60,
+        'RefreshRate': 10
     }
 
     @classmethod
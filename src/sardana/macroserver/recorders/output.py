@@ -33,20 +33,39 @@ import numpy
 import datetime
 import operator
 import weakref
+import threading
 
 from taurus.core.util.containers import CaselessList
 
 from sardana.macroserver.scan.recorder.datarecorder import DataRecorder
 from sardana.macroserver.scan.recorder.storage import BaseFileRecorder
+from sardana.util.thread import get_flush_scheduler
 import collections
 import numbers
 
 
 class JsonRecorder(DataRecorder):
-
-    def __init__(self, stream, cols=None, **pars):
+    """Sends the scan data as JSON packets through the stream (the Door
+    RecordData attribute).
+
+    Records are sent one per packet (*record_data*) unless *batch_size* is
+    greater than 1. Then up to *batch_size* records are sent in one
+    *record_data_batch* packet whose data maps each column name to the list
+    of its values. A batch is sent at the latest *batch_time* seconds after
+    its first record so the live display keeps up with slow scans.
+    :meth:`~sardana.taurus.core.tango.sardana.macroserver.BaseDoor.splitRecordData`
+    splits the batches back into records on the client side.
+    """
+
+    def __init__(self, stream, cols=None, batch_size=1, batch_time=0.1,
+                 **pars):
         DataRecorder.__init__(self, **pars)
         self._stream = weakref.ref(stream)
+        self._batch_size = batch_size
+        self._batch_time = batch_time
+        self._batch = []
+        self._batch_macro_id = None
+        self._batch_lock = threading.Lock()
 
     def _startRecordList(self, recordlist):
         macro_id = recordlist.getEnvironValue('macro_id')
@@ -85,6 +104,7 @@ class JsonRecorder(DataRecorder):
         self._sendPacket(type="data_desc", data=data, macro_id=macro_id)
 
     def _endRecordList(self, recordlist):
+        self._flushBatch()
         macro_id = recordlist.getEnvironValue('macro_id')
         data = {'endtime': recordlist.getEnvironValue('endtime').ctime(),
                 'deadtime': recordlist.getEnvironValue('deadtime')}
@@ -96,7 +116,33 @@ class JsonRecorder(DataRecorder):
         for k in self.column_desc:
             name = k.name
             data[name] = record.data[name]
-        self._sendPacket(type="record_data", data=data, macro_id=macro_id)
+        if self._batch_size <= 1:
+            self._sendPacket(type="record_data", data=data,
+                             macro_id=macro_id)
+            return
+        with self._batch_lock:
+            self._batch.append(data)
+            self._batch_macro_id = macro_id
+            if len(self._batch) < self._batch_size:
+                if len(self._batch) == 1:
+                    get_flush_scheduler().schedule(self._flushBatch,
+                                                   self._batch_time)
+                return
+        self._flushBatch()
+
+    def _flushBatch(self):
+        """Sends the pending records (if any) in one packet"""
+        with self._batch_lock:
+            get_flush_scheduler().cancel(self._flushBatch)
+            batch, self._batch = self._batch, []
+            if len(batch) == 0:
+                return
+            data = {}
+            for name in batch[0]:
+                data[name] = [record[name] for record in batch]
+            # sent with the lock acquired to keep the packets order
+            self._sendPacket(type="record_data_batch", data=data,
+                             macro_id=self._batch_macro_id)
 
     def _sendPacket(self, **kwargs):
         '''creates a JSON packet using the keyword arguments passed
@@ -114,6 +160,7 @@ class JsonRecorder(DataRecorder):
             value = value.tolist()
         except:
             pass
+        self._flushBatch()
         macro_id = self._stream().getID()
         data = dict(kwargs)  # shallow copy
         data['name'] = name
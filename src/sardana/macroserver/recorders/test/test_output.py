@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for the output recorders."""
+
+import time
+from datetime import datetime
+from unittest import TestCase
+
+from sardana.macroserver.scan import ColumnDesc
+from sardana.macroserver.recorders.output import JsonRecorder
+from sardana.taurus.core.tango.sardana.macroserver import BaseDoor
+
+COL_NAMES = ("point_nb", "col1")
+
+
+class RecordList(dict):
+
+    def __init__(self, env):
+        self._env = env
+
+    def getEnvironValue(self, name):
+        return self._env[name]
+
+
+class Record(object):
+
+    def __init__(self, data, recordno=0):
+        self.data = data
+        self.recordno = recordno
+
+
+class Stream(object):
+    """Collects the packets as the Door's RecordData attribute would do"""
+
+    def __init__(self):
+        self.packets = []
+
+    def getID(self):
+        return 1
+
+    def _sendRecordData(self, data, codec=None):
+        self.packets.append((codec, data))
+
+
+class TestJsonRecorder(TestCase):
+
+    def setUp(self):
+        self.stream = Stream()
+        self.env = {
+            "macro_id": 1,
+            "title": "test",
+            "counters": [],
+            "ScanFile": None,
+            "ScanDir": None,
+            "serialno": 0,
+            "datadesc": [ColumnDesc(name=name, label=name, dtype="float64",
+                                    shape=tuple()) for name in COL_NAMES],
+            "ref_moveables": [],
+            "estimatedtime": None,
+            "total_scan_intervals": None,
+            "starttime": datetime.now(),
+            "endtime": None,
+            "deadtime": None,
+        }
+        self.record_list = RecordList(self.env)
+
+    def _scan(self, recorder, nb_records, sleep_time=0):
+        recorder.startRecordList(self.record_list)
+        for i in range(nb_records):
+            recorder.writeRecord(Record({"point_nb": i, "col1": 0.1 * i}, i))
+            time.sleep(sleep_time)
+        self.env["endtime"] = datetime.now()
+        recorder.endRecordList(self.record_list)
+
+    def _get_records(self):
+        records = []
+        for data in self.stream.packets:
+            for fmt, packet in BaseDoor.splitRecordData(data):
+                if packet["type"] == "record_data":
+                    records.append(packet["data"])
+        return records
+
+    def _assert_records(self, nb_records):
+        records = self._get_records()
+        expected = [{"point_nb": i, "col1": 0.1 * i}
+                    for i in range(nb_records)]
+        self.assertEqual(records, expected)
+        types = [packet["type"] for _, packet in self.stream.packets]
+        self.assertEqual(types[0], "data_desc")
+        self.assertEqual(types[-1], "record_end")
+
+    def test_record(self):
+        """Test one packet per record (default)"""
+        recorder = JsonRecorder(self.stream)
+        self._scan(recorder, 5)
+        self.assertEqual(len(self.stream.packets), 7)
+        self._assert_records(5)
+
+    def test_batch_size(self):
+        """Test packets of batch size records and of the rest at the end"""
+        recorder = JsonRecorder(self.stream, batch_size=4, batch_time=10)
+        self._scan(recorder, 10)
+        sizes = [len(packet["data"]["point_nb"])
+                 for _, packet in self.stream.packets
+                 if packet["type"] == "record_data_batch"]
+        self.assertEqual(sizes, [4, 4, 2])
+        self._assert_records(10)
+
+    def test_batch_time(self):
+        """Test that the records do not wait longer than the batch time"""
+        recorder = JsonRecorder(self.stream, batch_size=100,
+                                batch_time=0.01)
+        self._scan(recorder, 3, sleep_time=0.1)
+        batches = [packet for _, packet in self.stream.packets
+                   if packet["type"] == "record_data_batch"]
+        self.assertEqual(len(batches), 3)
+        self._assert_records(3)
@@ -56,7 +56,7 @@ from taurus.core.tango.tangovalidator import TangoDeviceNameValidator
 from sardana.sardanathreadpool import OmniWorker
 from sardana.util.tree import BranchNode, LeafNode, Tree
 from sardana.util.motion import Motor as VMotor
-from sardana.util.motion import MotionPath
+from sardana.util.motion import MotionPath, calculate_motion_durations
 from sardana.util.thread import CountLatch
 from sardana.pool.pooldefs import SynchDomain, SynchParam
 from sardana.macroserver.msexception import MacroServerException, UnknownEnv, \
@@ -157,6 +157,105 @@ class TangoExtraData(ExtraData):
             return None
 
 
+class _SnapshotReader(object):
+    """Reads values of the pre-scan snapshot attributes.
+
+    Element information and device proxies are cached across scans (element
+    information is invalidated when the Pool elements change). Attributes
+    are read with one asynchronous request per device and all requests are
+    deposited before gathering the replies, so the devices are read
+    concurrently. The proxies are shared by all the doors so the timeout is
+    passed with each reply request and the proxies timeout is not changed.
+    """
+
+    def __init__(self, manager):
+        self._lock = threading.Lock()
+        self._elements_info = None
+        self._proxies = {}
+        # manager keeps a weak reference to its listeners
+        manager.add_listener(self)
+
+    def event_received(self, src, type_, value):
+        if type_.name == "PoolElementsChanged":
+            with self._lock:
+                self._elements_info = None
+
+    def getElementsInfo(self, manager):
+        with self._lock:
+            if self._elements_info is None:
+                self._elements_info = \
+                    manager.get_elements_with_interface('Element')
+            return self._elements_info
+
+    def getProxy(self, dev_name):
+        with self._lock:
+            proxy = self._proxies.get(dev_name.lower())
+            if proxy is None:
+                proxy = PyTango.DeviceProxy(dev_name)
+                self._proxies[dev_name.lower()] = proxy
+        return proxy
+
+    def read(self, sources, timeout):
+        """reads values of the given attributes
+
+        :param sources: (seq<str>) attribute names
+        :param timeout: (float) timeout (in seconds) of each device request
+
+        :return: (dict) values (or exceptions if the attribute could not be
+                 read) by attribute name
+        """
+        ret = {}
+        devices = OrderedDict()
+        for source in sources:
+            try:
+                dev_name, attr_name = source.rsplit("/", 1)
+            except ValueError:
+                ret[source] = ValueError("%s is not an attribute" % source)
+                continue
+            devices.setdefault(dev_name, []).append((attr_name, source))
+        # deposit read requests
+        requests = []
+        for dev_name, attrs in list(devices.items()):
+            attr_names = [attr_name for attr_name, _ in attrs]
+            try:
+                proxy = self.getProxy(dev_name)
+                req_id = proxy.read_attributes_asynch(attr_names)
+            except Exception as e:
+                for _, source in attrs:
+                    ret[source] = e
+                continue
+            requests.append((proxy, req_id, attrs))
+        # gather all replies - all devices share the same deadline
+        deadline = time.time() + timeout
+        for proxy, req_id, attrs in requests:
+            wait = max(1, int((deadline - time.time()) * 1000))
+            try:
+                data = proxy.read_attributes_reply(req_id, wait)
+            except Exception as e:
+                for _, source in attrs:
+                    ret[source] = e
+                continue
+            for (_, source), data_item in zip(attrs, data):
+                if data_item.has_failed:
+                    ret[source] = PyTango.DevFailed(
+                        *data_item.get_err_stack())
+                else:
+                    ret[source] = data_item.value
+        return ret
+
+
+#: pre-scan snapshot readers (shared by all the scans) by manager
+_snapshot_readers = weakref.WeakKeyDictionary()
+
+
+def _getSnapshotReader(manager):
+    try:
+        return _snapshot_readers[manager]
+    except KeyError:
+        reader = _snapshot_readers[manager] = _SnapshotReader(manager)
+        return reader
+
+
 class GScan(Logger):
     """Generic Scan object.
     The idea is that the scan macros create an instance of this Generic Scan,
@@ -338,10 +437,20 @@ class GScan(Logger):
             apply_extrapol = macro.getEnv('ApplyExtrapolation')
         except UnknownEnv:
             apply_extrapol = False
+        try:
+            spill_window = macro.getEnv('ScanDataSpillWindow')
+        except UnknownEnv:
+            spill_window = None
+        try:
+            keep_spill = macro.getEnv('ScanDataSpillKeep')
+        except UnknownEnv:
+            keep_spill = False
         # The Scan data object
         data = ScanFactory().getScanData(data_handler,
                                          apply_interpolation=apply_interpol,
-                                         apply_extrapolation=apply_extrapol)
+                                         apply_extrapolation=apply_extrapol,
+                                         spill_window=spill_window,
+                                         keep_spill=keep_spill)
 
         # The Output recorder (if any)
         output_recorder = self._getOutputRecorder()
@@ -448,8 +557,17 @@ class GScan(Logger):
         try:
             json_enabled = self.macro.getEnv('JsonRecorder')
             if json_enabled:
+                kwargs = {}
+                for env_name, kwarg in (("JsonRecorderBatchSize",
+                                         "batch_size"),
+                                        ("JsonRecorderBatchTime",
+                                         "batch_time")):
+                    try:
+                        kwargs[kwarg] = self.macro.getEnv(env_name)
+                    except UnknownEnv:
+                        pass
                 return self._rec_manager.getRecorderClass("JsonRecorder")(
-                    self.macro)
+                    self.macro, **kwargs)
         except InterruptException:
             raise
         except Exception:
@@ -801,24 +919,38 @@ class GScan(Logger):
                  value for that attr
         """
         manager = self.macro.getManager()
-        all_elements_info = manager.get_elements_with_interface('Element')
-        ret = []
+        reader = _getSnapshotReader(manager)
+        all_elements_info = reader.getElementsInfo(manager)
+        try:
+            timeout = self.macro.getEnv('PreScanSnapshotTimeout')
+        except UnknownEnv:
+            timeout = 3
+        columns = []
         for src, label in elements:
+            if src in all_elements_info:
+                ei = all_elements_info[src]
+                column = ColumnDesc(name=ei.full_name,
+                                    label=label,
+                                    instrument=ei.instrument,
+                                    source=ei.source)
+            else:
+                column = ColumnDesc(name=src,
+                                    label=label,
+                                    source=src)
+            columns.append((src, label, column))
+        positions = self._readSnapshotPositions(elements, all_elements_info)
+        # @Fixme: Tango-centric. It should work for any Taurus Attribute
+        values = reader.read([column.source for src, _, column in columns
+                              if src not in positions], timeout)
+        ret = []
+        for src, label, column in columns:
             try:
-                if src in all_elements_info:
-                    ei = all_elements_info[src]
-                    column = ColumnDesc(name=ei.full_name,
-                                        label=label,
-                                        instrument=ei.instrument,
-                                        source=ei.source)
+                if src in positions:
+                    v = positions[src]
                 else:
-                    column = ColumnDesc(name=src,
-                                        label=label,
-                                        source=src)
-
-                # @Fixme: Tango-centric. It should work for any Taurus
-                # Attribute
-                v = PyTango.AttributeProxy(column.source).read().value
+                    v = values[column.source]
+                    if isinstance(v, Exception):
+                        raise v
                 column.pre_scan_value = v
                 column.shape = np.shape(v)
                 column.dtype = getattr(v, 'dtype', np.dtype(type(v))).name
@@ -829,6 +961,44 @@ class GScan(Logger):
                 self.debug('Details:', exc_info=1)
         return ret
 
+    def _readSnapshotPositions(self, elements, all_elements_info):
+        """reads positions of the moveables among the snapshot elements with
+        one request per Pool (see Pool's ReadPositions command)
+
+        :param elements: (list<str,str>) list of tuples of src,label
+        :param all_elements_info: (dict) element info by name
+
+        :return: (dict<str,float>) positions by src - elements which could
+                 not be read this way are missing
+        """
+        pools = {}
+        for src, _ in elements:
+            ei = all_elements_info.get(src)
+            if ei is None or ei.getType() not in ("Motor", "PseudoMotor"):
+                continue
+            if not ei.source.lower().endswith("/position"):
+                continue
+            try:
+                pool = ei.getObj().getPoolObj()
+            except Exception:
+                continue
+            pool_srcs = pools.setdefault(pool.getFullName(), (pool, {}))[1]
+            pool_srcs[ei.name] = src
+        ret = {}
+        for pool, srcs in pools.values():
+            try:
+                data = pool.readPositions(list(srcs))
+            except Exception:
+                # e.g. Pool without ReadPositions command
+                self.debug("Could not read positions from %s",
+                           pool.getName(), exc_info=1)
+                continue
+            for position in data:
+                src = srcs.get(position["name"])
+                if src is not None and position["position"] is not None:
+                    ret[src] = position["position"]
+        return ret
+
     def get_virtual_motors(self):
         ret = []
         for moveable in self.moveables:
@@ -841,6 +1011,44 @@ class GScan(Logger):
             ret.append(v_motor)
         return ret
 
+    def positions_estimation(self, positions, integ_time=0.0):
+        """Estimate time of a step scan from all its positions at once.
+
+        The motion time of each step is the duration of the longest motion
+        path (starting from the current positions for the first step).
+        Motion paths are calculated in a vectorized way, so the estimation
+        stays exact and fast also for scans with millions of points.
+
+        :param positions: positions of all the steps
+            (number of steps x number of moveables)
+        :type positions: :class:`numpy.ndarray`
+        :param integ_time: integration time of all the steps (scalar) or
+            of each step (sequence)
+        :type integ_time: float or :class:`numpy.ndarray`
+        :return: estimated time
+        :rtype: float
+        """
+        positions = np.asarray(positions, dtype='d')
+        nb_points = len(positions)
+        if nb_points == 0:
+            return 0.0
+        positions = positions.reshape(nb_points, -1)
+        motion_time = np.zeros(nb_points)
+        if positions.shape[1] > 0:
+            start_pos = np.asarray(self.motion.readPosition(force=True),
+                                   dtype='d')
+            starts = np.vstack((start_pos, positions[:-1]))
+            for i, v_motor in enumerate(self.get_virtual_motors()):
+                durations = calculate_motion_durations(
+                    v_motor, starts[:, i], positions[:, i])
+                np.maximum(motion_time, durations, out=motion_time)
+        integ_time = np.asarray(integ_time, dtype='d')
+        if integ_time.ndim == 0:
+            acq_time = float(integ_time) * nb_points
+        else:
+            acq_time = integ_time.sum()
+        return float(motion_time.sum() + acq_time)
+
     MAX_ITER = 100000
 
     def _estimate(self, max_iter=None):
@@ -850,6 +1058,12 @@ class GScan(Logger):
         position) and acquisition time.
 
         Interval estimation is a number of scan trajectory intervals.
+
+        Macros may implement ``getStepPositions()`` returning the positions
+        of all the steps (number of steps x number of moveables) and their
+        integration time(s). Then the estimation is calculated with
+        :meth:`~GScan.positions_estimation` instead of iterating the
+        generator.
         """
         with_time = hasattr(self.macro, "getTimeEstimation")
         with_interval = hasattr(self.macro, "getIntervalEstimation")
@@ -858,6 +1072,16 @@ class GScan(Logger):
             i = self.macro.getIntervalEstimation()
             return t, i
 
+        if not with_time and hasattr(self.macro, "getStepPositions"):
+            positions, integ_time = self.macro.getStepPositions()
+            if positions is not None:
+                t = self.positions_estimation(positions, integ_time)
+                if with_interval:
+                    i = self.macro.getIntervalEstimation()
+                else:
+                    i = max(len(positions) - 1, 0)
+                return t, i
+
         max_iter = max_iter or self.MAX_ITER
         iterator = self.generator()
         total_time = 0.0
@@ -1023,10 +1247,15 @@ class GScan(Logger):
             self._env["endstatus"] = endstatus
             self.end()
             self.do_restore()
-            if endstatus == ScanEndStatus.Normal:
-                if hasattr(macro, 'getHooks'):
-                    for hook in macro.getHooks('post-scan'):
-                        hook()
+            try:
+                if endstatus == ScanEndStatus.Normal:
+                    if hasattr(macro, 'getHooks'):
+                        for hook in macro.getHooks('post-scan'):
+                            hook()
+            finally:
+                spill_dir = self.data.close()
+                if spill_dir is not None:
+                    macro.info("Scan data kept in %s", spill_dir)
 
     def scan_loop(self):
         raise NotImplementedError('Scan method cannot be called by '
@@ -1056,9 +1285,71 @@ class GScan(Logger):
 
 
 class SScan(GScan):
-    """Step scan"""
+    """Step scan
+
+    Optionally (``ScanPipelining`` environment variable) the scan may be
+    pipelined: motion to the next point starts as soon as the counting of
+    the current point finishes and the readout of the values, the extra
+    columns and the recording happen concurrently with this motion.
+    Points which need strict sequencing (with hooks) are executed in the
+    standard way.
+    """
+
+    # step hook places which require strict sequencing of the step phases
+    SEQUENCED_HOOKS = ('pre-move-hooks', 'post-move-hooks', 'pre-acq-hooks',
+                       'post-acq-hooks', 'post-step-hooks', 'hooks')
+
+    # whether the scan may overlap motion with the acquisition readout
+    pipelining_supported = True
+
+    def _isPipeliningEnabled(self):
+        if not self.pipelining_supported:
+            return False
+        try:
+            pipelining = self.macro.getEnv('ScanPipelining')
+        except UnknownEnv:
+            return False
+        if not pipelining:
+            return False
+        if self.motion is None:
+            return False
+        if self.condition_macro is not None:
+            self.macro.debug("Scan pipelining disabled due to the general "
+                             "condition")
+            return False
+        return True
+
+    def _needsSequencing(self, step):
+        for hook_place in self.SEQUENCED_HOOKS:
+            if len(step.get(hook_place, ())) > 0:
+                return True
+        return False
+
+    def _iterStepPairs(self):
+        """Iterate over steps together with the step that follows them
+        (``None`` for the last step)."""
+        steps = iter(self.steps)
+        try:
+            current = next(steps)
+        except StopIteration:
+            return
+        for following in steps:
+            yield current, following[1]
+            current = following
+        yield current, None
 
     def scan_loop(self):
+        mg = self.measurement_group
+        # configuration, integration time etc. are written only on changes
+        # and the values arrive with the value buffer events
+        mg.startCountSession()
+        try:
+            for progress in self._step_loop():
+                yield progress
+        finally:
+            mg.stopCountSession()
+
+    def _step_loop(self):
         lstep = None
         macro = self.macro
         scream = False
@@ -1091,13 +1382,33 @@ class SScan(GScan):
 
         self.point_id = 0
 
-        for i, step in self.steps:
-            # allow scan to be stopped between points
-            macro.checkPoint()
-            self.stepUp(i, step, lstep)
-            lstep = step
-            if scream:
-                yield ((i + 1) / nb_points) * 100
+        if self._isPipeliningEnabled():
+            self.debug("Executing pipelined step scan")
+            self._pending_move = None
+            try:
+                for (i, step), next_step in self._iterStepPairs():
+                    # allow scan to be stopped between points
+                    macro.checkPoint()
+                    if (self._pending_move is None
+                            and self._needsSequencing(step)):
+                        self.stepUp(i, step, lstep)
+                    else:
+                        self.stepUpPipelined(i, step, next_step)
+                    lstep = step
+                    if scream:
+                        yield ((i + 1) / nb_points) * 100
+            except BaseException:
+                # the motion to the next point must not outlive the scan
+                self._stopPendingMove()
+                raise
+        else:
+            for i, step in self.steps:
+                # allow scan to be stopped between points
+                macro.checkPoint()
+                self.stepUp(i, step, lstep)
+                lstep = step
+                if scream:
+                    yield ((i + 1) / nb_points) * 100
 
         if not scream:
             yield 100.0
@@ -1247,6 +1558,120 @@ class SScan(GScan):
 
             self.point_id = self.point_id + 1
 
+    def _startMove(self, step):
+        """Start motion to the step positions.
+
+        :return: motion start time and motion ids
+        :rtype: tuple(float, seq)
+        """
+        motion = self.motion
+        move_start_time = time.time()
+        try:
+            ids = motion.startMotion(step['positions'])
+        except InterruptException:
+            raise
+        except Exception:
+            self.dump_information(self.point_id, step, motion.moveable_list)
+            raise
+        return move_start_time, ids
+
+    def _waitMove(self, step, move):
+        """Wait for the motion started with :meth:`_startMove` to finish.
+
+        :return: motion state and final positions
+        :rtype: tuple(DevState, seq<float>)
+        """
+        motion = self.motion
+        move_start_time, ids = move
+        try:
+            state, positions = motion.waitMotion(ids)
+        except InterruptException:
+            raise
+        except Exception:
+            self.dump_information(self.point_id, step, motion.moveable_list)
+            raise
+        self._sum_motion_time += time.time() - move_start_time
+        self._env['motiontime'] = self._sum_motion_time
+        return state, positions
+
+    def _stopPendingMove(self):
+        """Stop the motion to the next step started in advance (if any) and
+        wait for its end."""
+        move = self._pending_move
+        if move is None:
+            return
+        self._pending_move = None
+        motion = self.motion
+        try:
+            motion.stop()
+            motion.waitMotion(move[1])
+        except Exception:
+            self.warning("Unable to stop the motion to the next point")
+            self.debug("Details:", exc_info=1)
+
+    def stepUpPipelined(self, n, step, next_step):
+        """Execute step overlapping the motion to the next step with the
+        values readout and the recording of this step.
+
+        The step must not require strict sequencing (no hooks). The motion
+        to this step may have been already started while executing the
+        previous step.
+        """
+        mg = self.measurement_group
+        startts = self._env['startts']
+
+        move = self._pending_move
+        self._pending_move = None
+        if move is None:
+            self.debug("[START] motion")
+            move = self._startMove(step)
+        state, positions = self._waitMove(step, move)
+        self.debug("[ END ] motion")
+
+        dt = time.time() - startts
+        # allow scan to be stopped between motion and data acquisition
+        self.macro.checkPoint()
+
+        if state != Ready:
+            self.dump_information(
+                self.point_id, step, self.motion.moveable_list)
+            m = "Scan aborted after problematic motion: " \
+                "Motion ended with %s\n" % str(state)
+            raise ScanException({'msg': m})
+
+        def start_next_move():
+            if next_step is None or self._needsSequencing(next_step):
+                return
+            self.debug("[START] motion (pipelined)")
+            self._pending_move = self._startMove(next_step)
+
+        integ_time = step['integ_time']
+        # Acquire data
+        self.debug("[START] acquisition")
+        if self._deterministic_scan:
+            state, data_line = mg.count_raw(post_count_cb=start_next_move)
+        else:
+            state, data_line = mg.count(integ_time,
+                                        post_count_cb=start_next_move)
+        for ec in self._extra_columns:
+            data_line[ec.getName()] = ec.read()
+        self.debug("[ END ] acquisition")
+        self._sum_acq_time += integ_time
+        self._env['acqtime'] = self._sum_acq_time
+
+        # Add final moveable positions
+        data_line['point_nb'] = self.point_id
+        data_line['timestamp'] = dt
+        for i, m in enumerate(self.moveables):
+            data_line[m.moveable.getName()] = positions[i]
+
+        # Add extra data coming in the step['extrainfo'] dictionary
+        if 'extrainfo' in step:
+            data_line.update(step['extrainfo'])
+
+        self.data.addRecord(data_line)
+
+        self.point_id = self.point_id + 1
 
     def dump_information(self, n, step, elements):
         msg = ["Report: Stopped at step #" + str(n) + " with:"]
@@ -2654,6 +3079,9 @@ class CTScan(CScan, CAcquisition):
 class HScan(SScan):
     """Hybrid scan"""
 
+    # motion and acquisition already run concurrently
+    pipelining_supported = False
+
     def stepUp(self, n, step, lstep):
         motion, mg = self.motion, self.measurement_group
         startts = self._env['startts']
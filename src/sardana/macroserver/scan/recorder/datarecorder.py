@@ -34,6 +34,8 @@ import time
 from taurus.core.util.log import Logger
 from taurus.core.util.enumeration import Enumeration
 
+from sardana.util.profiler import profiled
+
 SaveModes = Enumeration('SaveModes', ('Record', 'Block'))
 RecorderStatus = Enumeration('RecorderStatus', ('Idle', 'Active', 'Disable'))
 
@@ -62,6 +64,7 @@ class DataHandler:
             else:
                 recorder.writeRecordList(recordlist)
 
+    @profiled("DataHandler.addRecord")
     def addRecord(self, recordlist, record):
         for recorder in self.recorders:
             if recorder.savemode is SaveModes.Record:
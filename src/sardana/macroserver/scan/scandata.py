@@ -25,11 +25,18 @@
 
 """This is the macro server scan data module"""
 
-__all__ = ["ColumnDesc", "MoveableDesc", "Record", "RecordEnvironment",
-           "ScanDataEnvironment", "RecordList", "ScanData", "ScanFactory"]
+__all__ = ["ColumnDesc", "MoveableDesc", "Record", "SpilledRecord",
+           "RecordEnvironment", "ScanDataEnvironment", "ColumnStore",
+           "RecordList", "ScanData", "ScanFactory"]
 
+import os
 import copy
+import json
 import math
+import shutil
+import tempfile
+
+import numpy
 
 from taurus.core.util.singleton import Singleton
 from taurus import Device, Attribute, getSchemeFromName, Factory
@@ -255,6 +262,23 @@ class Record(object):
         return data
 
 
+class SpilledRecord(Record):
+    """Record released from the memory by the :class:`RecordList` (see its
+    *spill_window*). Its data are loaded from the :class:`ColumnStore` on
+    each access."""
+
+    def __init__(self, columns, index, recordno):
+        self._columns = columns
+        self._index = index
+        self.recordno = recordno
+        self.complete = 1
+        self.written = 1
+
+    @property
+    def data(self):
+        return self._columns.row(self._index)
+
+
 class RecordEnvironment(dict):
     """  A RecordEnvironment is a set of arbitrary pairs of type
     label/value in the form of a dictionary.
@@ -293,22 +317,282 @@ class ScanDataEnvironment(RecordEnvironment):
     needed = ['title', 'labels', 'user']
 
 
+class ColumnStore(object):
+    """Columnar storage of the completed records.
+
+    Each scalar column is stored in a growable NumPy array and each 1D/2D
+    column (or a column of value references) in a list of frames.
+    :meth:`~ColumnStore.column` returns the column data without copying.
+
+    If *spill_window* is given, once the number of records exceeds it the
+    numeric columns (including the 1D/2D columns of a constant shape) are
+    moved to memory-mapped files in a temporary directory, so the
+    operating system may write them out instead of keeping them in memory.
+    The files are removed on :meth:`~ColumnStore.close` unless *keep* is
+    set. The kept directory contains ``index.json`` describing each file
+    (column name, dtype and shape) so it can be loaded with
+    :class:`numpy.memmap`.
+    """
+
+    #: initial number of records which fit in the scalar columns
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, data_desc=None, spill_window=None, keep=False):
+        self._shapes = {}
+        # integer columns stored as float64
+        self._ints = set()
+        for desc in data_desc or []:
+            self._shapes[desc.name] = desc.shape
+            try:
+                if numpy.dtype(desc.dtype).kind in "iu":
+                    self._ints.add(desc.name)
+            except TypeError:
+                pass
+        self._arrays = {}
+        self._frames = {}
+        self._capacity = 0
+        self._len = 0
+        self._spill_window = spill_window
+        self._keep = keep
+        self._directory = None
+        self._files = {}
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, name):
+        return name in self._arrays or name in self._frames
+
+    def keys(self):
+        """Names of the columns"""
+        return list(self._arrays.keys()) + list(self._frames.keys())
+
+    @property
+    def directory(self):
+        """Directory of the spill files (``None`` if not spilled)"""
+        return self._directory
+
+    def _isFrame(self, name, value):
+        if len(self._shapes.get(name, [])) > 0:
+            return True
+        return numpy.ndim(value) > 0 or isinstance(value, str)
+
+    def _addColumn(self, name, value):
+        if self._isFrame(name, value):
+            self._frames[name] = [None] * self._len
+        else:
+            array = numpy.empty(self._capacity, dtype='float64')
+            array[:self._len] = numpy.nan
+            if self._directory is not None:
+                array = self._toFile(name, array)
+            self._arrays[name] = array
+
+    def _grow(self):
+        capacity = max(self.INITIAL_CAPACITY, 2 * self._capacity)
+        for name, array in self._arrays.items():
+            shape = (capacity,) + array.shape[1:]
+            if name in self._files:
+                # extend the file and map it again (no copy)
+                file_name = self._files[name]
+                with open(file_name, "r+b") as f:
+                    f.truncate(int(numpy.prod(shape)) * array.itemsize)
+                new_array = numpy.memmap(file_name, dtype=array.dtype,
+                                         mode="r+", shape=shape)
+            else:
+                new_array = numpy.empty(shape, dtype=array.dtype)
+                new_array[:self._len] = array[:self._len]
+            self._arrays[name] = new_array
+        self._capacity = capacity
+
+    def _toFile(self, name, array):
+        file_name = os.path.join(self._directory, "%d.dat" % len(self._files))
+        file_array = numpy.memmap(file_name, dtype=array.dtype, mode="w+",
+                                  shape=array.shape)
+        file_array[:self._len] = array[:self._len]
+        self._files[name] = file_name
+        return file_array
+
+    def _spill(self):
+        self._directory = tempfile.mkdtemp(prefix="sardana_scan_data_")
+        for name, array in list(self._arrays.items()):
+            if array.dtype != object:
+                self._arrays[name] = self._toFile(name, array)
+        for name, frames in list(self._frames.items()):
+            try:
+                array = numpy.array(frames)
+            except ValueError:  # frames of different shapes
+                continue
+            # only numerical frames of a constant shape
+            if array.dtype.kind not in "biuf" or array.ndim < 2:
+                continue
+            shape = (self._capacity,) + array.shape[1:]
+            frames_array = numpy.empty(shape, dtype=array.dtype)
+            frames_array[:self._len] = array
+            self._arrays[name] = self._toFile(name, frames_array)
+            del self._frames[name]
+
+    def _setValue(self, name, value):
+        array = self._arrays[name]
+        if value is None:
+            value = numpy.nan
+        try:
+            array[self._len] = value
+        except (TypeError, ValueError):
+            if array.ndim > 1:
+                # frame which does not fit in the spilled frames
+                frames = list(array[:self._len])
+                frames.append(value)
+                self._frames[name] = frames
+                del self._arrays[name]
+                self._files.pop(name, None)
+                return
+            if array.dtype == object:
+                raise
+            # not a number e.g. a string - fall back to generic objects
+            array = array.astype(object)
+            array[self._len] = value
+            self._arrays[name] = array
+            self._files.pop(name, None)
+
+    def addRecord(self, data):
+        """Append record data (dictionary of column name and value)
+
+        :param data: record data
+        :type data: dict
+        """
+        if self._len == self._capacity:
+            self._grow()
+        for name, value in data.items():
+            if name not in self:
+                self._addColumn(name, value)
+            if name in self._frames:
+                self._frames[name].append(value)
+            else:
+                self._setValue(name, value)
+        length = self._len + 1
+        # columns missing in this record
+        for name, frames in self._frames.items():
+            if len(frames) < length:
+                frames.append(None)
+        for name in list(self._arrays.keys()):
+            if name not in data:
+                self._setValue(name, None)
+        self._len = length
+        if (self._spill_window is not None and self._directory is None
+                and length > self._spill_window):
+            self._spill()
+
+    def column(self, name):
+        """Get data of a column.
+
+        Scalar columns are returned as a view of the underlying array
+        (valid until more records are added). 1D/2D columns are returned as
+        a list of frames (or as an array if they were spilled to a file).
+
+        :param name: column name
+        :type name: str
+        :return: column data
+        :rtype: :class:`numpy.ndarray` or list
+        """
+        try:
+            return self._arrays[name][:self._len]
+        except KeyError:
+            pass
+        try:
+            return self._frames[name]
+        except KeyError:
+            pass
+        if self._len == 0 and name in self._shapes:
+            if len(self._shapes[name]) > 0:
+                return []
+            return numpy.empty(0, dtype='float64')
+        columns = dict(self._arrays)
+        columns.update(self._frames)
+        # resolve the name the same way as in the records
+        column = Record(columns)[name]
+        if isinstance(column, numpy.ndarray):
+            column = column[:self._len]
+        return column
+
+    def row(self, index):
+        """Get data of a record (the missing scalar values are NaN).
+
+        :param index: record index
+        :type index: int
+        :return: record data (dictionary of column name and value)
+        :rtype: dict
+        """
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        data = {}
+        for name, array in self._arrays.items():
+            value = array[index]
+            if array.ndim > 1:
+                # copy the frame, the spill files may be removed
+                value = numpy.array(value)
+            elif array.dtype != object:
+                value = value.item()
+                if name in self._ints and not math.isnan(value):
+                    value = int(value)
+            data[name] = value
+        for name, frames in self._frames.items():
+            data[name] = frames[index]
+        return data
+
+    def close(self):
+        """Finish spilling. The spill files are removed unless they should
+        be kept (the spilled columns remain accessible until the store is
+        released).
+
+        :return: directory with the kept files or ``None``
+        :rtype: str
+        """
+        directory = self._directory
+        if directory is None:
+            return None
+        if not self._keep:
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+        index = []
+        for name, file_name in self._files.items():
+            array = self._arrays[name]
+            array.flush()
+            index.append(dict(name=name,
+                              file=os.path.basename(file_name),
+                              dtype=array.dtype.str,
+                              shape=[self._len] + list(array.shape[1:])))
+        with open(os.path.join(directory, "index.json"), "w") as f:
+            json.dump(index, f)
+        return directory
+
+
 class RecordList(dict):
     """  A RecordList is a set of records: for example a scan.
-    It is composed of a environment and a list of records"""
+    It is composed of a environment and a list of records
+
+    If *spill_window* is given, the columns are spilled to files once the
+    number of records exceeds it (see :class:`ColumnStore`) and only the
+    last *spill_window* completed records are kept in memory (older are
+    replaced in ``records`` by :class:`SpilledRecord` which loads their data
+    from the columns)."""
 
     def __init__(self, datahandler, environ=None, apply_interpolation=False,
-                 apply_extrapolation=False, initial_data=None):
+                 apply_extrapolation=False, initial_data=None,
+                 spill_window=None, keep_spill=False):
 
         self.datahandler = datahandler
         self.apply_interpolation = apply_interpolation
         self.apply_extrapolation = apply_extrapolation
         self.initial_data = initial_data
+        self.spill_window = spill_window
+        self.keep_spill = keep_spill
         if environ is None:
             self.environ = RecordEnvironment()
         else:
             self.environ = environ
         self.records = []
+        self.columns = ColumnStore()
+        self._released = 0
         # currentIndex indicates the place in the records list
         # where the next completed record will be written
         self.currentIndex = 0
@@ -353,6 +637,9 @@ class RecordList(dict):
             self.labels.append(dataDesc.name)
         for label in self.labels:
             self.columnIndexDict[label] = 0
+        self.columns = ColumnStore(self.getEnvironValue('datadesc'),
+                                   self.spill_window, self.keep_spill)
+        self._released = 0
         ####
         self.datahandler.startRecordList(self)
 
@@ -390,8 +677,10 @@ class RecordList(dict):
         self.records.append(rc)
         self[self.recordno] = rc
         self.recordno += 1
+        self.columns.addRecord(rc.data)
         self.datahandler.addRecord(self, rc)
         self.currentIndex += 1
+        self._releaseRecords()
 
     def applyZeroOrderInterpolation(self, record):
         ''' Apply a zero order interpolation to the given record
@@ -449,7 +738,9 @@ class RecordList(dict):
         idxs = data['index']
         # TODO: think if the ScanData.addData is the best API for
         # passing value references
-        rawData = data.get('value') or data.get('value_ref')
+        rawData = data.get('value')
+        if rawData is None:
+            rawData = data.get('value_ref')
 
 
         maxIdx = max(idxs)
@@ -479,8 +770,10 @@ class RecordList(dict):
                 self[self.currentIndex] = rc
                 if self.apply_interpolation:
                     self.applyZeroOrderInterpolation(rc)
+                self.columns.addRecord(rc.data)
                 self.datahandler.addRecord(self, rc)
                 self.currentIndex += 1
+                self._releaseRecords()
 
     def isRecordCompleted(self, recordno):
         rc = self.records[recordno]
@@ -500,10 +793,46 @@ class RecordList(dict):
             self[self.currentIndex] = rc
             if self.apply_interpolation:
                 self.applyZeroOrderInterpolation(rc)
+            self.columns.addRecord(rc.data)
             self.datahandler.addRecord(self, rc)
             self.currentIndex += 1
+            self._releaseRecords()
         self.datahandler.endRecordList(self)
 
+    def column(self, name):
+        """Get data of a column of the completed records without copying
+        (see :meth:`ColumnStore.column`).
+
+        :param name: column name
+        :type name: str
+        :return: column data
+        :rtype: :class:`numpy.ndarray` or list
+        """
+        return self.columns.column(name)
+
+    def _releaseRecords(self):
+        if self.spill_window is None:
+            return
+        # keep the last completed records e.g. for the interpolation
+        last = self.currentIndex - max(self.spill_window, 1)
+        while self._released < last:
+            index = self._released
+            rc = SpilledRecord(self.columns, index,
+                               self.records[index].recordno)
+            self.records[index] = rc
+            if index in self:
+                self[index] = rc
+            self._released += 1
+
+    def close(self):
+        """Finish the record list data access. Removes the spill files
+        unless they should be kept.
+
+        :return: directory with the kept spill files or ``None``
+        :rtype: str
+        """
+        return self.columns.close()
+
     def getDataHandler(self):
         return self.datahandler
 
@@ -511,10 +840,12 @@ class RecordList(dict):
 class ScanData(RecordList):
 
     def __init__(self, environment=None, data_handler=None,
-                 apply_interpolation=False, apply_extrapolation=False):
+                 apply_interpolation=False, apply_extrapolation=False,
+                 spill_window=None, keep_spill=False):
         dh = data_handler or DataHandler()
         RecordList.__init__(self, dh, environment, apply_interpolation,
-                            apply_extrapolation)
+                            apply_extrapolation, spill_window=spill_window,
+                            keep_spill=keep_spill)
 
 
 class ScanFactory(Singleton):
@@ -531,7 +862,10 @@ class ScanFactory(Singleton):
         return DataHandler()
 
     def getScanData(self, dh, apply_interpolation=False,
-                    apply_extrapolation=False):
+                    apply_extrapolation=False, spill_window=None,
+                    keep_spill=False):
         return ScanData(data_handler=dh,
                         apply_interpolation=apply_interpolation,
-                        apply_extrapolation=apply_extrapolation)
+                        apply_extrapolation=apply_extrapolation,
+                        spill_window=spill_window,
+                        keep_spill=keep_spill)
@@ -111,3 +111,216 @@ class CTScanTestCase(unittest.TestCase):
             msg = 'Final positions do not match. (expected={0}, got={1})'.format(
                 expected["final_pos"], path.final_pos)
             self.assertEqual(path.final_pos, expected["final_pos"], msg)
+
+
+class SScanPipeliningTestCase(unittest.TestCase):
+    """Test the pipelined execution of the step scan loop using mock
+    motion and measurement group."""
+
+    def _create_scan(self, steps, pipelining=True):
+        from unittest.mock import MagicMock
+        from taurus.core.util.log import Logger
+        from sardana.macroserver.msexception import UnknownEnv
+        from sardana.macroserver.scan.gscan import SScan
+        from sardana.taurus.core.tango.sardana.pool import Ready
+
+        events = []
+
+        def getEnv(name):
+            if name == "ScanPipelining":
+                return pipelining
+            raise UnknownEnv
+
+        def startMotion(positions):
+            events.append(("start_move", positions[0]))
+            return positions[0]
+
+        def waitMotion(id):
+            events.append(("wait_move", id))
+            self._position = id
+            return Ready, [id]
+
+        def stop():
+            events.append(("stop", None))
+
+        def count_raw(post_count_cb=None):
+            events.append(("count", self._position))
+            if post_count_cb is not None:
+                post_count_cb()
+            if self._position == self._fail_read:
+                raise RuntimeError("readout failed")
+            events.append(("read", self._position))
+            return Ready, {"ch1": self._position}
+
+        def count(integ_time, post_count_cb=None):
+            return count_raw(post_count_cb)
+
+        scan = SScan.__new__(SScan)
+        macro = MagicMock()
+        macro.getEnv = getEnv
+        macro.getGeneralCondition = MagicMock(return_value=None)
+        scan._macro = lambda: macro
+        scan._motion = MagicMock()
+        scan._motion.startMotion = startMotion
+        scan._motion.waitMotion = waitMotion
+        scan._motion.stop = stop
+        scan._motion.readState = MagicMock(return_value=Ready)
+        scan._motion.readPosition = lambda: [self._position]
+        scan._measurement_group = MagicMock()
+        scan._measurement_group.count_raw = count_raw
+        scan._measurement_group.count = count
+        scan._moveables = []
+        scan._extra_columns = []
+        scan._env = {"startts": 0}
+        scan._data = MagicMock()
+        scan._steps = enumerate(steps)
+        Logger.__init__(scan, "SScan")
+        return scan, events
+
+    def setUp(self):
+        self._fail_read = None
+
+    def test_pipelined(self):
+        steps = [dict(positions=[p], integ_time=0.1) for p in range(3)]
+        scan, events = self._create_scan(steps)
+        list(scan.scan_loop())
+        expected = [("start_move", 0), ("wait_move", 0), ("count", 0),
+                    ("start_move", 1), ("read", 0),
+                    ("wait_move", 1), ("count", 1),
+                    ("start_move", 2), ("read", 1),
+                    ("wait_move", 2), ("count", 2), ("read", 2)]
+        self.assertEqual(events, expected)
+        self.assertEqual(scan.data.addRecord.call_count, 3)
+
+    def test_pipelined_with_hooks(self):
+        from unittest.mock import MagicMock
+        steps = [dict(positions=[p], integ_time=0.1) for p in range(3)]
+        hook = MagicMock()
+        steps[1]["pre-move-hooks"] = [hook]
+        scan, events = self._create_scan(steps)
+        scan._motion.move = MagicMock(side_effect=lambda pos: (
+            events.append(("move", pos[0]))
+            or setattr(self, "_position", pos[0])
+            or (scan._motion.readState(), pos)))
+        list(scan.scan_loop())
+        # motion to the point with hooks is not overlapped
+        self.assertIn(("move", 1), events)
+        self.assertEqual(events.index(("read", 0)) + 1,
+                         events.index(("move", 1)))
+        self.assertEqual(hook.call_count, 1)
+        self.assertEqual(scan.data.addRecord.call_count, 3)
+
+    def test_pipelined_readout_error(self):
+        """Test that the motion started in advance is stopped and waited
+        if the readout of the current point fails"""
+        steps = [dict(positions=[p], integ_time=0.1) for p in range(3)]
+        scan, events = self._create_scan(steps)
+        self._fail_read = 1
+        with self.assertRaises(RuntimeError):
+            list(scan.scan_loop())
+        self.assertEqual(events[-3:], [("start_move", 2), ("stop", None),
+                                       ("wait_move", 2)])
+        self.assertIsNone(scan._pending_move)
+        self.assertEqual(scan.data.addRecord.call_count, 1)
+
+
+class SScanEstimationTestCase(unittest.TestCase):
+    """Compare estimation from positions with iterating the generator."""
+
+    def _create_scan(self, steps, macro):
+        from unittest.mock import MagicMock
+        from taurus.core.util.log import Logger
+        from sardana.macroserver.scan.gscan import SScan
+        from sardana.util.motion import Motor
+
+        scan = SScan.__new__(SScan)
+        scan._macro = lambda: macro
+        scan._generator = lambda: lambda: iter(steps)
+        scan._motion = MagicMock()
+        scan._motion.readPosition = MagicMock(return_value=[0, 0])
+        motors = [Motor(min_vel=0, max_vel=10, accel_time=1, decel_time=1),
+                  Motor(min_vel=1, max_vel=5, accel_time=.5, decel_time=2)]
+        scan.get_virtual_motors = lambda: motors
+        Logger.__init__(scan, "SScan")
+        return scan
+
+    def test_estimate(self):
+        import numpy
+
+        positions = numpy.column_stack((numpy.linspace(-10, 10, 101),
+                                        numpy.linspace(3, 3.5, 101)))
+        integ_time = numpy.linspace(.1, 1, 101)
+        steps = [dict(positions=p, integ_time=t)
+                 for p, t in zip(positions, integ_time)]
+
+        class IterMacro(object):
+            pass
+
+        class PositionsMacro(object):
+
+            def getStepPositions(self):
+                return positions, integ_time
+
+        expected = self._create_scan(steps, IterMacro())._estimate()
+        estimation = self._create_scan(steps, PositionsMacro())._estimate()
+        self.assertAlmostEqual(estimation[0], expected[0], places=9)
+        self.assertEqual(estimation[1], expected[1])
+
+
+class SnapshotReaderTestCase(unittest.TestCase):
+    """Test reading of the pre-scan snapshot grouped by device."""
+
+    def setUp(self):
+        from unittest.mock import MagicMock, patch
+        from sardana.macroserver.scan.gscan import _SnapshotReader
+
+        def read_attributes_reply(attr_names, timeout):
+            data = []
+            for name in attr_names:
+                data_item = MagicMock(has_failed=False, value=len(name))
+                data.append(data_item)
+            return data
+
+        def create_proxy(dev_name):
+            if dev_name == "dead/dev/1":
+                raise Exception("device not defined")
+            proxy = MagicMock()
+            proxy.read_attributes_asynch.side_effect = lambda names: names
+            proxy.read_attributes_reply.side_effect = read_attributes_reply
+            return proxy
+
+        self.manager = MagicMock()
+        patcher = patch("PyTango.DeviceProxy", side_effect=create_proxy)
+        self.DeviceProxy = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.reader = _SnapshotReader(self.manager)
+
+    def test_read(self):
+        sources = ["a/b/c/x", "a/b/c/yy", "d/e/f/zzz", "dead/dev/1/attr"]
+        values = self.reader.read(sources, timeout=.1)
+        self.assertEqual(values["a/b/c/x"], 1)
+        self.assertEqual(values["a/b/c/yy"], 2)
+        self.assertEqual(values["d/e/f/zzz"], 3)
+        self.assertIsInstance(values["dead/dev/1/attr"], Exception)
+        # one request per device and proxies cached across reads
+        self.reader.read(sources, timeout=.1)
+        self.assertEqual(self.DeviceProxy.call_count, 4)
+        proxy = self.reader.getProxy("A/B/C")
+        self.assertEqual(proxy.read_attributes_asynch.call_count, 2)
+        # the timeout of the shared proxies is not changed, it is passed
+        # with each reply request
+        proxy.set_timeout_millis.assert_not_called()
+        for args, _ in proxy.read_attributes_reply.call_args_list:
+            self.assertLessEqual(args[1], 100)
+
+    def test_elements_info(self):
+        from sardana.sardanaevent import EventType
+
+        self.reader.getElementsInfo(self.manager)
+        self.reader.getElementsInfo(self.manager)
+        get_elements = self.manager.get_elements_with_interface
+        self.assertEqual(get_elements.call_count, 1)
+        self.reader.event_received(self.manager,
+                                   EventType("PoolElementsChanged"), None)
+        self.reader.getElementsInfo(self.manager)
+        self.assertEqual(get_elements.call_count, 2)
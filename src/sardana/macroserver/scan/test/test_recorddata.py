@@ -26,9 +26,12 @@
 import math
 import os
 import unittest
+
+import numpy
 from taurus.test import insertTest
-from sardana.macroserver.scan.scandata import ScanData
-from sardana.macroserver.scan.recorder import DataHandler
+from sardana.macroserver.scan.scandata import ScanData, SpilledRecord
+from sardana.macroserver.scan.recorder import (DataHandler, DataRecorder,
+                                               SaveModes)
 from sardana.macroserver.recorders.storage import NXscan_FileRecorder
 from sardana.macroserver.scan.test.helper import (createScanDataEnvironment,
                                                   DummyEventSource)
@@ -167,3 +170,135 @@ class ScanDataTestCase(unittest.TestCase):
 
     def tearDown(self):
         unittest.TestCase.tearDown(self)
+
+
+class ScanDataColumnsTestCase(unittest.TestCase):
+    """Verify the columnar access to the completed records."""
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        env = createScanDataEnvironment(["ch1", "ch2"])
+        self.scan_data = ScanData(environment=env,
+                                  data_handler=DataHandler())
+        self.scan_data.start()
+
+    def test_scalar_column(self):
+        nb_records = 3000
+        for i in range(nb_records):
+            self.scan_data.addRecord({"point_nb": i, "ch1": i * 2.,
+                                      "ch2": None})
+        ch1 = self.scan_data.column("ch1")
+        self.assertEqual(len(ch1), nb_records)
+        self.assertTrue(numpy.array_equal(ch1, numpy.arange(nb_records) * 2))
+        self.assertTrue(numpy.all(numpy.isnan(self.scan_data.column("ch2"))))
+        # columns are views of the same data
+        self.assertTrue(numpy.shares_memory(ch1, self.scan_data.column("ch1")))
+
+    def test_frame_column(self):
+        frames = [numpy.arange(3) + i for i in range(5)]
+        for i, frame in enumerate(frames):
+            self.scan_data.addRecord({"point_nb": i, "ch1": float(i),
+                                      "ch2": frame})
+        ch2 = self.scan_data.column("ch2")
+        self.assertEqual(len(ch2), len(frames))
+        for frame, stored in zip(frames, ch2):
+            self.assertIs(frame, stored)
+
+    def test_add_data(self):
+        self.scan_data.addData(dict(label="ch1", index=[0, 1],
+                                    value=[10., 11.]))
+        self.assertEqual(len(self.scan_data.column("point_nb")), 0)
+        self.scan_data.addData(dict(label="ch2", index=[0, 1],
+                                    value=[20., 21.]))
+        self.scan_data.end()
+        self.assertEqual(list(self.scan_data.column("ch1")), [10., 11.])
+        self.assertEqual(list(self.scan_data.column("ch2")), [20., 21.])
+
+
+@insertTest(helper_name="spill", keep=False)
+@insertTest(helper_name="spill", keep=True)
+class ScanDataSpillTestCase(unittest.TestCase):
+    """Verify spilling of the columns to the memory-mapped files."""
+
+    def spill(self, keep):
+        import json
+        import shutil
+        env = createScanDataEnvironment(["ch1", "ch2"])
+        scan_data = ScanData(environment=env, data_handler=DataHandler(),
+                             spill_window=10, keep_spill=keep)
+        scan_data.start()
+        nb_records = 3000
+        for i in range(nb_records):
+            scan_data.addRecord({"point_nb": i, "ch1": float(i),
+                                 "ch2": numpy.arange(4) + i})
+        scan_data.end()
+        directory = scan_data.columns.directory
+        self.assertTrue(os.path.isdir(directory))
+        # only the window of records is kept, the older are loaded
+        record = scan_data.records[0]
+        self.assertIsInstance(record, SpilledRecord)
+        self.assertIs(scan_data[0], record)
+        self.assertEqual(record.recordno, 0)
+        self.assertEqual(record.data["point_nb"], 0)
+        self.assertIsInstance(record.data["point_nb"], int)
+        self.assertEqual(record["ch1"], 0.)
+        self.assertTrue(numpy.array_equal(record.data["ch2"],
+                                          numpy.arange(4)))
+        self.assertNotIsInstance(scan_data.records[-1], SpilledRecord)
+        ch1 = scan_data.column("ch1")
+        ch2 = scan_data.column("ch2")
+        self.assertIsInstance(ch1, numpy.memmap)
+        self.assertTrue(numpy.array_equal(ch1, numpy.arange(nb_records)))
+        self.assertEqual(ch2.shape, (nb_records, 4))
+        self.assertTrue(numpy.array_equal(ch2[-1], numpy.arange(4) + 2999))
+        kept = scan_data.close()
+        try:
+            # columns are still accessible
+            self.assertEqual(scan_data.column("ch1")[-1], nb_records - 1)
+            if not keep:
+                self.assertIsNone(kept)
+                self.assertFalse(os.path.exists(directory))
+                return
+            self.assertEqual(kept, directory)
+            with open(os.path.join(directory, "index.json")) as f:
+                index = json.load(f)
+            for desc in index:
+                if desc["name"] != "ch2":
+                    continue
+                array = numpy.memmap(os.path.join(directory, desc["file"]),
+                                     dtype=desc["dtype"], mode="r",
+                                     shape=tuple(desc["shape"]))
+                self.assertTrue(numpy.array_equal(array, ch2))
+                break
+            else:
+                self.fail("ch2 is not in the index")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_block_recorder(self):
+        """Test that a recorder in the block mode gets all the records"""
+
+        class BlockRecorder(DataRecorder):
+
+            def __init__(self):
+                DataRecorder.__init__(self)
+                self.setSaveMode(SaveModes.Block)
+                self.data = []
+
+            def _writeRecord(self, record):
+                self.data.append((record.recordno, record.data["ch1"]))
+
+        recorder = BlockRecorder()
+        data_handler = DataHandler()
+        data_handler.addRecorder(recorder)
+        env = createScanDataEnvironment(["ch1"])
+        scan_data = ScanData(environment=env, data_handler=data_handler,
+                             spill_window=10)
+        scan_data.start()
+        nb_records = 100
+        for i in range(nb_records):
+            scan_data.addRecord({"point_nb": i, "ch1": float(i)})
+        scan_data.end()
+        scan_data.close()
+        expected = [(i, float(i)) for i in range(nb_records)]
+        self.assertEqual(recorder.data, expected)
@@ -29,7 +29,7 @@ __all__ = ["DataAccess", "SardanaValue", "Type", "Access", "Description",
            "DefaultValue", "FGet", "FSet",
            "Memorized", "MemorizedNoInit", "NotMemorized", "MaxDimSize",
            "Controller", "Readable", "Startable", "Stopable", "Loadable",
-           "Referable", "Synchronizer",
+           "Referable", "Notifiable", "Synchronizer",
            "MotorController", "CounterTimerController", "ZeroDController",
            "OneDController", "TwoDController", "TriggerGateController",
            "PseudoMotorController", "PseudoCounterController",
@@ -611,6 +611,12 @@ class Loadable(object):
     #: axis of the default timer
     default_timer = None
 
+    #: whether the load methods (PreLoadAll, PreLoadOne, LoadOne and
+    #: LoadAll) and the acquisition parameters (e.g. timer, monitor,
+    #: synchronization) are applied before every acquisition (True) or only
+    #: when they changed since the last acquisition (False)
+    load_always = False
+
     def PrepareOne(self, axis, value, repetitions, latency, nb_starts):
         """**Controller API**. Override if necessary.
         Called to prepare the master channel axis with the measurement
@@ -689,6 +695,46 @@ class Referable(object):
         raise NotImplementedError("RefOne must be defined in the controller")
 
 
+class Notifiable(object):
+    """A Notifiable interface. A controller which is able to signal when the
+    acquisition of its axes ended or when new data is available (for example
+    from a hardware interrupt or a callback of the hardware library) should
+    implement this interface. The acquisition action is then woken up
+    immediately instead of waiting for the next state query.
+
+    The notification is just a hint: the action continues to query the
+    state (with the usual sleep time as the fallback period) in order to
+    determine the end of the acquisition.
+
+    .. note: Inherit from Notifiable together with either
+        CounterTimerController, OneDController or TwoDController
+
+    .. note::
+        The Notifiable class has been included in Sardana on a provisional
+        basis. Backwards incompatible changes (up to and including removal
+        of the class) may occur if deemed necessary by the core developers.
+    """
+
+    _notifier = None
+
+    def SetNotifier(self, notifier):
+        """**Controller API**. Do not override.
+        Called by the pool to set the callable to be called on
+        :meth:`Notify`.
+
+        :param notifier: callable without arguments (None to remove it)
+        :type notifier: callable"""
+        self._notifier = notifier
+
+    def Notify(self):
+        """**Controller API**. Do not override.
+        Call it from any thread whenever the acquisition of any of the axes
+        ended or new data is available."""
+        notifier = self._notifier
+        if notifier is not None:
+            notifier()
+
+
 class Synchronizer(object):
     """A Synchronizer interface. A controller for which its axis are 'Able to
     Synchronize' should implement this interface
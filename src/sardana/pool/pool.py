@@ -34,6 +34,9 @@ __docformat__ = 'restructuredtext'
 
 import os.path
 import logging.handlers
+import traceback
+
+from collections import OrderedDict
 
 from taurus.core.tango.tangovalidator import TangoAttributeNameValidator
 from taurus.core.util.containers import CaselessDict
@@ -43,10 +46,13 @@ from sardana import InvalidId, ElementType, TYPE_ACQUIRABLE_ELEMENTS, \
 from sardana.sardanamanager import SardanaElementManager, SardanaIDManager
 from sardana.sardanamodulemanager import ModuleManager
 from sardana.sardanaevent import EventType
+from sardana.sardanadefs import State
 from sardana.pool.poolobject import PoolObject
 from sardana.pool.poolcontainer import PoolContainer
 from sardana.pool.poolcontroller import PoolController
 from sardana.pool.poolmonitor import PoolMonitor
+from sardana.pool.poolmotion import PoolMotion
+from sardana.pool.poolaction import interrupt_controllers
 from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
 from sardana.pool.poolcontrollermanager import ControllerManager
 from sardana.pool.poolmeasurementgroup import PoolMeasurementGroup
@@ -116,6 +122,16 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
 
     Default_DriftCorrection = True
 
+    #: Default strategy of starting motions involving many controllers:
+    #: "serial" (controllers are accessed one after another) or
+    #: "concurrent" (controllers are accessed concurrently and StartAll
+    #: calls are synchronized)
+    Default_MotionStartStrategy = "serial"
+
+    #: Default value representing the maximum time to wait for the
+    #: controllers to stop or abort
+    Default_InterruptTimeout = 3.0
+
     def __init__(self, full_name, name=None):
         self._path_id = None
         self._motion_loop_states_per_position = self.Default_MotionLoop_StatesPerPosition
@@ -123,6 +139,8 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
         self._acq_loop_states_per_value = self.Default_AcqLoop_StatesPerValue
         self._acq_loop_sleep_time = self.Default_AcqLoop_SleepTime
         self._drift_correction = self.Default_DriftCorrection
+        self._interrupt_timeout = self.Default_InterruptTimeout
+        self._motion_start_strategy = self.Default_MotionStartStrategy
         self._remote_log_handler = None
 
         # dict<str, dict<str, str>>
@@ -221,6 +239,31 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
                                       set_motion_loop_sleep_time,
                                       doc="motion sleep time (s)")
 
+    def set_motion_start_strategy(self, motion_start_strategy):
+        if motion_start_strategy not in ("serial", "concurrent"):
+            raise ValueError("Unknown motion start strategy: %s" %
+                             motion_start_strategy)
+        self._motion_start_strategy = motion_start_strategy
+
+    def get_motion_start_strategy(self):
+        return self._motion_start_strategy
+
+    motion_start_strategy = property(get_motion_start_strategy,
+                                     set_motion_start_strategy,
+                                     doc="strategy of starting motions "
+                                     "involving many controllers")
+
+    def set_interrupt_timeout(self, interrupt_timeout):
+        self._interrupt_timeout = interrupt_timeout
+
+    def get_interrupt_timeout(self):
+        return self._interrupt_timeout
+
+    interrupt_timeout = property(get_interrupt_timeout,
+                                 set_interrupt_timeout,
+                                 doc="maximum time to wait for the controllers"
+                                 " to stop or abort (s)")
+
     def set_motion_loop_states_per_position(self, motion_loop_states_per_position):
         self._motion_loop_states_per_position = motion_loop_states_per_position
 
@@ -618,7 +661,25 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
         return ret
 
     def stop(self):
-        msg = ""
+        """Stops all the elements. Controllers are stopped concurrently.
+
+        :return: result per controller (see
+                 :func:`~sardana.pool.poolaction.interrupt_controllers`)
+        :rtype: OrderedDict<PoolController, dict>
+        :raises Exception: some elements could not be stopped"""
+        return self._interrupt("stop")
+
+    def abort(self):
+        """Aborts all the elements. Controllers are aborted concurrently.
+
+        :return: result per controller (see
+                 :func:`~sardana.pool.poolaction.interrupt_controllers`)
+        :rtype: OrderedDict<PoolController, dict>
+        :raises Exception: some elements could not be aborted"""
+        return self._interrupt("abort")
+
+    def _interrupt(self, operation):
+        ctrl_elements = OrderedDict()
         controllers = self.get_elements_by_type(ElementType.Controller)
         for controller in controllers:
             if controller.is_pseudo():
@@ -626,42 +687,143 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
             elif ElementType.IORegister in controller.get_ctrl_types():
                 # Skip IOR since they are not stoppable
                 continue
-            error_elements = controller.stop_elements()
-            if len(error_elements) > 0:
-                element_names = ""
-                for element in error_elements:
-                    element_names += element.name + " "
-                msg += ("Controller %s -> %s\n" %
-                        (controller.name, element_names))
-                self.error("Unable to stop %s controller: "
-                           "Stop of elements %s failed" %
-                           (controller.name, element_names))
-        if msg:
-            msg_init = "Elements which could not be stopped:\n"
-            raise Exception(msg_init + msg)
-
-    def abort(self):
+            ctrl_elements[controller] = None
+        result = interrupt_controllers(ctrl_elements, operation,
+                                       self.interrupt_timeout)
         msg = ""
-        controllers = self.get_elements_by_type(ElementType.Controller)
-        for controller in controllers:
-            if controller.is_pseudo():
+        for controller, ctrl_result in list(result.items()):
+            if ctrl_result["latency"] is None:
+                msg += "Controller %s -> timeout\n" % controller.name
+                self.error("Unable to %s %s controller: timeout (%ss)",
+                           operation, controller.name, self.interrupt_timeout)
                 continue
-            elif ElementType.IORegister in controller.get_ctrl_types():
-                # Skip IOR since they are not stoppable
+            self.debug("%s of %s controller took %fs", operation.capitalize(),
+                       controller.name, ctrl_result["latency"])
+            if ctrl_result["error"] is not None:
+                msg += ("Controller %s -> %s\n" %
+                        (controller.name, ctrl_result["error"]))
+                self.error("Unable to %s %s controller: %s", operation,
+                           controller.name, ctrl_result["error"])
                 continue
-            error_elements = controller.abort_elements()
+            error_elements = ctrl_result["error_elements"]
             if len(error_elements) > 0:
                 element_names = ""
                 for element in error_elements:
                     element_names += element.name + " "
                 msg += ("Controller %s -> %s\n" %
                         (controller.name, element_names))
-                self.error("Unable to abort %s controller: "
-                           "Abort of elements %s failed" %
-                           (controller.name, element_names))
+                self.error("Unable to %s %s controller: "
+                           "%s of elements %s failed" %
+                           (operation, controller.name, operation.capitalize(),
+                            element_names))
         if msg:
-            msg_init = "Elements which could not be aborted:\n"
+            past = dict(stop="stopped", abort="aborted")[operation]
+            msg_init = "Elements which could not be %s:\n" % past
             raise Exception(msg_init + msg)
+        return result
+
+    # --------------------------------------------------------------------------
+    # Positions
+    # --------------------------------------------------------------------------
+
+    #: cache policies of :meth:`~Pool.read_positions`
+    ReadPositionsCachePolicies = "auto", "cache", "hardware"
+
+    def read_positions(self, names, cache_policy="auto"):
+        """Reads positions, dial positions and states of many moveables.
+
+        Values are read from hardware with a single request per controller
+        (controllers are accessed concurrently). The physical motors of the
+        pseudo motors are read as well.
+
+        :param names: moveable names or full names
+        :type names: seq<str>
+        :param cache_policy:
+            ``"auto"`` (default) - read from hardware unless the element is
+            in operation (same as reading the position attribute),
+            ``"cache"`` - use the cached values (hardware is read only if
+            there is no value yet), ``"hardware"`` - always read from hardware
+        :type cache_policy: str
+        :return: list of dicts with name, position, dial_position (``None``
+                 for pseudo motors), state and error (``None`` or error
+                 description) - the unknown names and the names which are
+                 not motors nor pseudo motors are reported with state
+                 ``None`` and the error
+        :rtype: list<dict>"""
+        if cache_policy not in self.ReadPositionsCachePolicies:
+            raise ValueError("Unknown cache policy: %s" % cache_policy)
+        # list<PoolElement or dict> where dict is the result of a wrong name
+        items, elements = [], []
+        for name in names:
+            try:
+                try:
+                    element = self.get_element_by_name(name)
+                except KeyError:
+                    element = self.get_element_by_full_name(name)
+                if element.get_type() not in (ElementType.Motor,
+                                              ElementType.PseudoMotor):
+                    raise TypeError("%s is not a motor nor a pseudo motor"
+                                    % element.name)
+            except (KeyError, TypeError) as e:
+                fmt_exc = traceback.format_exception_only(type(e), e)
+                items.append(dict(name=name, position=None,
+                                  dial_position=None, state=None,
+                                  error="".join(fmt_exc).strip()))
+                continue
+            items.append(element)
+            elements.append(element)
+
+        if cache_policy != "cache":
+            motors = set()
+            for element in elements:
+                if element.get_type() in TYPE_PHYSICAL_ELEMENTS:
+                    motors.add(element)
+                else:
+                    motors.update(element.get_physical_elements_set())
+            if cache_policy == "auto":
+                motors = [m for m in motors if not m.is_in_operation()]
+            self._read_motors(motors)
+            for element in elements:
+                if element.get_type() in TYPE_PSEUDO_ELEMENTS:
+                    element.put_state_info(element.read_state_info({}))
+
+        ret = []
+        for element in items:
+            if isinstance(element, dict):
+                ret.append(element)
+                continue
+            data = dict(name=element.name, position=None, dial_position=None,
+                        state=State.whatis(element.get_state(propagate=0)),
+                        error=None)
+            try:
+                position = element.get_position(propagate=0)
+                if position.in_error():
+                    exc_info = position.exc_info
+                    raise exc_info[1]
+                data["position"] = position.value
+                if element.get_type() in TYPE_PHYSICAL_ELEMENTS:
+                    data["dial_position"] = \
+                        element.get_dial_position(propagate=0).value
+            except Exception as e:
+                fmt_exc = traceback.format_exception_only(type(e), e)
+                data["error"] = "".join(fmt_exc).strip()
+            ret.append(data)
+        return ret
+
+    def _read_motors(self, motors):
+        """Reads dial positions and states of motors from hardware with
+        a single request per controller and stores them in the motors."""
+        if len(motors) == 0:
+            return
+        motion = PoolMotion(self, "Pool.ReadPositions")
+        for motor in sorted(motors, key=PoolObject.get_id):
+            motion.add_element(motor)
+        dial_positions = motion.read_dial_position()
+        state_infos = motion.read_state_info()
+        for motor, dial_position in dial_positions.items():
+            motor.put_dial_position(dial_position)
+        for motor, state_info in state_infos.items():
+            motor.put_state_info(motor._from_ctrl_state_info(state_info))
 
     # --------------------------------------------------------------------------
     # (Re)load code
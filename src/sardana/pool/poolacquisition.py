@@ -46,7 +46,8 @@ from taurus.core.util.enumeration import Enumeration
 from sardana import AttrQuality, SardanaValue, State, ElementType, \
     TYPE_TIMERABLE_ELEMENTS
 
-from sardana.sardanathreadpool import get_thread_pool
+from sardana.sardanathreadpool import get_thread_pool, \
+    get_read_thread_pool
 from sardana.pool import AcqSynch, AcqMode
 from sardana.pool.poolaction import ActionContext, PoolAction, \
     OperationContext
@@ -275,6 +276,7 @@ class AcquisitionBaseContext(OperationContext):
     def exit(self):
         pool_action = self._pool_action
         pool_action._reset_ctrl_dicts()
+        pool_action._clear_notifiers()
         return OperationContext.exit(self)
 
 
@@ -309,6 +311,8 @@ class PoolAcquisition(PoolAction):
         self._hw_acq = PoolAcquisitionHardware(main_element, name=hwname)
         self._synch = PoolSynchronization(main_element, name=synchname)
         self._handled_first_active = False
+        self._acq_items = None
+        self._acq_items_fingerprint = None
 
     def event_received(self, *args, **kwargs):
         """Callback executed on event of software synchronizer.
@@ -381,6 +385,56 @@ class PoolAcquisition(PoolAction):
                 self.debug('Stopping ZeroD acquisition.')
                 self._0d_acq.stop_action()
 
+    def _get_acq_items(self, config, acq_mode):
+        """Returns the acquisition controllers (and masters) of the
+        configuration grouped by synchronization type. They are rebuilt only
+        when the configuration or the acquisition mode changed since the
+        last call.
+        """
+        fingerprint = config.generation, acq_mode
+        if self._acq_items_fingerprint == fingerprint:
+            return self._acq_items
+        items = {}
+        # Controllers synchronized by hardware
+        acq_sync_hw = [AcqSynch.HardwareTrigger, AcqSynch.HardwareStart,
+                       AcqSynch.HardwareGate]
+        ctrls = config.get_timerable_ctrls(acq_synch=acq_sync_hw, enabled=True)
+        items["hw"] = get_timerable_ctrls(ctrls, acq_mode)
+
+        # Controllers synchronized by software Trigger and Gate
+        acq_sync_sw = [AcqSynch.SoftwareGate, AcqSynch.SoftwareTrigger]
+        ctrls = config.get_timerable_ctrls(acq_synch=acq_sync_sw, enabled=True)
+        items["sw"], items["sw_master"] = [], None
+        if len(ctrls) > 0:
+            if acq_mode is AcqMode.Timer:
+                master = config.get_master_timer_software()
+            elif acq_mode is AcqMode.Monitor:
+                master = config.get_master_monitor_software()
+            items["sw"], items["sw_master"] = \
+                get_timerable_items(ctrls, master, acq_mode)
+
+        # Controllers synchronized by software Start
+        ctrls = config.get_timerable_ctrls(acq_synch=AcqSynch.SoftwareStart,
+                                           enabled=True)
+        items["sw_start"], items["sw_start_master"] = [], None
+        if len(ctrls) > 0:
+            if acq_mode is AcqMode.Timer:
+                master = config.get_master_timer_software_start()
+            elif acq_mode is AcqMode.Monitor:
+                master = config.get_master_monitor_software_start()
+            items["sw_start"], items["sw_start_master"] = \
+                get_timerable_items(ctrls, master, acq_mode)
+
+        # 0D controllers
+        items["0d"] = get_acq_ctrls(config.get_zerod_ctrls(enabled=True))
+
+        # Synchronizer controllers
+        items["synch"] = get_acq_ctrls(config.get_synch_ctrls(enabled=True))
+
+        self._acq_items = items
+        self._acq_items_fingerprint = fingerprint
+        return items
+
     def prepare(self, config, acq_mode, value, synch_description=None,
                 moveable=None, sw_synch_initial_domain=None,
                 nb_starts=1, **kwargs):
@@ -395,52 +449,31 @@ class PoolAcquisition(PoolAction):
         self._hw_acq_args = None
         self._synch_args = None
         self._handled_first_active = False
-        ctrls_hw = []
-        ctrls_sw = []
-        ctrls_sw_start = []
+
+        items = self._get_acq_items(config, acq_mode)
+        ctrls_hw = items["hw"]
+        ctrls_sw = items["sw"]
+        ctrls_sw_start = items["sw_start"]
 
         repetitions = synch_description.repetitions
         latency = synch_description.passive_time
         # Prepare controllers synchronized by hardware
-        acq_sync_hw = [AcqSynch.HardwareTrigger, AcqSynch.HardwareStart,
-                       AcqSynch.HardwareGate]
-        ctrls = config.get_timerable_ctrls(acq_synch=acq_sync_hw, enabled=True)
-        if len(ctrls) > 0:
-            ctrls_hw = get_timerable_ctrls(ctrls, acq_mode)
+        if len(ctrls_hw) > 0:
             hw_args = (ctrls_hw, value, repetitions, latency)
             hw_kwargs = {}
             hw_kwargs.update(kwargs)
             self._hw_acq_args = ActionArgs(hw_args, hw_kwargs)
 
         # Prepare controllers synchronized by software Trigger and Gate
-        acq_sync_sw = [AcqSynch.SoftwareGate, AcqSynch.SoftwareTrigger]
-        ctrls = config.get_timerable_ctrls(acq_synch=acq_sync_sw, enabled=True)
-        if len(ctrls) > 0:
-            if acq_mode is AcqMode.Timer:
-                master = config.get_master_timer_software()
-            elif acq_mode is AcqMode.Monitor:
-                master = config.get_master_monitor_software()
-
-            ctrls_sw, master_sw = get_timerable_items(ctrls, master, acq_mode)
-
-            sw_args = (ctrls_sw, value, master_sw)
+        if len(ctrls_sw) > 0:
+            sw_args = (ctrls_sw, value, items["sw_master"])
             sw_kwargs = {'synch': True}
             sw_kwargs.update(kwargs)
             self._sw_acq_args = ActionArgs(sw_args, sw_kwargs)
 
         # Prepare controllers synchronized by software Start
-        ctrls = config.get_timerable_ctrls(acq_synch=AcqSynch.SoftwareStart,
-                                           enabled=True)
-        if len(ctrls) > 0:
-            if acq_mode is AcqMode.Timer:
-                master = config.get_master_timer_software_start()
-            elif acq_mode is AcqMode.Monitor:
-                master = config.get_master_monitor_software_start()
-
-            ctrls_sw_start, master_sw_start = get_timerable_items(ctrls,
-                                                                  master,
-                                                                  acq_mode)
-            sw_start_args = (ctrls_sw_start, value, master_sw_start,
+        if len(ctrls_sw_start) > 0:
+            sw_start_args = (ctrls_sw_start, value, items["sw_start_master"],
                              repetitions, latency)
             sw_start_kwargs = {'synch': True}
             sw_start_kwargs.update(kwargs)
@@ -448,39 +481,39 @@ class PoolAcquisition(PoolAction):
                                                  sw_start_kwargs)
 
         # Prepare 0D controllers
-        ctrls = config.get_zerod_ctrls(enabled=True)
-        if len(ctrls) > 0:
-            ctrls_acq_0d = get_acq_ctrls(ctrls)
+        ctrls_acq_0d = items["0d"]
+        if len(ctrls_acq_0d) > 0:
             zerod_args = (ctrls_acq_0d,)
             zerod_kwargs = {'synch': True}
             zerod_kwargs.update(kwargs)
             self._0d_acq_args = ActionArgs(zerod_args, zerod_kwargs)
 
         # Prepare synchronizer controllers
-        ctrls = config.get_synch_ctrls(enabled=True)
-        ctrls_synch = get_acq_ctrls(ctrls)
-        synch_args = (ctrls_synch, synch_description)
+        synch_args = (items["synch"], synch_description)
         synch_kwargs = {'moveable': moveable,
                         'sw_synch_initial_domain': sw_synch_initial_domain}
         synch_kwargs.update(kwargs)
         self._synch_args = ActionArgs(synch_args, synch_kwargs)
 
-        # Load the configuration to the timerable controllers
-        # TODO: apply the configuration only if necessary
-        # Checking only the "changed" flag is not enough, one needs to check
-        # if the controllers were not used with different measurement groups
-        # configurations meanwhile (see: sardana-org/sardana#1171) in this
-        # case the configuration must be applied even if it was not changed
-        # if config.changed:
+        # Load the configuration to the timerable controllers.
+        # The configuration is applied only if it changed since it was
+        # applied to the controller. Checking only the "changed" flag is not
+        # enough, the controllers could be used with different measurement
+        # groups configurations meanwhile (see: sardana-org/sardana#1171),
+        # so the controller keeps the fingerprint of the applied parameters
+        # and invalidates it whenever any parameter is set.
         ctrls = ctrls_hw + ctrls_sw_start + ctrls_sw
+        fingerprint = config.generation, acq_mode
 
         for ctrl in ctrls:
             pool_ctrl = ctrl.element
             if not pool_ctrl.is_online():
                 raise RuntimeError('The controller {0} is '
                                    'offline'.format(pool_ctrl.name))
-            pool_ctrl.set_ctrl_par('acquisition_mode', acq_mode)
             pool_ctrl.operator = self.main_element
+            if pool_ctrl.is_prepared("parameters", fingerprint):
+                continue
+            pool_ctrl.set_ctrl_par('acquisition_mode', acq_mode)
             pool_ctrl.set_ctrl_par('timer', ctrl.timer.axis)
             pool_ctrl.set_ctrl_par('monitor', ctrl.monitor.axis)
             synch = config.get_acq_synch_by_controller(pool_ctrl)
@@ -496,6 +529,7 @@ class PoolAcquisition(PoolAction):
                         pool_ctrl.set_axis_par(channel.axis,
                                                "value_ref_pattern",
                                                channel.value_ref_pattern)
+            pool_ctrl.set_prepared("parameters", fingerprint)
 
         config.changed = False
 
@@ -729,6 +763,9 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
         self._pool_ctrl_dict_loop = None
         self._pool_ctrl_dict_ref = None
         self._pool_ctrl_dict_value = None
+        self._notifiable = False
+        self._notified = threading.Event()
+        self._notifier_ctrls = []
 
         # TODO: for the moment we can not clear value buffers at the end of
         # the acquisition. This is because of the pseudo counters that are
@@ -797,7 +834,7 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
 
     def _raw_read_value_ref_concurrent(self, ret):
         """Internal method. Read value ref in a concurrent mode"""
-        th_pool = get_thread_pool()
+        th_pool = get_read_thread_pool()
         for pool_ctrl in self.get_read_value_ref_ctrls():
             th_pool.add(self._raw_read_ctrl_value_ref, None, ret, pool_ctrl)
         return ret
@@ -827,6 +864,23 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
             if self._is_in_action(s):
                 return True
 
+    def wait_notification(self, timeout):
+        """Waits until any of the
+        :class:`~sardana.pool.controller.Notifiable` controllers notifies
+        the end of the acquisition or new data, or until the timeout
+        elapses. Without notifiable controllers it just sleeps.
+
+        :param timeout: maximum time to wait (in seconds)
+        :type timeout: float
+        :return: True if woken by a notification or False otherwise
+        :rtype: bool"""
+        if not self._notifiable:
+            time.sleep(timeout)
+            return False
+        notified = self._notified.wait(timeout)
+        self._notified.clear()
+        return notified
+
     @DebugIt()
     def start_action(self, ctrls, value, master, repetitions, latency,
                      index, acq_sleep_time, nb_states_per_value,
@@ -884,6 +938,10 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
         def load(channel, value, repetitions, latency=0):
             axis = channel.axis
             pool_ctrl = channel.controller
+            # skip loading the same parameters again
+            fingerprint = axis, value, repetitions, latency
+            if pool_ctrl.is_prepared("load", fingerprint):
+                return
             ctrl = pool_ctrl.ctrl
             ctrl.PreLoadAll()
             res = ctrl.PreLoadOne(axis, value, repetitions, latency)
@@ -893,6 +951,7 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
                 raise Exception(msg)
             ctrl.LoadOne(axis, value, repetitions, latency)
             ctrl.LoadAll()
+            pool_ctrl.set_prepared("load", fingerprint)
 
         with ActionContext(self):
             # PreLoadAll, PreLoadOne, LoadOne and LoadAll
@@ -906,6 +965,17 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
             except Exception:
                 pass
 
+            # notifiable controllers wake up the action loop on acquisition
+            # end or new data
+            self._notified.clear()
+            self._notifiable = False
+            for ctrl in ctrls:
+                pool_ctrl = ctrl.element
+                if pool_ctrl.is_notifiable():
+                    pool_ctrl.ctrl.SetNotifier(self._notified.set)
+                    self._notifier_ctrls.append(pool_ctrl)
+                    self._notifiable = True
+
             # PreStartAll on all enabled controllers
             for ctrl in ctrls:
                 pool_ctrl = ctrl.element
@@ -1003,6 +1073,18 @@ class PoolAcquisitionTimerable(PoolAcquisitionBase):
         self._pool_ctrl_dict_value = None
         self._pool_ctrl_dict_ref = None
 
+    def _clear_notifiers(self):
+        """Removes the notifier from the notifiable controllers so they do
+        not keep a reference to this action after it finished"""
+        self._notifiable = False
+        for pool_ctrl in self._notifier_ctrls:
+            try:
+                pool_ctrl.ctrl.SetNotifier(None)
+            except Exception:
+                self.warning("Unable to remove notifier from %s",
+                             pool_ctrl.name, exc_info=1)
+        self._notifier_ctrls = []
+
     def clear_value_buffers(self):
         for channel in self._channels:
             channel.clear_value_buffer()
@@ -1046,14 +1128,15 @@ class PoolAcquisitionHardware(PoolAcquisitionTimerable):
 
         nap = self._acq_sleep_time
         nb_states_per_value = self._nb_states_per_value
+        notified = False
 
         while True:
             self.read_state_info(ret=states)
             if not self.in_acquisition(states):
                 break
 
-            # read value every n times
-            if not i % nb_states_per_value:
+            # read value every n times or when notified by the controller
+            if notified or not i % nb_states_per_value:
                 self.read_value(ret=values)
                 for acquirable, value in list(values.items()):
                     if is_value_error(value):
@@ -1066,7 +1149,7 @@ class PoolAcquisitionHardware(PoolAcquisitionTimerable):
                     else:
                         acquirable.extend_value_buffer(value)
 
-            time.sleep(nap)
+            notified = self.wait_notification(nap)
             i += 1
 
         with ActionContext(self):
@@ -1153,6 +1236,7 @@ class PoolAcquisitionSoftware(PoolAcquisitionTimerable):
 
         nap = self._acq_sleep_time
         nb_states_per_value = self._nb_states_per_value
+        notified = False
 
         i = 0
         while True:
@@ -1160,13 +1244,13 @@ class PoolAcquisitionSoftware(PoolAcquisitionTimerable):
             if not self.in_acquisition(states):
                 break
 
-            # read value every n times
-            if not i % nb_states_per_value:
+            # read value every n times or when notified by the controller
+            if notified or not i % nb_states_per_value:
                 self.read_value_loop(ret=values)
                 for acquirable, value in list(values.items()):
                     acquirable.put_value(value, quality=AttrQuality.Changing)
 
-            time.sleep(nap)
+            notified = self.wait_notification(nap)
             i += 1
 
         for slave in self._slaves:
@@ -1251,14 +1335,15 @@ class PoolAcquisitionSoftwareStart(PoolAcquisitionTimerable):
 
         nap = self._acq_sleep_time
         nb_states_per_value = self._nb_states_per_value
+        notified = False
 
         while True:
             self.read_state_info(ret=states)
             if not self.in_acquisition(states):
                 break
 
-            # read value every n times
-            if not i % nb_states_per_value:
+            # read value every n times or when notified by the controller
+            if notified or not i % nb_states_per_value:
                 self.read_value(ret=values)
                 for acquirable, value in list(values.items()):
                     if is_value_error(value):
@@ -1281,7 +1366,7 @@ class PoolAcquisitionSoftwareStart(PoolAcquisitionTimerable):
                         acquirable.put_value_ref(value)
                     else:
                         acquirable.extend_value_ref_buffer(value_ref)
-            time.sleep(nap)
+            notified = self.wait_notification(nap)
             i += 1
 
         with ActionContext(self):
@@ -1360,6 +1445,7 @@ class PoolCTAcquisition(PoolAcquisitionTimerable):
 
         nap = self._acq_sleep_time
         nb_states_per_value = self._nb_states_per_value
+        notified = False
 
         # read values to send a first event when starting to acquire
         with ActionContext(self):
@@ -1372,13 +1458,13 @@ class PoolCTAcquisition(PoolAcquisitionTimerable):
             if not self.in_acquisition(states):
                 break
 
-            # read value every n times
-            if not i % nb_states_per_value:
+            # read value every n times or when notified by the controller
+            if notified or not i % nb_states_per_value:
                 self.read_value_loop(ret=values)
                 for acquirable, value in list(values.items()):
                     acquirable.put_value(value)
 
-            time.sleep(nap)
+            notified = self.wait_notification(nap)
             i += 1
 
         for slave in self._slaves:
@@ -1410,6 +1496,10 @@ class PoolCTAcquisition(PoolAcquisitionTimerable):
 
 class Pool0DAcquisition(PoolAcquisitionBase):
 
+    #: maximum time (in seconds) the read samples are held before being
+    #: passed in one batch to the channels' accumulations
+    AccumulationFlushPeriod = 0.1
+
     def __init__(self, main_element, name="0DAcquisition"):
         PoolAcquisitionBase.__init__(self, main_element, name)
 
@@ -1469,12 +1559,24 @@ class Pool0DAcquisition(PoolAcquisitionBase):
             states[element] = None
             values[element] = None
 
+        # samples are buffered and accumulated in batches in order to
+        # vectorize the calculation of the accumulation statistics
+        samples = {}
+        flush_period = self.AccumulationFlushPeriod
+        last_flush = time.time()
         nap = self._acq_sleep_time
         while True:
             self.read_value(ret=values)
             for acquirable, value in list(values.items()):
-                acquirable.put_current_value(value, propagate=0)
-            if self._stopped or self._aborted:
+                samples.setdefault(acquirable, []).append(value)
+            finished = self._stopped or self._aborted
+            now = time.time()
+            if finished or now - last_flush >= flush_period:
+                for acquirable, batch in list(samples.items()):
+                    acquirable.put_current_values(batch, propagate=0)
+                    del batch[:]
+                last_flush = now
+            if finished:
                 break
             time.sleep(nap)
 
@@ -27,11 +27,12 @@
 abstract action over a set of pool elements"""
 
 __all__ = ["PoolActionItem", "OperationInfo", "ActionContext", "PoolAction",
-           "get_thread_pool"]
+           "get_thread_pool", "interrupt_controllers"]
 
 __docformat__ = 'restructuredtext'
 
 import sys
+import time
 import weakref
 import traceback
 import threading
@@ -41,8 +42,77 @@ from collections import OrderedDict
 from taurus.core.util.log import Logger
 
 from sardana import State
-from sardana.sardanathreadpool import get_thread_pool
+from sardana.sardanathreadpool import get_thread_pool, \
+    get_read_thread_pool
 from sardana.pool.poolobject import PoolObject
+from sardana.pool.poollock import profile_action
+from sardana.pool.pooltelemetry import get_telemetry, LOCK, LOOP, QUEUE
+
+
+_INTERRUPT_METHODS = {
+    "stop": "stop_elements",
+    "abort": "abort_elements",
+    "emergency_break": "emergency_break"
+}
+
+
+def interrupt_controllers(ctrl_elements, operation="stop", timeout=None):
+    """Stops, aborts or emergency breaks elements of many controllers
+    concurrently - each controller is accessed in its own thread, so the
+    time to interrupt all of them is given by the slowest controller.
+
+    :param ctrl_elements: elements to interrupt per controller (None means
+                          all elements of the controller)
+    :type ctrl_elements: dict<PoolController, seq<PoolElement> or None>
+    :param operation: "stop", "abort" or "emergency_break"
+    :type operation: str
+    :param timeout: maximum time (in seconds) to wait for the controllers
+                    (None means wait until all of them finish)
+    :type timeout: float or None
+    :return: result per controller - dict with *latency* (seconds or None if
+             the controller did not finish within the timeout),
+             *error_elements* (elements which could not be interrupted) and
+             *error* (None or description of the controller error)
+    :rtype: OrderedDict<PoolController, dict>"""
+    method_name = _INTERRUPT_METHODS[operation]
+    start = time.time()
+
+    def interrupt(pool_ctrl, elements, ctrl_result):
+        try:
+            method = getattr(pool_ctrl, method_name)
+            ctrl_result["error_elements"] = method(elements)
+        except Exception:
+            pool_ctrl.debug("Details:", exc_info=1)
+            exc_info = sys.exc_info()
+            fmt_exc = traceback.format_exception_only(*exc_info[:2])
+            ctrl_result["error"] = "".join(fmt_exc).strip()
+            ctrl_result["error_elements"] = list(elements or ())
+        ctrl_result["latency"] = time.time() - start
+
+    result = OrderedDict()
+    threads = []
+    for pool_ctrl, elements in list(ctrl_elements.items()):
+        ctrl_result = result[pool_ctrl] = dict(latency=None,
+                                               error_elements=[],
+                                               error=None)
+        if len(ctrl_elements) == 1 and timeout is None:
+            # no need to pay the thread start for a single controller
+            interrupt(pool_ctrl, elements, ctrl_result)
+            break
+        name = "%s.%s" % (pool_ctrl.name, operation)
+        thread = threading.Thread(name=name, target=interrupt,
+                                  args=(pool_ctrl, elements, ctrl_result))
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        if timeout is None:
+            thread.join()
+        else:
+            thread.join(max(0, start + timeout - time.time()))
+    # do not let late controllers change the result any more
+    return OrderedDict((pool_ctrl, dict(ctrl_result))
+                       for pool_ctrl, ctrl_result in result.items())
 
 
 class PoolActionItem(object):
@@ -115,11 +185,14 @@ class BaseOperationContext(object):
     def enter(self):
         """Enters operation context"""
         pool_action = self._pool_action
-        for element in pool_action.get_elements():
-            element.lock()
-            element.set_operation(pool_action)
-        for ctrl in pool_action.get_pool_controller_list():
-            ctrl.lock()
+        start = time.perf_counter()
+        with profile_action(pool_action.log_name):
+            for element in pool_action.get_elements():
+                element.lock()
+                element.set_operation(pool_action)
+            for ctrl in pool_action.get_pool_controller_list():
+                ctrl.lock()
+        pool_action._record_lock_time(start)
 
     def exit(self):
         """Leaves operation context"""
@@ -170,10 +243,13 @@ class ActionContext(object):
     def enter(self):
         """Enters operation"""
         pool_action = self._pool_action
-        for element in pool_action.get_elements():
-            element.lock()
-        for ctrl in pool_action.get_pool_controller_list():
-            ctrl.lock()
+        start = time.perf_counter()
+        with profile_action(pool_action.log_name):
+            for element in pool_action.get_elements():
+                element.lock()
+            for ctrl in pool_action.get_pool_controller_list():
+                ctrl.lock()
+        pool_action._record_lock_time(start)
 
     def exit(self):
         """Leaves operation"""
@@ -211,6 +287,9 @@ class PoolAction(Logger):
         self._running = False
         self._state_info = OperationInfo()
         self._value_info = OperationInfo()
+        self._telemetry = get_telemetry()
+        self._telemetry_histograms = {}
+        self._iteration_start = None
 
     def get_main_element(self):
         """Returns the main element for this action
@@ -341,7 +420,7 @@ class PoolAction(Logger):
                 with self.OperationContextClass(self) as context:
                     self.start_action(*args, **kwargs)
                     self._started = False
-                    self.action_loop()
+                    self._run_action_loop()
             finally:
                 self._started = False
                 self._running = False
@@ -357,7 +436,9 @@ class PoolAction(Logger):
             finally:
                 self._started = False
             cb = kwargs.pop("cb", None)
-            get_thread_pool().add(self._asynch_action_loop, cb, context)
+            th_pool = get_thread_pool()
+            self._telemetry.add(QUEUE, th_pool.log_name, th_pool.qsize)
+            th_pool.add(self._asynch_action_loop, cb, context)
 
     def start_action(self, *args, **kwargs):
         """Start procedure for this action. Default implementation raises
@@ -407,22 +488,34 @@ class PoolAction(Logger):
                     hooks.pop(hook)
 
     def stop_action(self, *args, **kwargs):
-        """Stop procedure for this action."""
+        """Stop procedure for this action. Controllers are stopped
+        concurrently.
+
+        :return: result per controller (see :func:`interrupt_controllers`)
+        :rtype: OrderedDict<PoolController, dict>"""
         self._stopped = True
-        for pool_ctrl, elements in list(self._pool_ctrl_dict.items()):
-            pool_ctrl.stop_elements(elements)
+        return interrupt_controllers(self._pool_ctrl_dict, "stop",
+                                     self.pool.interrupt_timeout)
 
     def abort_action(self, *args, **kwargs):
-        """Aborts procedure for this action"""
+        """Aborts procedure for this action. Controllers are aborted
+        concurrently.
+
+        :return: result per controller (see :func:`interrupt_controllers`)
+        :rtype: OrderedDict<PoolController, dict>"""
         self._aborted = True
-        for pool_ctrl, elements in list(self._pool_ctrl_dict.items()):
-            pool_ctrl.abort_elements(elements)
+        return interrupt_controllers(self._pool_ctrl_dict, "abort",
+                                     self.pool.interrupt_timeout)
 
     def emergency_break(self):
-        """Tries to execute a stop. If it fails try an abort"""
+        """Tries to execute a stop. If it fails try an abort. Controllers are
+        accessed concurrently.
+
+        :return: result per controller (see :func:`interrupt_controllers`)
+        :rtype: OrderedDict<PoolController, dict>"""
         self._stopped = True
-        for pool_ctrl, elements in list(self._pool_ctrl_dict.items()):
-            pool_ctrl.emergency_break(elements)
+        return interrupt_controllers(self._pool_ctrl_dict, "emergency_break",
+                                     self.pool.interrupt_timeout)
 
     def was_stopped(self):
         """Determines if the action has been stopped from outside
@@ -450,11 +543,46 @@ class PoolAction(Logger):
     def _asynch_action_loop(self, context):
         """Internal method. Asynchronous action loop"""
         try:
-            self.action_loop()
+            self._run_action_loop()
         finally:
             context.exit()
             self._running = False
 
+    def _get_telemetry_histogram(self, category, name=None):
+        """Internal method. Returns the telemetry histogram of this action"""
+        histogram = self._telemetry_histograms.get((category, name))
+        if histogram is None:
+            key = self.log_name
+            if name is not None:
+                key = "{0}.{1}".format(key, name)
+            histogram = self._telemetry.get_histogram(category, key)
+            self._telemetry_histograms[(category, name)] = histogram
+        return histogram
+
+    def _record_time(self, name, start):
+        """Internal method. Records the time elapsed since start in the
+        loop telemetry of this action"""
+        histogram = self._get_telemetry_histogram(LOOP, name)
+        self._telemetry.add_histogram_time(histogram,
+                                           time.perf_counter() - start)
+
+    def _record_lock_time(self, start):
+        """Internal method. Records the time elapsed since start in the
+        lock telemetry of this action"""
+        histogram = self._get_telemetry_histogram(LOCK)
+        self._telemetry.add_histogram_time(histogram,
+                                           time.perf_counter() - start)
+
+    def _run_action_loop(self):
+        """Internal method. Runs the action loop recording its duration and
+        the duration of its iterations (one state reading per iteration)"""
+        start = self._iteration_start = time.perf_counter()
+        try:
+            self.action_loop()
+        finally:
+            self._iteration_start = None
+            self._record_time("action_loop", start)
+
     def action_loop(self):
         """Action loop for this action. Default implementation raises
         NotImplementedError
@@ -475,8 +603,16 @@ class PoolAction(Logger):
         :type serial: bool
         :return: a map containing state information per element
         :rtype: dict<sardana.pool.poolelement.PoolElement, stateinfo>"""
-        with ActionContext(self):
-            return self.raw_read_state_info(ret=ret, serial=serial)
+        start = time.perf_counter()
+        iteration_start = self._iteration_start
+        if iteration_start is not None:
+            self._iteration_start = start
+            self._record_time("iteration", iteration_start)
+        try:
+            with ActionContext(self):
+                return self.raw_read_state_info(ret=ret, serial=serial)
+        finally:
+            self._record_time("read_state_info", start)
 
     def raw_read_state_info(self, ret=None, serial=False):
         """**Unsafe**. Reads state information of all elements involved in this
@@ -512,7 +648,7 @@ class PoolAction(Logger):
 
     def _raw_read_state_info_concurrent(self, ret):
         """Internal method. Read state in a concurrent mode"""
-        th_pool = get_thread_pool()
+        th_pool = get_read_thread_pool()
         for pool_ctrl in self._pool_ctrl_dict:
             th_pool.add(self._raw_read_ctrl_state_info, None, ret, pool_ctrl)
         return ret
@@ -570,8 +706,12 @@ class PoolAction(Logger):
         :return: a map containing value information per element
         :rtype: dict<:class:~`sardana.pool.poolelement.PoolElement`,
                      (value object, Exception or None)>"""
-        with ActionContext(self):
-            return self.raw_read_value(ret=ret, serial=serial)
+        start = time.perf_counter()
+        try:
+            with ActionContext(self):
+                return self.raw_read_value(ret=ret, serial=serial)
+        finally:
+            self._record_time("read_value", start)
 
     def raw_read_value(self, ret=None, serial=False):
         """**Unsafe**. Reads value information of all elements involved in this
@@ -611,7 +751,7 @@ class PoolAction(Logger):
 
     def _raw_read_value_concurrent(self, ret):
         """Internal method. Read value in a concurrent mode"""
-        th_pool = get_thread_pool()
+        th_pool = get_read_thread_pool()
         for pool_ctrl in self.get_read_value_ctrls():
             th_pool.add(self._raw_read_ctrl_value, None, ret, pool_ctrl)
         return ret
@@ -642,8 +782,12 @@ class PoolAction(Logger):
         :return: a map containing value information per element
         :rtype: dict<:class:~`sardana.pool.poolelement.PoolElement`,
                      (value object, Exception or None)>"""
-        with ActionContext(self):
-            return self.raw_read_value_loop(ret=ret, serial=serial)
+        start = time.perf_counter()
+        try:
+            with ActionContext(self):
+                return self.raw_read_value_loop(ret=ret, serial=serial)
+        finally:
+            self._record_time("read_value_loop", start)
 
     def raw_read_value_loop(self, ret=None, serial=False):
         """**Unsafe**. Reads value information of all elements involved in this
@@ -683,7 +827,7 @@ class PoolAction(Logger):
 
     def _raw_read_value_concurrent_loop(self, ret):
         """Internal method. Read value in a concurrent mode"""
-        th_pool = get_thread_pool()
+        th_pool = get_read_thread_pool()
         for pool_ctrl in self.get_read_value_loop_ctrls():
             th_pool.add(self._raw_read_ctrl_value, None, ret, pool_ctrl)
         return ret
@@ -31,13 +31,12 @@ __all__ = ["PoolBaseElement"]
 __docformat__ = 'restructuredtext'
 
 import weakref
-import threading
 
-from taurus.core.util.lock import TaurusLock
 
 from sardana import State
 from sardana.sardanaevent import EventType
 from sardana.pool.poolobject import PoolObject
+from sardana.pool.poollock import create_lock
 
 
 class PoolBaseElement(PoolObject):
@@ -58,10 +57,8 @@ class PoolBaseElement(PoolObject):
         self._aborted = False
         self._stopped = False
 
-        lock_name = kwargs['name'] + "Lock"
-
         # A lock for high level operations: monitoring, motion or acquisition
-        self._lock = TaurusLock(name=lock_name, lock=threading.RLock())
+        self._lock = create_lock(kwargs['name'])
 
         # The operation context in which the element is involved
         self._operation = None
@@ -72,10 +69,10 @@ class PoolBaseElement(PoolObject):
         super(PoolBaseElement, self).__init__(**kwargs)
 
     def __enter__(self):
-        self.lock()
+        self._lock.acquire()
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.unlock()
+        self._lock.release()
         return False
 
     def lock(self, blocking=True):
@@ -84,12 +81,10 @@ class PoolBaseElement(PoolObject):
         :param blocking:
             whether or not to block if lock is already acquired [default: True]
         :type blocking: bool"""
-        ret = self._lock.acquire(blocking)
-        return ret
+        return self._lock.acquire(blocking)
 
     def unlock(self):
-        ret = self._lock.release()
-        return ret
+        return self._lock.release()
 
     def get_action_cache(self):
         """Returns the internal action cache object"""
@@ -35,6 +35,7 @@ from taurus.core.tango.tangovalidator import TangoAttributeNameValidator
 from sardana import State, ElementType, TYPE_PHYSICAL_ELEMENTS
 from sardana.pool.poolexternal import PoolExternalObject
 from sardana.pool.poolcontainer import PoolContainer
+from sardana.pool.poolaction import interrupt_controllers
 
 
 class PoolBaseGroup(PoolContainer):
@@ -353,54 +354,49 @@ class PoolBaseGroup(PoolContainer):
     # --------------------------------------------------------------------------
 
     def stop(self):
-        msg = ""
-        for ctrl, elements in list(self.get_physical_elements().items()):
-            self.debug("Stopping %s %s", ctrl.name,
-                       [e.name for e in elements])
-            try:
-                error_elements = ctrl.stop_elements(elements=elements)
-                if len(error_elements) > 0:
-                    element_names = [elem.name for elem in error_elements]
-                    msg += ("Controller %s -> %s\n" %
-                            (ctrl.name, element_names))
-                    self.error("Unable to stop %s controller: "
-                               "Stop of elements %s failed" %
-                               (ctrl.name, element_names))
-            except Exception:
-                self.error("Unable to stop controller %s", ctrl.name)
-                self.debug("Details:", exc_info=1)
-        if msg:
-            msg_init = "Elements which could not be stopped:\n"
-            # TODO: think about a more specific type of exception
-            raise Exception(msg_init + msg)
+        return self._interrupt("stop")
 
     # --------------------------------------------------------------------------
     # abort
     # --------------------------------------------------------------------------
 
     def abort(self):
-        msg = ""
-        for ctrl, elements in list(self.get_physical_elements().items()):
-            self.debug("Aborting %s %s", ctrl.name,
+        return self._interrupt("abort")
+
+    def _interrupt(self, operation):
+        """Stops or aborts the physical elements. Controllers are accessed
+        concurrently."""
+        ctrl_elements = self.get_physical_elements()
+        for ctrl, elements in list(ctrl_elements.items()):
+            self.debug("%s %s %s", operation.capitalize(), ctrl.name,
                        [e.name for e in elements])
-            try:
-                error_elements = ctrl.abort_elements(elements=elements)
-                # TODO: report elements that could not be aborted by their
-                # names
-                if len(error_elements) > 0:
-                    element_names = [elem.name for elem in error_elements]
-                    msg += ("Controller %s -> %s\n" %
-                            (ctrl.name, element_names))
-                    self.error("Unable to abort %s controller: "
-                               "Abort of axes %s failed" %
-                               (ctrl.name, element_names))
-            except Exception:
-                self.error("Unable to abort controller %s", ctrl.name)
-                self.debug("Details:", exc_info=1)
+        result = interrupt_controllers(ctrl_elements, operation,
+                                       self._get_pool().interrupt_timeout)
+        msg = ""
+        for ctrl, ctrl_result in list(result.items()):
+            if ctrl_result["latency"] is None:
+                self.error("Unable to %s controller %s: timeout", operation,
+                           ctrl.name)
+                continue
+            if ctrl_result["error"] is not None:
+                self.error("Unable to %s controller %s: %s", operation,
+                           ctrl.name, ctrl_result["error"])
+                continue
+            error_elements = ctrl_result["error_elements"]
+            if len(error_elements) > 0:
+                element_names = [elem.name for elem in error_elements]
+                msg += ("Controller %s -> %s\n" %
+                        (ctrl.name, element_names))
+                self.error("Unable to %s %s controller: "
+                           "%s of elements %s failed" %
+                           (operation, ctrl.name, operation.capitalize(),
+                            element_names))
         if msg:
-            msg_init = "Elements which could not be aborted:\n"
+            past = dict(stop="stopped", abort="aborted")[operation]
+            msg_init = "Elements which could not be %s:\n" % past
             # TODO: think about a more specific type of exception
             raise Exception(msg_init + msg)
+        return result
 
     # --------------------------------------------------------------------------
     # involved in an operation
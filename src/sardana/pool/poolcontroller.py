@@ -47,8 +47,9 @@ from sardana.sardanautils import is_non_str_seq, is_number
 
 from sardana.pool.poolextension import translate_ctrl_value
 from sardana.pool.poolbaseelement import PoolBaseElement
-from sardana.pool.controller import Referable, Access, DataAccess,\
-    Description, Type
+from sardana.pool.pooltelemetry import instrument_controller
+from sardana.pool.controller import Referable, Notifiable, Access, \
+    DataAccess, Description, Type
 
 
 class PoolBaseController(PoolBaseElement):
@@ -64,6 +65,7 @@ class PoolBaseController(PoolBaseElement):
         self._element_names = CaselessDict()
         self._pending_element_names = CaselessDict()
         self._operator = None
+        self._prepared = {}
         kwargs['elem_type'] = ElementType.Controller
         super(PoolBaseController, self).__init__(**kwargs)
 
@@ -340,12 +342,14 @@ class PoolController(PoolBaseController):
         return ctrl
 
     def _init(self):
+        self.invalidate_prepared()
         if self._ctrl_info is None:
             if self._lib_info is not None:
                 self._ctrl_error = self._lib_info.get_error()
             return
         try:
             self._ctrl = self._create_controller()
+            instrument_controller(self.name, self._ctrl)
         except:
             self._ctrl = None
             self._ctrl_error = sys.exc_info()
@@ -405,6 +409,9 @@ class PoolController(PoolBaseController):
     def is_referable(self):
         return isinstance(self.ctrl, Referable)
 
+    def is_notifiable(self):
+        return isinstance(self.ctrl, Notifiable)
+
     def is_pseudo(self):
         for t in self._ctrl_info.types:
             if t in TYPE_PSEUDO_ELEMENTS:
@@ -418,6 +425,7 @@ class PoolController(PoolBaseController):
         return self._ctrl
 
     def set_ctrl(self, ctrl):
+        self.invalidate_prepared()
         self._ctrl = ctrl
 
     ctrl = property(fget=get_ctrl, fset=set_ctrl,
@@ -444,6 +452,40 @@ class PoolController(PoolBaseController):
     operator = property(fget=get_operator, fset=set_operator,
                         doc="current controller operator")
 
+    def is_prepared(self, stage, fingerprint):
+        """Checks if the given preparation *stage* (e.g. acquisition
+        parameters or load) was already applied to the controller with the
+        parameters identified by *fingerprint* and it was not invalidated
+        meanwhile. Controllers with the ``load_always`` class attribute set
+        to True are never considered prepared.
+
+        :param stage: preparation stage name
+        :type stage: :obj:`str`
+        :param fingerprint: parameters fingerprint (comparable object)
+        :type fingerprint: object
+        :return: True if prepared or False otherwise
+        :rtype: :obj:`bool`"""
+        if getattr(self.ctrl, "load_always", True):
+            return False
+        return stage in self._prepared and \
+            self._prepared[stage] == fingerprint
+
+    def set_prepared(self, stage, fingerprint):
+        """Marks the given preparation *stage* as applied with the
+        parameters identified by *fingerprint*.
+
+        :param stage: preparation stage name
+        :type stage: :obj:`str`
+        :param fingerprint: parameters fingerprint (comparable object)
+        :type fingerprint: object"""
+        self._prepared[stage] = fingerprint
+
+    def invalidate_prepared(self):
+        """Invalidates all the preparation stages so the next acquisition
+        applies again all the parameters. Called whenever the controller
+        parameters or attributes are changed."""
+        self._prepared.clear()
+
     # START API WHICH ACCESSES CONTROLLER API --------------------------------
 
     @check_ctrl
@@ -494,6 +536,7 @@ class PoolController(PoolBaseController):
 
     @check_ctrl
     def set_ctrl_attr(self, name, value):
+        self.invalidate_prepared()
         ctrl_info = self.ctrl_info
         attr_info = ctrl_info.ctrl_attributes[name]
         if hasattr(self.ctrl, attr_info.fset):
@@ -513,6 +556,7 @@ class PoolController(PoolBaseController):
 
     @check_ctrl
     def set_axis_attr(self, axis, name, value):
+        self.invalidate_prepared()
         ctrl_info = self.ctrl_info
         axis_attr_info = ctrl_info.axis_attributes[name]
         try:
@@ -522,6 +566,7 @@ class PoolController(PoolBaseController):
 
     @check_ctrl
     def set_ctrl_par(self, name, value):
+        self.invalidate_prepared()
         return self.ctrl.SetCtrlPar(name, value)
 
     @check_ctrl
@@ -530,6 +575,7 @@ class PoolController(PoolBaseController):
 
     @check_ctrl
     def set_axis_par(self, axis, name, value):
+        self.invalidate_prepared()
         return self.ctrl.SetAxisPar(axis, name, value)
 
     @check_ctrl
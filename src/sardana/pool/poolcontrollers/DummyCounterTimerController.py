@@ -23,10 +23,12 @@
 
 import time
 import copy
+import threading
 
 from sardana import State
 from sardana.pool import AcqSynch
-from sardana.pool.controller import CounterTimerController, Type, Description
+from sardana.pool.controller import CounterTimerController, Notifiable, \
+    Type, Description
 
 
 class Channel(object):
@@ -39,7 +41,7 @@ class Channel(object):
         self.buffer_values = []
 
 
-class DummyCounterTimerController(CounterTimerController):
+class DummyCounterTimerController(CounterTimerController, Notifiable):
     """This class is the Tango Sardana CounterTimer controller for tests"""
 
     gender = "Simulation"
@@ -79,6 +81,8 @@ class DummyCounterTimerController(CounterTimerController):
         self.__synchronizer_obj = None
         # flag whether the controller was armed for hardware synchronization
         self._armed = False
+        # timer notifying the end of the acquisition
+        self._notify_timer = None
 
     def AddDevice(self, axis):
         idx = axis - 1
@@ -130,6 +134,26 @@ class DummyCounterTimerController(CounterTimerController):
             self._armed = True
         else:
             self.start_time = time.time()
+            self._schedule_notify()
+
+    def _schedule_notify(self):
+        """Notify the end of the acquisition in time (only when counting in
+        time, counting to monitor end is only detected by state queries)"""
+        self._cancel_notify()
+        if self.integ_time is None:
+            return
+        if self._synchronization == AcqSynch.SoftwareTrigger:
+            duration = self.integ_time
+        else:
+            duration = self.estimated_duration
+        self._notify_timer = threading.Timer(duration, self.Notify)
+        self._notify_timer.daemon = True
+        self._notify_timer.start()
+
+    def _cancel_notify(self):
+        if self._notify_timer is not None:
+            self._notify_timer.cancel()
+            self._notify_timer = None
 
     def StateOne(self, axis):
         self._log.debug('StateOne(%d): entering...' % axis)
@@ -268,6 +292,7 @@ class DummyCounterTimerController(CounterTimerController):
     def AbortOne(self, axis):
         if axis not in self.counting_channels:
             return
+        self._cancel_notify()
         now = time.time()
         if self.start_time is not None:
             elapsed_time = now - self.start_time
@@ -348,3 +373,4 @@ class DummyCounterTimerController(CounterTimerController):
             for axis, channel in self.counting_channels.items():
                 channel.is_counting = True
             self.start_time = time.time()
+            self._schedule_notify()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import time
+import threading
+import unittest
+
+from sardana import State
+from sardana.pool.poolcontrollers.DummyCounterTimerController import \
+    DummyCounterTimerController
+
+
+class DummyCounterTimerNotifyTestCase(unittest.TestCase):
+    """Test of the acquisition end notification of the
+    DummyCounterTimerController.
+    """
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.ctrl = DummyCounterTimerController("ctrl", {})
+        self.ctrl.AddDevice(1)
+        self.notified = threading.Event()
+        self.ctrl.SetNotifier(self.notified.set)
+
+    def start(self, integ_time):
+        ctrl = self.ctrl
+        ctrl.LoadOne(1, integ_time, 1, 0)
+        ctrl.PreStartAll()
+        ctrl.PreStartOne(1, integ_time)
+        ctrl.StartOne(1, integ_time)
+        ctrl.StartAll()
+
+    def test_notify(self):
+        start = time.time()
+        self.start(0.05)
+        self.assertTrue(self.notified.wait(1))
+        self.assertGreaterEqual(time.time() - start, 0.05)
+        self.assertEqual(self.ctrl.StateOne(1)[0], State.On)
+
+    def test_abort(self):
+        self.start(0.05)
+        self.ctrl.AbortOne(1)
+        self.assertFalse(self.notified.wait(0.2))
+
+    def tearDown(self):
+        self.ctrl.AbortOne(1)
+        unittest.TestCase.tearDown(self)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains the locks of the pool elements and the lock
+contention profiler used in the debug lock mode"""
+
+__all__ = ["LockProfiler", "ProfiledLock", "create_lock",
+           "get_lock_profiler", "profile_action"]
+
+__docformat__ = 'restructuredtext'
+
+import time
+import threading
+
+from taurus.core.util.lock import TaurusLock
+
+from sardana import sardanacustomsettings
+
+#: bare re-entrant locks (default)
+PRODUCTION = "production"
+#: debug locks recording the lock contention in the :class:`LockProfiler`
+DEBUG = "debug"
+
+_LOCK_PROFILER = None
+
+
+class LockProfiler(object):
+    """Records the time spent waiting for the element locks per element
+    and per action (the one acquiring the lock)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # dict<tuple<str, str>, list<int, int, float, float>>
+        # where key is the element and the action names and value is the
+        # number of acquisitions, number of contended acquisitions, total
+        # and maximum wait time
+        self._stats = {}
+
+    def get_action(self):
+        """Returns the name of the action acquiring locks in the current
+        thread or None if the locks are acquired outside of an action"""
+        return getattr(self._local, "action", None)
+
+    def set_action(self, action):
+        """Sets the name of the action acquiring locks in the current
+        thread
+
+        :param action: action name or None
+        :type action: :obj:`str`"""
+        self._local.action = action
+
+    def record(self, element, wait_time, contended):
+        """Records an acquisition of the element lock
+
+        :param element: element name
+        :type element: :obj:`str`
+        :param wait_time: time spent waiting for the lock [s]
+        :type wait_time: :obj:`float`
+        :param contended: whether the lock was held by another thread
+        :type contended: :obj:`bool`"""
+        key = element, self.get_action()
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = stats = [0, 0, 0.0, 0.0]
+            stats[0] += 1
+            if contended:
+                stats[1] += 1
+                stats[2] += wait_time
+                stats[3] = max(stats[3], wait_time)
+
+    def reset(self):
+        """Clears the recorded statistics"""
+        with self._lock:
+            self._stats.clear()
+
+    def get_stats(self, by=None):
+        """Returns the recorded statistics
+
+        :param by: group by "element", "action" or None (element and action)
+        :type by: :obj:`str`
+        :return: dictionary where key is the element name, the action name
+            or a tuple of both and value is a dictionary with: count,
+            contended, wait (total) and max_wait
+        :rtype: :obj:`dict`"""
+        index = {"element": 0, "action": 1, None: None}[by]
+        ret = {}
+        with self._lock:
+            items = [(key, list(stats)) for key, stats in self._stats.items()]
+        for key, (count, contended, wait, max_wait) in items:
+            if index is not None:
+                key = key[index]
+            data = ret.get(key)
+            if data is None:
+                ret[key] = data = dict(count=0, contended=0, wait=0.0,
+                                       max_wait=0.0)
+            data["count"] += count
+            data["contended"] += contended
+            data["wait"] += wait
+            data["max_wait"] = max(data["max_wait"], max_wait)
+        return ret
+
+    def report(self, by="element"):
+        """Returns a table of the statistics sorted by the total wait time
+
+        :param by: group by "element" or "action"
+        :type by: :obj:`str`
+        :return: report
+        :rtype: :obj:`str`"""
+        stats = self.get_stats(by)
+        lines = ["{:<32} {:>10} {:>10} {:>12} {:>12}".format(
+            by, "count", "contended", "wait [ms]", "max [ms]")]
+        for key, data in sorted(stats.items(), key=lambda x: -x[1]["wait"]):
+            lines.append("{:<32} {:>10} {:>10} {:>12.3f} {:>12.3f}".format(
+                str(key), data["count"], data["contended"],
+                data["wait"] * 1E3, data["max_wait"] * 1E3))
+        return "\n".join(lines)
+
+
+class ProfiledLock(object):
+    """Re-entrant lock reporting its contention to a :class:`LockProfiler`.
+    The underlying lock is a :func:`~taurus.core.util.lock.TaurusLock`
+    so the taurus lock debugging remains available."""
+
+    def __init__(self, name, profiler):
+        self._name = name
+        self._profiler = profiler
+        self._lock = TaurusLock(name=name + "Lock", lock=threading.RLock())
+
+    def __repr__(self):
+        return "<ProfiledLock {}>".format(self._name)
+
+    def acquire(self, blocking=True):
+        if self._lock.acquire(False):
+            self._profiler.record(self._name, 0.0, False)
+            return True
+        if not blocking:
+            self._profiler.record(self._name, 0.0, True)
+            return False
+        start = time.perf_counter()
+        ret = self._lock.acquire(True)
+        self._profiler.record(self._name, time.perf_counter() - start, True)
+        return ret
+
+    def release(self):
+        self._lock.release()
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+
+def get_lock_profiler():
+    """Returns the lock profiler or None if the locks are not profiled
+    (production lock mode)
+
+    :return: lock profiler
+    :rtype: :class:`LockProfiler` or None"""
+    return _LOCK_PROFILER
+
+
+def create_lock(name):
+    """Creates the lock of a pool element according to the POOL_LOCK_MODE
+    sardana custom setting:
+
+    - "production" - bare :class:`threading.RLock`
+    - "debug" - :class:`ProfiledLock` recording the contention in the
+      lock profiler
+
+    :param name: element name
+    :type name: :obj:`str`
+    :return: re-entrant lock
+    """
+    global _LOCK_PROFILER
+    mode = getattr(sardanacustomsettings, "POOL_LOCK_MODE", PRODUCTION)
+    if mode == DEBUG:
+        if _LOCK_PROFILER is None:
+            _LOCK_PROFILER = LockProfiler()
+        return ProfiledLock(name, _LOCK_PROFILER)
+    elif mode != PRODUCTION:
+        raise ValueError("invalid POOL_LOCK_MODE: {!r}".format(mode))
+    return threading.RLock()
+
+
+class profile_action(object):
+    """Context manager attributing the locks acquired in the current thread
+    to the given action. It does nothing in the production lock mode.
+
+    :param action: action name
+    :type action: :obj:`str`"""
+
+    __slots__ = ("_action", "_previous")
+
+    def __init__(self, action):
+        self._action = action
+        self._previous = None
+
+    def __enter__(self):
+        profiler = _LOCK_PROFILER
+        if profiler is not None:
+            self._previous = profiler.get_action()
+            profiler.set_action(self._action)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        profiler = _LOCK_PROFILER
+        if profiler is not None:
+            profiler.set_action(self._previous)
+        return False
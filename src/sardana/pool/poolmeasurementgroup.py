@@ -34,6 +34,7 @@ __docformat__ = 'restructuredtext'
 
 import threading
 import weakref
+import itertools
 
 
 from taurus.core.tango.tangovalidator import TangoAttributeNameValidator
@@ -50,6 +51,9 @@ from sardana.pool.poolexternal import PoolExternalObject
 
 from sardana.taurus.core.tango.sardana import PlotType, Normalization
 
+#: unique generations of the measurement configurations
+_config_generations = itertools.count(1)
+
 
 # ----------------------------------------------
 # Measurement Group Configuration information
@@ -451,6 +455,9 @@ class MeasurementConfiguration(object):
         self._channel_acq_synch = {}
         self._ctrl_acq_synch = {}
         self.changed = False
+        # identifies the configuration contents (unique among all the
+        # measurement configurations), it changes whenever it is set
+        self.generation = next(_config_generations)
         # provide back. compatibility for value_ref_{enabled,pattern}
         # config parameters created with Sardana < 3.
         self._value_ref_compat = False
@@ -890,6 +897,7 @@ class MeasurementConfiguration(object):
         self._parent.set_user_element_ids(user_elem_ids_list)
 
         self.changed = True
+        self.generation = next(_config_generations)
 
     def _fill_channel_data(self, channel, channel_data):
         """Fill channel default values for the given channel dictionary"""
@@ -37,6 +37,7 @@ from taurus.core.util.log import Logger
 from sardana import ElementType, TYPE_PSEUDO_ELEMENTS
 
 from sardana.pool.poolobject import PoolObject
+from sardana.pool.poollock import profile_action
 
 
 class PoolMonitor(Logger, threading.Thread):
@@ -84,37 +85,10 @@ class PoolMonitor(Logger, threading.Thread):
     def update_state_info(self):
         """Update state information of every element."""
 
-        pool = self._pool
         elems, ctrls, ctrl_items = [], [], {}
         try:
-            blocked_ctrls = set()
-            for elem_id in self._elem_ids:
-                elem = pool.get_element_by_id(elem_id)
-                ctrl = elem.controller
-                if elem.is_in_operation():
-                    blocked_ctrls.add(ctrl)
-                    continue
-                if ctrl in blocked_ctrls:
-                    continue
-                ret = elem.lock(blocking=False)
-                if ret:
-                    elems.append(elem)
-                    ctrl_elems = ctrl_items.get(ctrl)
-                    if ctrl_elems is None:
-                        ctrl_items[ctrl] = ctrl_elems = []
-                    ctrl_elems.append(elem)
-                else:
-                    blocked_ctrls.add(ctrl)
-
-            for ctrl, ctrl_elems in list(ctrl_items.items()):
-                ret = ctrl.lock(blocking=False)
-                if ret:
-                    ctrls.append(ctrl)
-                else:
-                    for elem in reversed(ctrl_elems):
-                        elem.unlock()
-                        elems.remove(elem)
-
+            with profile_action(self.log_name):
+                self._lock_elements(elems, ctrls, ctrl_items)
             self._update_state_info_serial(ctrl_items)
         finally:
             for ctrl in reversed(ctrls):
@@ -122,15 +96,48 @@ class PoolMonitor(Logger, threading.Thread):
             for elem in reversed(elems):
                 elem.unlock()
 
+    def _lock_elements(self, elems, ctrls, ctrl_items):
+        """Locks the elements which are not in operation and their
+        controllers skipping the ones locked by other threads"""
+        pool = self._pool
+        blocked_ctrls = set()
+        for elem_id in self._elem_ids:
+            elem = pool.get_element_by_id(elem_id)
+            ctrl = elem.controller
+            if elem.is_in_operation():
+                blocked_ctrls.add(ctrl)
+                continue
+            if ctrl in blocked_ctrls:
+                continue
+            ret = elem.lock(blocking=False)
+            if ret:
+                elems.append(elem)
+                ctrl_elems = ctrl_items.get(ctrl)
+                if ctrl_elems is None:
+                    ctrl_items[ctrl] = ctrl_elems = []
+                ctrl_elems.append(elem)
+            else:
+                blocked_ctrls.add(ctrl)
+
+        for ctrl, ctrl_elems in list(ctrl_items.items()):
+            ret = ctrl.lock(blocking=False)
+            if ret:
+                ctrls.append(ctrl)
+            else:
+                for elem in reversed(ctrl_elems):
+                    elem.unlock()
+                    elems.remove(elem)
+                del ctrl_items[ctrl]
+
     def _update_state_info_serial(self, pool_ctrls):
         for pool_ctrl, elems in list(pool_ctrls.items()):
             self._update_ctrl_state_info(pool_ctrl, elems)
 
     def _update_ctrl_state_info(self, pool_ctrl, elems):
         axes = [elem.axis for elem in elems]
-        state_infos, exc_info = pool_ctrl.raw_read_axis_states(axes)
-        if len(exc_info):
-            self.info("STATE ERROR %s", exc_info)
+        state_infos, error = pool_ctrl.raw_read_axis_states(axes)
+        if error:
+            self.info("STATE ERROR %s", pool_ctrl.name)
         for elem, state_info in list(state_infos.items()):
             state_info = elem._from_ctrl_state_info(state_info)
             elem.set_state_info(state_info)
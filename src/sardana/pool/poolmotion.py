@@ -30,8 +30,12 @@ __all__ = ["MotionState", "MotionMap", "PoolMotion", "PoolMotionItem"]
 
 __docformat__ = 'restructuredtext'
 
+import sys
 import time
 import functools
+import threading
+
+from collections import OrderedDict
 
 from taurus.core.util.log import DebugIt
 from taurus.core.util.enumeration import Enumeration
@@ -170,15 +174,20 @@ _NON_ERROR_STATES = State.On, State.Moving, State.Running
 class PoolMotion(PoolAction):
     """This class manages motion actions"""
 
+    #: maximum time (in seconds) the concurrent start waits for each of its
+    #: phases (controllers prepared, StartAll called)
+    ConcurrentStartTimeout = 10.0
+
     def __init__(self, main_element, name="GlobalMotion"):
         PoolAction.__init__(self, main_element, name)
         self._motion_info = None
         self._motion_sleep_time = None
         self._nb_states_per_position = None
 
-    def _recover_start_error(self, ctrl, meth_name, read_state=False):
+    def _recover_start_error(self, ctrl, meth_name, read_state=False,
+                             exc_info=1):
         self.error("%s throws exception on %s. Stopping...", ctrl, meth_name)
-        self.debug("Details:", exc_info=1)
+        self.debug("Details:", exc_info=exc_info)
 
         self.emergency_break()
 
@@ -227,7 +236,7 @@ class PoolMotion(PoolAction):
                 self._recover_start_error(pool_ctrl, "StartOne")
                 raise
 
-    def start_all(self, pool_ctrls, moveables, motion_info):
+    def _set_moving(self, moveables, motion_info):
         # Change the state to Moving
         for moveable in moveables:
             moveable_info = motion_info[moveable]
@@ -237,6 +246,9 @@ class PoolMotion(PoolAction):
                 moveable.inspect_limit_switches()
             moveable_info.on_state_switch(state_info)
 
+    def start_all(self, pool_ctrls, moveables, motion_info):
+        self._set_moving(moveables, motion_info)
+
         # StartAll on all controllers
         for pool_ctrl in pool_ctrls:
             try:
@@ -271,12 +283,134 @@ class PoolMotion(PoolAction):
         pool_ctrls = self.get_pool_controller_list()
         moveables = self.get_elements()
 
+        start_strategy = kwargs.pop("start_strategy",
+                                    pool.motion_start_strategy)
+        start_timeout = kwargs.pop("start_timeout",
+                                   self.ConcurrentStartTimeout)
+
         with ActionContext(self):
+            if start_strategy == "concurrent" and len(pool_ctrls) > 1:
+                self.start_concurrent(pool_ctrls, moveables, items,
+                                      motion_info, timeout=start_timeout)
+                return
             self.pre_start_all(pool_ctrls)
             self.pre_start_one(moveables, items)
             self.start_one(moveables, motion_info)
             self.start_all(pool_ctrls, moveables, motion_info)
 
+    def start_concurrent(self, pool_ctrls, moveables, items, motion_info,
+                         timeout=None):
+        """Starts the motion accessing the controllers concurrently.
+
+        Each controller runs the pre-start phase (PreStartAll, PreStartOne
+        and StartOne) in its own thread. When all of them are ready the
+        StartAll calls are released at once through a barrier, so the start
+        skew between the controllers is minimal.
+
+        If the controllers are not prepared or their StartAll calls do not
+        return within *timeout* seconds (default:
+        :attr:`ConcurrentStartTimeout`) the motion is stopped and an
+        exception is raised."""
+        if timeout is None:
+            timeout = self.ConcurrentStartTimeout
+        ctrl_moveables = OrderedDict((pool_ctrl, []) for pool_ctrl in
+                                     pool_ctrls)
+        for moveable in moveables:
+            ctrl_moveables[moveable.controller].append(moveable)
+        # this thread takes part of the barriers too
+        prepared = threading.Barrier(len(pool_ctrls) + 1)
+        go = threading.Barrier(len(pool_ctrls) + 1)
+        errors = OrderedDict()
+        # controller method being called by each controller thread (None
+        # when it is not calling the controller)
+        phases = {}
+
+        def start_ctrl(pool_ctrl, moveables):
+            ctrl = pool_ctrl.ctrl
+            meth_name = phases[pool_ctrl] = "PreStartAll"
+            try:
+                ctrl.PreStartAll()
+                meth_name = phases[pool_ctrl] = "PreStartOne"
+                for moveable in moveables:
+                    axis, dial = moveable.axis, items[moveable][1]
+                    if not ctrl.PreStartOne(axis, dial):
+                        msg = "%s.PreStartOne(%s(%d), %f) returns False" \
+                            % (pool_ctrl.name, moveable.name, axis, dial)
+                        raise Exception(msg)
+                meth_name = phases[pool_ctrl] = "StartOne"
+                for moveable in moveables:
+                    dial_position = motion_info[moveable].dial_position
+                    ctrl.StartOne(moveable.axis, dial_position)
+            except Exception:
+                errors[pool_ctrl] = meth_name, sys.exc_info()
+            phases[pool_ctrl] = None
+            try:
+                prepared.wait()
+                go.wait()
+            except threading.BrokenBarrierError:
+                # pre-start failed or timed out on some controller
+                return
+            phases[pool_ctrl] = "StartAll"
+            try:
+                ctrl.StartAll()
+            except Exception:
+                errors[pool_ctrl] = "StartAll", sys.exc_info()
+            phases[pool_ctrl] = None
+
+        threads = []
+        for pool_ctrl, moveables_ in list(ctrl_moveables.items()):
+            thread = threading.Thread(name="%s.start" % pool_ctrl.name,
+                                      target=start_ctrl,
+                                      args=(pool_ctrl, moveables_))
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        try:
+            prepared.wait(timeout)
+        except threading.BrokenBarrierError:
+            go.abort()
+            self._add_start_timeout_error(errors, phases, pool_ctrls,
+                                          threads)
+        if errors:
+            go.abort()
+        else:
+            self._set_moving(moveables, motion_info)
+            try:
+                go.wait(timeout)
+            except threading.BrokenBarrierError:
+                # the controllers threads are already waiting on the barrier
+                self._add_start_timeout_error(errors, phases, pool_ctrls,
+                                              threads)
+        deadline = time.time() + timeout
+        for thread in threads:
+            thread.join(max(0, deadline - time.time()))
+        if not errors and any(thread.is_alive() for thread in threads):
+            self._add_start_timeout_error(errors, phases, pool_ctrls,
+                                          threads)
+        if errors:
+            pool_ctrl, (meth_name, exc_info) = list(errors.items())[0]
+            read_state = meth_name == "StartAll"
+            self._recover_start_error(pool_ctrl, meth_name,
+                                      read_state=read_state,
+                                      exc_info=exc_info)
+            raise exc_info[1].with_traceback(exc_info[2])
+
+    @staticmethod
+    def _add_start_timeout_error(errors, phases, pool_ctrls, threads):
+        """Adds the timeout error of the first controller whose start thread
+        is still calling the controller to the concurrent start errors"""
+        for pool_ctrl, thread in zip(pool_ctrls, threads):
+            meth_name = phases.get(pool_ctrl, "PreStartAll")
+            if meth_name is None or not thread.is_alive() \
+                    or pool_ctrl in errors:
+                continue
+            try:
+                raise TimeoutError("%s.%s did not return in time"
+                                   % (pool_ctrl.name, meth_name))
+            except TimeoutError:
+                errors[pool_ctrl] = meth_name, sys.exc_info()
+            return
+
     def backlash_item(self, motion_item):
         moveable = motion_item.moveable
         controller = moveable.controller
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains the always-on telemetry of the pool: latency
+histograms of the controller methods, the action loops and the element
+locks and the depth of the thread pool jobs queue"""
+
+__all__ = ["Histogram", "PoolTelemetry", "get_telemetry",
+           "instrument_controller"]
+
+__docformat__ = 'restructuredtext'
+
+import time
+import json
+import functools
+import threading
+
+#: latency of the controller methods [us], key: <controller>.<method>
+CONTROLLER = "controller"
+#: duration of the action loops, their iterations and reads [us],
+#: key: <action>.<action_loop|iteration|read_state_info|read_value|...>
+LOOP = "loop"
+#: time spent waiting for the element locks [us], key: <action>
+LOCK = "lock"
+#: depth of the jobs queue [jobs], key: <queue>
+QUEUE = "queue"
+
+#: controller methods which latency is recorded
+CONTROLLER_METHODS = (
+    "PreStateAll", "StateAll", "PreStateOne", "StateOne",
+    "PreReadAll", "ReadAll", "PreReadOne", "ReadOne",
+    "PreStartAll", "StartAll", "PreStartOne", "StartOne",
+    "PreLoadAll", "LoadAll", "PreLoadOne", "LoadOne",
+    "PrepareOne", "PreSynchAll", "SynchAll", "PreSynchOne", "SynchOne",
+    "PreStopAll", "StopAll", "PreStopOne", "StopOne",
+    "PreAbortAll", "AbortAll", "PreAbortOne", "AbortOne",
+    "SetAxisPar", "GetAxisPar", "SetCtrlPar", "GetCtrlPar",
+    "SendToCtrl", "RefOne", "RefAll")
+
+_TELEMETRY = None
+_TELEMETRY_LOCK = threading.Lock()
+
+
+class Histogram(object):
+    """Histogram of non negative values with power of 2 buckets: bucket 0
+    counts the values lower than 1 and bucket i counts the values in
+    [2**(i-1), 2**i)."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    #: number of buckets, the last one counts all the bigger values
+    NbBuckets = 40
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * self.NbBuckets
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        index = int(value).bit_length()
+        if index >= self.NbBuckets:
+            index = self.NbBuckets - 1
+        self.buckets[index] += 1
+
+    def to_dict(self):
+        """Returns the histogram in a compact form: the buckets are
+        truncated after the last non empty one
+
+        :return: dictionary with count, total, max and buckets
+        :rtype: :obj:`dict`"""
+        buckets = self.buckets
+        end = len(buckets)
+        while end > 0 and buckets[end - 1] == 0:
+            end -= 1
+        return dict(count=self.count, total=self.total, max=self.max,
+                    buckets=buckets[:end])
+
+
+class PoolTelemetry(object):
+    """Collection of histograms per category and key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {CONTROLLER: {}, LOOP: {}, LOCK: {}, QUEUE: {}}
+        self._since = time.time()
+
+    def get_histogram(self, category, key):
+        """Returns the histogram of the given category and key, creating it
+        if necessary. The histogram object stays valid after resets.
+
+        :param category: one of the CONTROLLER, LOOP, LOCK or QUEUE
+        :type category: :obj:`str`
+        :param key: histogram key
+        :type key: :obj:`str`
+        :return: histogram
+        :rtype: :class:`Histogram`"""
+        histograms = self._histograms[category]
+        histogram = histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = histograms.setdefault(key, Histogram())
+        return histogram
+
+    def add(self, category, key, value):
+        """Records a value
+
+        :param category: one of the CONTROLLER, LOOP, LOCK or QUEUE
+        :type category: :obj:`str`
+        :param key: histogram key
+        :type key: :obj:`str`
+        :param value: value (times are recorded in microseconds)
+        :type value: :obj:`float`"""
+        histogram = self.get_histogram(category, key)
+        with self._lock:
+            histogram.add(value)
+
+    def add_time(self, category, key, duration):
+        """Records a duration
+
+        :param category: one of the CONTROLLER, LOOP, LOCK or QUEUE
+        :type category: :obj:`str`
+        :param key: histogram key
+        :type key: :obj:`str`
+        :param duration: duration [s]
+        :type duration: :obj:`float`"""
+        self.add(category, key, duration * 1E6)
+
+    def add_histogram_time(self, histogram, duration):
+        """Records a duration in the given histogram (avoids the look up of
+        the histogram on the hot paths)
+
+        :param histogram: histogram obtained with
+            :meth:`~PoolTelemetry.get_histogram`
+        :type histogram: :class:`Histogram`
+        :param duration: duration [s]
+        :type duration: :obj:`float`"""
+        with self._lock:
+            histogram.add(duration * 1E6)
+
+    def reset(self):
+        """Clears all the histograms"""
+        with self._lock:
+            for histograms in self._histograms.values():
+                for histogram in histograms.values():
+                    histogram.clear()
+            self._since = time.time()
+
+    def get_data(self, reset=False):
+        """Returns the telemetry data. Only non empty histograms are
+        returned.
+
+        :param reset: clear the histograms after reading them
+        :type reset: :obj:`bool`
+        :return: dictionary with the since and now timestamps and a
+            dictionary of histograms (see :meth:`Histogram.to_dict`) per
+            category
+        :rtype: :obj:`dict`"""
+        with self._lock:
+            now = time.time()
+            ret = dict(since=self._since, now=now)
+            for category, histograms in self._histograms.items():
+                ret[category] = data = {}
+                for key, histogram in histograms.items():
+                    if histogram.count > 0:
+                        data[key] = histogram.to_dict()
+                        if reset:
+                            histogram.clear()
+            if reset:
+                self._since = now
+        return ret
+
+    def encode(self, reset=False):
+        """Returns the telemetry data JSON encoded
+
+        :param reset: clear the histograms after reading them
+        :type reset: :obj:`bool`
+        :return: JSON encoded telemetry data (see
+            :meth:`~PoolTelemetry.get_data`)
+        :rtype: :obj:`str`"""
+        return json.dumps(self.get_data(reset=reset),
+                          separators=(",", ":"))
+
+
+def get_telemetry():
+    """Returns the global telemetry of the pool
+
+    :return: the global telemetry object
+    :rtype: :class:`PoolTelemetry`"""
+    global _TELEMETRY
+    if _TELEMETRY is None:
+        with _TELEMETRY_LOCK:
+            if _TELEMETRY is None:
+                _TELEMETRY = PoolTelemetry()
+    return _TELEMETRY
+
+
+def _timed(method, telemetry, histogram):
+    perf_counter = time.perf_counter
+    add = telemetry.add_histogram_time
+
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            add(histogram, perf_counter() - start)
+    return timed
+
+
+def instrument_controller(name, ctrl):
+    """Records the latency of the controller methods (see
+    :data:`CONTROLLER_METHODS`) implemented by the given controller object
+    by shadowing them with timed instance attributes.
+
+    :param name: controller name
+    :type name: :obj:`str`
+    :param ctrl: controller object
+    :type ctrl: :class:`~sardana.pool.controller.Controller`"""
+    telemetry = get_telemetry()
+    for method_name in CONTROLLER_METHODS:
+        method = getattr(ctrl, method_name, None)
+        if not callable(method):
+            continue
+        # skip the default (empty) implementations of the base classes
+        func = getattr(method, "__func__", None)
+        if getattr(func, "__module__", None) == "sardana.pool.controller":
+            continue
+        key = "{}.{}".format(name, method_name)
+        histogram = telemetry.get_histogram(CONTROLLER, key)
+        setattr(ctrl, method_name, _timed(method, telemetry, histogram))
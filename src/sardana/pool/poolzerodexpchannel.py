@@ -43,15 +43,71 @@ from sardana.pool.poolacquisition import Pool0DAcquisition
 
 
 class BaseAccumulation(object):
-
-    def __init__(self):
-        self.buffer = numpy.zeros(shape=(2, 16384), dtype=numpy.float64)
+    """Streaming accumulation of 0D samples.
+
+    Samples are appended either one by one (:meth:`append`) or in batches
+    (:meth:`append_many`). The running statistics (number of valid points,
+    sum, Welford mean and variance, minimum, maximum and trapezoid integral)
+    are updated with vectorized operations on each batch, so the cost per
+    sample does not depend on the length of the acquisition.
+
+    Raw samples are stored in a buffer which grows on demand. When
+    *keep_samples* is False only the statistics are kept and the value and
+    time buffers are empty. Samples which value is None (readout errors)
+    are counted but ignored by the statistics.
+
+    Subclasses decide which statistic is exposed as the accumulated
+    :attr:`value` by overriding :meth:`update_value`. This base class
+    exposes the last sample.
+    """
+
+    #: initial capacity (in samples) of the value and time buffers
+    BufferSize = 16 * 1024
+
+    def __init__(self, keep_samples=True):
+        self._keep_samples = keep_samples
+        self.buffer = numpy.empty(shape=(2, 0), dtype=numpy.float64)
         self.clear()
+        if keep_samples:
+            self._grow_buffer(self.BufferSize)
 
     def clear(self):
         self.nb_points = 0
+        self.nb_valid_points = 0
         self.value = None
         self.timestamp = None
+        self.sum = 0.0
+        self.mean = None
+        self.min = None
+        self.max = None
+        self.integral = 0.0
+        self.start_time = None
+        self.last_value = None
+        self._m2 = 0.0
+
+    def get_keep_samples(self):
+        return self._keep_samples
+
+    keep_samples = property(get_keep_samples)
+
+    def get_variance(self):
+        """Population variance of the valid samples (None if there are no
+        valid samples)"""
+        if not self.nb_valid_points:
+            return None
+        return self._m2 / self.nb_valid_points
+
+    variance = property(get_variance)
+
+    def get_std(self):
+        """Population standard deviation of the valid samples (None if there
+        are no valid samples)"""
+        variance = self.get_variance()
+        if variance is None:
+            return None
+        return variance ** 0.5
+
+    std = property(get_std)
 
     def get_value_buffer(self):
         return self.buffer[0][:self.nb_points]
@@ -59,14 +115,79 @@ class BaseAccumulation(object):
     def get_time_buffer(self):
         return self.buffer[1][:self.nb_points]
 
+    def _grow_buffer(self, size):
+        capacity = self.buffer.shape[1]
+        if size <= capacity:
+            return
+        capacity = max(capacity, self.BufferSize)
+        while capacity < size:
+            capacity *= 2
+        buff = numpy.empty(shape=(2, capacity), dtype=numpy.float64)
+        buff[:, :self.nb_points] = self.buffer[:, :self.nb_points]
+        self.buffer = buff
+
     def append(self, value, timestamp=None):
         if timestamp is None:
             timestamp = time.time()
-        idx = self.nb_points
-        self.nb_points += 1
-        self.buffer[0][idx] = value
-        self.buffer[1][idx] = timestamp
-        self.update_value(value, timestamp)
+        self.append_many((value,), (timestamp,))
+
+    def append_many(self, values, timestamps):
+        """Appends a batch of samples.
+
+        :param values: sample values (None for invalid samples)
+        :type values: seq<float>
+        :param timestamps: sample timestamps
+        :type timestamps: seq<float>"""
+        values = numpy.array(values, dtype=numpy.float64, ndmin=1)
+        timestamps = numpy.array(timestamps, dtype=numpy.float64, ndmin=1)
+        nb = len(values)
+        if nb == 0:
+            return
+        if self._keep_samples:
+            idx = self.nb_points
+            self._grow_buffer(idx + nb)
+            self.buffer[0][idx:idx + nb] = values
+            self.buffer[1][idx:idx + nb] = timestamps
+        self.nb_points += nb
+        valid = ~numpy.isnan(values)
+        if valid.all():
+            self._update_statistics(values, timestamps)
+        elif valid.any():
+            self._update_statistics(values[valid], timestamps[valid])
+        value = None if not valid[-1] else float(values[-1])
+        self.update_value(value, float(timestamps[-1]))
+
+    def _update_statistics(self, values, timestamps):
+        nb = len(values)
+        batch_mean = values.mean()
+        batch_m2 = numpy.square(values - batch_mean).sum()
+        # merge batch statistics with the running ones (Chan et al.
+        # parallel variant of the Welford algorithm)
+        nb_prev = self.nb_valid_points
+        total = nb_prev + nb
+        if nb_prev == 0:
+            self.mean = float(batch_mean)
+            self._m2 = float(batch_m2)
+            self.min = float(values.min())
+            self.max = float(values.max())
+            self.start_time = float(timestamps[0])
+        else:
+            delta = batch_mean - self.mean
+            self.mean = float(self.mean + delta * nb / total)
+            self._m2 = float(self._m2 + batch_m2 +
+                             delta * delta * nb_prev * nb / total)
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            last_value, last_timestamp = self.last_value
+            values = numpy.concatenate(((last_value,), values))
+            timestamps = numpy.concatenate(((last_timestamp,), timestamps))
+        self.nb_valid_points = total
+        self.sum += float(values[-nb:].sum())
+        if len(values) > 1:
+            self.integral += float(
+                (numpy.diff(timestamps) * (values[1:] + values[:-1])).sum()
+                / 2)
+        self.last_value = float(values[-1]), float(timestamps[-1])
 
     def update_value(self, value, timestamp):
         self.value = value
@@ -78,50 +199,32 @@ LastAccumulation = BaseAccumulation
 
 class SumAccumulation(BaseAccumulation):
 
-    def clear(self):
-        BaseAccumulation.clear(self)
-        self.sum = 0.0
-
     def update_value(self, value, timestamp):
         BaseAccumulation.update_value(self, value, timestamp)
-        if not value is None:
-            self.sum += value
+        if self.nb_valid_points:
             self.value = self.sum
 
 
-class AverageAccumulation(SumAccumulation):
-
-    def clear(self):
-        SumAccumulation.clear(self)
-        self.nb_valid_points = 0
+class AverageAccumulation(BaseAccumulation):
 
     def update_value(self, value, timestamp):
-        SumAccumulation.update_value(self, value, timestamp)
-        if not value is None:
-            self.nb_valid_points += 1
-            self.value = self.sum / self.nb_valid_points
+        BaseAccumulation.update_value(self, value, timestamp)
+        if self.nb_valid_points:
+            self.value = self.mean
 
 
 class IntegralAccumulation(BaseAccumulation):
 
-    def clear(self):
-        BaseAccumulation.clear(self)
-        self.sum = 0.0
-        self.last_value = None
-        self.start_time = None
-
     def update_value(self, value, timestamp):
-        if self.nb_points == 1:
-            self.last_value = value, timestamp
-            self.start_time = timestamp
-            self.value = value
+        BaseAccumulation.update_value(self, value, timestamp)
+        if not self.nb_valid_points:
+            return
+        last_value, last_timestamp = self.last_value
+        total_dt = last_timestamp - self.start_time
+        if total_dt > 0:
+            self.value = self.integral / total_dt
         else:
-            last_value, last_timestamp = self.last_value
-            dt = timestamp - last_timestamp
-            self.sum += dt * (last_value + value) / 2
-            total_dt = timestamp - self.start_time
-            self.value = self.sum / total_dt
-            self.last_value = value, timestamp
+            self.value = last_value
 
 
 def get_accumulation_class(ctype):
@@ -143,6 +246,7 @@ class Value(SardanaAttribute):
     def __init__(self, *args, **kwargs):
         accumulation_type = kwargs.pop(
             'accumulation_type', self.DefaultAccumulationType)
+        self._keep_samples = kwargs.pop('keep_samples', True)
         super(Value, self).__init__(*args, **kwargs)
         self.set_accumulation_type(accumulation_type)
 
@@ -151,7 +255,7 @@ class Value(SardanaAttribute):
 
     def set_accumulation_type(self, ctype):
         klass = get_accumulation_class(ctype)
-        self._accumulation = klass()
+        self._accumulation = klass(keep_samples=self._keep_samples)
 
     def get_accumulation_type(self):
         klass_name = self._accumulation.__class__.__name__
@@ -162,6 +266,17 @@ class Value(SardanaAttribute):
 
     accumulation = property(get_accumulation)
 
+    def get_keep_samples(self):
+        return self._keep_samples
+
+    def set_keep_samples(self, keep_samples):
+        """Sets whether the raw samples are kept in the accumulation buffer
+        or only the statistics are calculated. The accumulation is reset."""
+        self._keep_samples = keep_samples
+        self.set_accumulation_type(self.get_accumulation_type())
+
+    keep_samples = property(get_keep_samples, set_keep_samples)
+
     def _get_value(self):
         value = self._accumulation.value
         if value is None:
@@ -176,7 +291,7 @@ class Value(SardanaAttribute):
         value = self._accumulation.value
         # use timestamp of the last acquired sample as timestamp of
         # accumulation
-        timestamp = self._accumulation.get_time_buffer()[-1]
+        timestamp = self._accumulation.timestamp
         value_obj = SardanaValue(value=value, timestamp=timestamp)
         return value_obj
 
@@ -207,6 +322,22 @@ class Value(SardanaAttribute):
             evt_type = EventType(self.name, priority=propagate)
             self.fire_event(evt_type, self)
 
+    def extend_buffer(self, values, propagate=1):
+        """Appends a batch of values to the accumulation.
+
+        :param values: values to be accumulated
+        :type values: seq<:class:`~sardana.sardanavalue.SardanaValue`>
+        :param propagate:
+            0 for not propagating, 1 to propagate, 2 propagate with priority
+        :type propagate: int"""
+        if not values:
+            return
+        self.accumulation.append_many([value.value for value in values],
+                                      [value.timestamp for value in values])
+        if propagate > 0:
+            evt_type = EventType(self.name, priority=propagate)
+            self.fire_event(evt_type, self)
+
     def update(self, cache=True, propagate=1):
         # it is the Pool0DAcquisition action which is allowed to update
         raise Exception("0D Value can not be updated from outside"
@@ -238,6 +369,15 @@ class Pool0DExpChannel(PoolBaseChannel):
 
     accumulation = property(get_accumulation)
 
+    def get_keep_samples(self):
+        return self.get_value_attribute().get_keep_samples()
+
+    def set_keep_samples(self, keep_samples):
+        return self.get_value_attribute().set_keep_samples(keep_samples)
+
+    keep_samples = property(get_keep_samples, set_keep_samples,
+                            doc="keep the raw samples of the accumulation")
+
     # -------------------------------------------------------------------------
     # value
     # -------------------------------------------------------------------------
@@ -295,6 +435,26 @@ class Pool0DExpChannel(PoolBaseChannel):
             acc_val_attr = self.get_accumulated_value_attribute()
             acc_val_attr.append_buffer(value, propagate=propagate)
 
+    def put_current_values(self, values, propagate=1):
+        """Put a batch of current values. The last one becomes the current
+        value and, while in operation, all of them are accumulated at once.
+
+        :param values:
+            the new values (in acquisition order)
+        :type values:
+            seq<:class:`~sardana.sardanavalue.SardanaValue`>
+        :param propagate:
+            0 for not propagating, 1 to propagate, 2 propagate with priority
+        :type propagate:
+            int"""
+        if not values:
+            return
+        curr_val_attr = self.get_current_value_attribute()
+        curr_val_attr.set_value(values[-1], propagate=propagate)
+        if self.is_in_operation():
+            acc_val_attr = self.get_accumulated_value_attribute()
+            acc_val_attr.extend_buffer(values, propagate=propagate)
+
     def get_current_value(self, cache=True, propagate=1):
         """Returns the counter value.
 
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Benchmark of the measurement group acquisition on the dummy controllers.
+
+It measures the acquisition throughput (complete points per second), the
+latency of the points (from the nominal end of the point integration until
+its value buffer events of all the channels were encoded as the Pool Tango
+device does before pushing them to the clients) and the CPU and memory
+usage for the software trigger, hardware trigger and software start
+synchronizations.
+
+Run the benchmark with::
+
+    python -m sardana.pool.test.bench_acquisition [--quick] [-o FILE]
+
+The results are written as JSON (one entry per benchmark case together with
+the machine and sardana version) so runs can be compared over time.
+
+This module is not part of the test suite.
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import platform
+import threading
+import argparse
+
+import numpy
+
+from taurus.core.util.codecs import CodecFactory
+
+from sardana import release, sardanacustomsettings
+from sardana.pool import AcqSynchType
+from sardana.pool.pooldefs import SynchDomain, SynchParam
+from sardana.pool.test import (FakePool, createPoolController,
+                               createPoolCounterTimer,
+                               createPoolOneDExpChannel,
+                               createPoolTwoDExpChannel,
+                               createPoolTriggerGate,
+                               createPoolMeasurementGroup, createCtrlConf,
+                               createElemConf, createMGUserConfiguration)
+
+#: synchronizations: synchronizer ("hardware" stands for the dummy
+#: trigger/gate element) and synchronization type
+SYNCHRONIZATIONS = {
+    "software": ("software", AcqSynchType.Trigger),
+    "hardware": ("hardware", AcqSynchType.Trigger),
+    "start": ("software", AcqSynchType.Start)
+}
+
+#: channel types: dummy controller class and element factory
+CHANNEL_TYPES = {
+    "ct": ("DummyCounterTimerController", createPoolCounterTimer),
+    "1d": ("DummyOneDController", createPoolOneDExpChannel),
+    "2d": ("DummyTwoDController", createPoolTwoDExpChannel)
+}
+
+#: maximum number of channels of one controller
+CHANNELS_PER_CTRL = 8
+
+
+def _get_rss():
+    """Returns the resident memory of the process [B] (Linux only)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _get_cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class PointRecorder(object):
+    """Value buffer listener of the measurement group channels.
+
+    The value chunks are encoded with the VALUE_BUFFER_CODEC as the Pool
+    Tango device does and a point is considered recorded when the values
+    of all the channels arrived.
+    """
+
+    def __init__(self, nb_channels, nb_points):
+        codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
+        self._codec = CodecFactory().getCodec(codec_name)
+        self._nb_channels = nb_channels
+        self._lock = threading.Lock()
+        self.counts = numpy.zeros(nb_points, dtype=numpy.int32)
+        self.times = numpy.full(nb_points, numpy.nan)
+
+    def event_received(self, src, type_, value_chunk):
+        if type_.name.lower() != "valuebuffer":
+            return
+        index = list(value_chunk.keys())
+        value = [sdn_value.value for sdn_value in value_chunk.values()]
+        self._codec.encode(("", dict(index=index, value=value)))
+        now = time.perf_counter()
+        index = numpy.array(index)
+        with self._lock:
+            numpy.add.at(self.counts, index, 1)
+            done = index[self.counts[index] == self._nb_channels]
+            self.times[done] = now
+
+
+def create_measurement_group(pool, channel_type, nb_channels,
+                             synchronization):
+    klass, create_channel = CHANNEL_TYPES[channel_type]
+    synchronizer, synch_type = SYNCHRONIZATIONS[synchronization]
+    if synchronizer == "hardware":
+        ctrl_cfg = createCtrlConf(pool, "tgctrl01",
+                                  "DummyTriggerGateController",
+                                  "DummyTriggerGateController.py")
+        ctrl = createPoolController(pool, ctrl_cfg)
+        pool.add_element(ctrl)
+        tg = createPoolTriggerGate(pool, ctrl,
+                                   createElemConf(pool, 1, "tg01"))
+        ctrl.add_element(tg)
+        pool.add_element(tg)
+        synchronizer = tg.full_name
+    config, channels = [], []
+    for i in range(nb_channels):
+        axis = i % CHANNELS_PER_CTRL + 1
+        if axis == 1:
+            ctrl_name = "{}ctrl{:02d}".format(channel_type, len(config) + 1)
+            ctrl_cfg = createCtrlConf(pool, ctrl_name, klass, klass + ".py")
+            ctrl = createPoolController(pool, ctrl_cfg)
+            pool.add_element(ctrl)
+            if synchronizer != "software":
+                ctrl.set_ctrl_attr("synchronizer", synchronizer)
+            config.append([])
+        name = "{}{:02d}".format(channel_type, i + 1)
+        channel = create_channel(pool, ctrl,
+                                 createElemConf(pool, axis, name))
+        ctrl.add_element(channel)
+        pool.add_element(channel)
+        channels.append(channel)
+        config[-1].append((channel.full_name, synchronizer, synch_type))
+    mg_conf, channel_ids, _ = createMGUserConfiguration(pool, config)
+    mg = createPoolMeasurementGroup(pool, dict(name="mg01",
+                                               full_name="mg01",
+                                               user_elements=channel_ids))
+    pool.add_element(mg)
+    mg.set_configuration_from_user(mg_conf)
+    return mg, channels
+
+
+def benchmark(synchronization="hardware", channel_type="ct", nb_channels=1,
+              nb_points=1000, integ_time=0.0001, latency_time=0.0001,
+              timeout=None):
+    """Measure one measurement group acquisition.
+
+    :param synchronization: "software" (trigger), "hardware" (trigger) or
+      "start" (software start)
+    :param channel_type: "ct", "1d" or "2d"
+    :param nb_channels: number of channels
+    :param nb_points: number of points
+    :param integ_time: integration time of each point [s]
+    :param latency_time: latency time between the points [s]
+    :param timeout: maximum acquisition time [s] (default: 10 times the
+      nominal acquisition time plus 10 s)
+    :return: benchmark case parameters and results: number of recorded
+      points, duration [s], rate [points/s], latency mean, median, 99th
+      percentile and maximum [s], CPU time [s], CPU load (CPU time /
+      duration) and resident memory increase [B]
+    :rtype: dict
+    """
+    period = integ_time + latency_time
+    if timeout is None:
+        timeout = 10 * nb_points * period + 10
+    result = dict(synchronization=synchronization, channel_type=channel_type,
+                  nb_channels=nb_channels, nb_points=nb_points,
+                  integ_time=integ_time, latency_time=latency_time)
+    pool = FakePool()
+    try:
+        mg, channels = create_measurement_group(pool, channel_type,
+                                                nb_channels,
+                                                synchronization)
+        mg.set_synch_description([{
+            SynchParam.Delay: {SynchDomain.Time: 0},
+            SynchParam.Active: {SynchDomain.Time: integ_time},
+            SynchParam.Total: {SynchDomain.Time: period},
+            SynchParam.Repeats: nb_points}])
+        recorder = PointRecorder(nb_channels, nb_points)
+        for channel in channels:
+            channel.add_listener(recorder)
+        rss = _get_rss()
+        cpu_time = _get_cpu_time()
+        mg.prepare()
+        start = time.perf_counter()
+        mg.start_acquisition()
+        acquisition = mg.acquisition
+        while acquisition.is_running():
+            if time.perf_counter() - start > timeout:
+                mg.stop()
+            time.sleep(0.01)
+        end = time.perf_counter()
+        cpu_time = _get_cpu_time() - cpu_time
+        if rss is not None:
+            rss = _get_rss() - rss
+        for channel in channels:
+            channel.remove_listener(recorder)
+    finally:
+        pool.cleanup()
+    recorded = ~numpy.isnan(recorder.times)
+    nb_recorded = int(recorded.sum())
+    if nb_recorded > 0:
+        end = numpy.nanmax(recorder.times)
+    duration = end - start
+    # nominal end of integration of each point
+    nominal = start + numpy.arange(nb_points) * period + integ_time
+    latency = (recorder.times - nominal)[recorded]
+    if nb_recorded == 0:
+        latency = numpy.array([numpy.nan])
+    result.update(recorded=nb_recorded, duration=duration,
+                  rate=nb_recorded / duration,
+                  latency_mean=float(numpy.mean(latency)),
+                  latency_median=float(numpy.median(latency)),
+                  latency_p99=float(numpy.percentile(latency, 99)),
+                  latency_max=float(numpy.max(latency)),
+                  cpu_time=cpu_time, cpu_load=cpu_time / duration,
+                  rss_increase=rss)
+    return result
+
+
+def get_cases(quick=False):
+    """Returns the benchmark cases: software, hardware and start
+    synchronizations with 1 to 64 counter/timer channels and 10^3 to 10^6
+    points (hardware and start, software trigger up to 10^4 points) and 1 to
+    8 1D (software only, the dummy 1D controller does not emulate the
+    hardware synchronization) and 2D channels with 10^3 points.
+
+    :param quick: reduced number of channels and points
+    :return: sequence of keyword arguments of :func:`benchmark`
+    :rtype: list<dict>
+    """
+    if quick:
+        nb_channels_ct, nb_channels_img, max_points = (1, 8), (1,), 10**4
+    else:
+        nb_channels_ct, nb_channels_img, max_points = (1, 8, 64), (1, 8), \
+            10**6
+    cases = []
+    for synchronization in ("software", "hardware", "start"):
+        if synchronization == "software":
+            # one software trigger per point with a realistic period
+            integ_time, latency_time = 0.001, 0.001
+            points = [n for n in (10**3, 10**4) if n <= max_points]
+        else:
+            integ_time, latency_time = 0.00005, 0.00005
+            points = [n for n in (10**3, 10**4, 10**5, 10**6)
+                      if n <= max_points]
+        for nb_points in points:
+            for nb_channels in nb_channels_ct:
+                cases.append(dict(synchronization=synchronization,
+                                  channel_type="ct",
+                                  nb_channels=nb_channels,
+                                  nb_points=nb_points,
+                                  integ_time=integ_time,
+                                  latency_time=latency_time))
+        for channel_type in ("1d", "2d"):
+            if channel_type == "1d" and synchronization != "software":
+                continue
+            for nb_channels in nb_channels_img:
+                cases.append(dict(synchronization=synchronization,
+                                  channel_type=channel_type,
+                                  nb_channels=nb_channels,
+                                  nb_points=10**3,
+                                  integ_time=0.001, latency_time=0.001))
+    return cases
+
+
+def run(cases, output=None, verbose=True):
+    """Runs the benchmark cases.
+
+    :param cases: sequence of keyword arguments of :func:`benchmark`
+    :param output: JSON results file name (optional)
+    :param verbose: print the results table
+    :return: benchmark results: machine and versions information and the
+      results of each case
+    :rtype: dict
+    """
+    fmt = "{:>9} {:>4} {:>4} {:>8} {:>8} {:>11} {:>10} {:>10} {:>6} {:>9}"
+    if verbose:
+        print(fmt.format("synch", "type", "chs", "points", "recorded",
+                         "rate [pt/s]", "lat50 [ms]", "lat99 [ms]", "cpu",
+                         "rss [MB]"))
+    results = []
+    for case in cases:
+        result = benchmark(**case)
+        results.append(result)
+        if verbose:
+            rss = result["rss_increase"]
+            rss = "-" if rss is None else "{:.1f}".format(rss / 2**20)
+            print(fmt.format(
+                result["synchronization"], result["channel_type"],
+                result["nb_channels"], result["nb_points"],
+                result["recorded"], "{:.0f}".format(result["rate"]),
+                "{:.3f}".format(result["latency_median"] * 1E3),
+                "{:.3f}".format(result["latency_p99"] * 1E3),
+                "{:.2f}".format(result["cpu_load"]), rss))
+    data = dict(date=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                sardana=release.version, python=platform.python_version(),
+                platform=platform.platform(), cpu_count=os.cpu_count(),
+                results=results)
+    if output is not None:
+        with open(output, "w") as output_file:
+            json.dump(data, output_file, indent=1)
+    return data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Acquisition benchmark")
+    parser.add_argument("-o", "--output", help="JSON results file")
+    parser.add_argument("--quick", action="store_true",
+                        help="reduced number of channels and points")
+    args = parser.parse_args()
+    run(get_cases(args.quick), args.output)
+    sys.exit(0)
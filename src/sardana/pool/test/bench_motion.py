@@ -0,0 +1,433 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Benchmark of the motion on the dummy motor controllers.
+
+It measures, for motors moved independently, in a motor group or through
+slit pseudo motors:
+
+* start latency - from the move command until the (dummy) hardware motion
+  start and until the moving state event
+* position lag - from the instant the hardware was at a position (according
+  to the :class:`sardana.util.motion.Motor` model of the motion) until the
+  position event with this value
+* end latency - from the hardware motion end until the state event
+* stop and abort latency - from the command until the state event
+* CPU usage per moving motor and the PoolMonitor state update time
+
+Run the benchmark with::
+
+    python -m sardana.pool.test.bench_motion [--quick] [-o FILE]
+      [--sleep-time SECONDS] [--states-per-position NUMBER]
+
+The results are written as JSON (one entry per benchmark case together with
+the machine, sardana version and motion loop parameters) so runs can be
+compared over time.
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import platform
+import argparse
+from unittest import mock
+
+import numpy
+
+from sardana import release, State, ElementType
+from sardana.pool.pool import Pool
+from sardana.pool.poolmonitor import PoolMonitor
+from sardana.pool.poolmotorgroup import PoolMotorGroup
+from sardana.pool.test import (FakePool, createPoolController,
+                               createPoolMotor, createPoolPseudoMotor,
+                               createCtrlConf, createElemConf)
+from sardana.util.motion import Motor
+
+#: motion modes: "motor" - each motor moved independently, "group" - all
+#: motors moved in one motor group, "pseudo" - gap pseudo motors of slits
+#: (one per two motors)
+MODES = ("motor", "group", "pseudo")
+
+#: velocity [units/s], acceleration and deceleration time [s] of the motors
+VELOCITY = 10.
+ACCELERATION = 0.1
+
+
+def _get_cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class EventRecorder(object):
+    """Records the arrival time of the state events and of the motors
+    position events"""
+
+    def __init__(self):
+        # dict<PoolElement, list<tuple<float, object>>>
+        self.states = {}
+        self.positions = {}
+
+    def event_received(self, src, type_, value):
+        now = time.time()
+        name = type_.name.lower()
+        if name == "state":
+            self.states.setdefault(src, []).append((now, value))
+        elif name == "position" and src.get_type() == ElementType.Motor:
+            # the group and pseudo positions are calculated on read
+            self.positions.setdefault(src, []).append((now, value.value))
+
+    def clear(self):
+        self.states = {}
+        self.positions = {}
+
+    def get_state_time(self, element, state, since):
+        """Returns the time of the first state event after the given time
+        or None"""
+        for event_time, value in self.states.get(element, ()):
+            if event_time >= since and value == state:
+                return event_time
+
+    def get_not_state_time(self, element, state, since):
+        """Returns the time of the first event of other state than the
+        given one after the given time or None"""
+        for event_time, value in self.states.get(element, ()):
+            if event_time >= since and value != state:
+                return event_time
+
+
+def create_elements(nb_motors, motors_per_ctrl, mode):
+    pool = FakePool()
+    motors, ctrls = [], []
+    for i in range(nb_motors):
+        axis = i % motors_per_ctrl + 1
+        if axis == 1:
+            ctrl_name = "motctrl{:03d}".format(len(ctrls) + 1)
+            ctrl = createPoolController(pool, createCtrlConf(
+                pool, ctrl_name, "DummyMotorController",
+                "DummyMotorController.py"))
+            pool.add_element(ctrl)
+            ctrls.append(ctrl)
+        motor = createPoolMotor(pool, ctrl, createElemConf(
+            pool, axis, "mot{:03d}".format(i + 1)))
+        ctrl.add_element(motor)
+        pool.add_element(motor)
+        motor.set_base_rate(0)
+        motor.set_velocity(VELOCITY)
+        motor.set_acceleration(ACCELERATION)
+        motor.set_deceleration(ACCELERATION)
+        motors.append(motor)
+    if mode == "motor":
+        moveables = motors
+    elif mode == "group":
+        group = PoolMotorGroup(id=pool.get_free_id(), name="motgrp01",
+                               full_name="motgrp01", pool=pool,
+                               user_elements=[m.id for m in motors])
+        pool.add_element(group)
+        moveables = [group]
+    elif mode == "pseudo":
+        moveables = []
+        for i in range(0, nb_motors - 1, 2):
+            role_ids = [motors[i].id, motors[i + 1].id]
+            ctrl_cfg = createCtrlConf(pool, "slit{:03d}".format(i // 2 + 1),
+                                      "Slit", "Slit.py")
+            ctrl_cfg["role_ids"] = role_ids
+            ctrl = createPoolController(pool, ctrl_cfg)
+            pool.add_element(ctrl)
+            for axis, name in ((1, "gap"), (2, "offset")):
+                pseudo = createPoolPseudoMotor(pool, ctrl, createElemConf(
+                    pool, axis, "{}{:03d}".format(name, i // 2 + 1)),
+                    role_ids)
+                ctrl.add_element(pseudo)
+                pool.add_element(pseudo)
+                if axis == 1:
+                    moveables.append(pseudo)
+    else:
+        raise ValueError("unknown mode {}".format(mode))
+    return pool, motors, moveables
+
+
+def get_positions(moveable, distance):
+    """Returns the target position of the moveable which moves each motor
+    by the given distance (gap of the slit changes by twice the distance)"""
+    position = moveable.get_position(cache=False).value
+    if moveable.get_type() == ElementType.MotorGroup:
+        return [pos + distance for pos in position]
+    elif moveable.get_type() == ElementType.PseudoMotor:
+        return position + 2 * distance
+    return position + distance
+
+
+def _get_hw_motion(motor):
+    ctrl = motor.controller.ctrl
+    return ctrl.m[motor.axis - 1]
+
+
+def wait_motion(moveables, timeout):
+    start = time.time()
+    while any(m.is_in_operation() for m in moveables):
+        if time.time() - start > timeout:
+            raise RuntimeError("motion did not finish in time")
+        time.sleep(0.005)
+
+
+def _position_lags(motor, events, start_instant, initial, final):
+    # physical position in time according to the motion model
+    ref = Motor(min_vel=0, max_vel=VELOCITY, accel_time=ACCELERATION,
+                decel_time=ACCELERATION)
+    ref.setCurrentUserPosition(initial)
+    ref.startMotion(initial, final, start_instant)
+    final_instant = ref.current_motion.final_instant
+    times = numpy.linspace(start_instant, final_instant, 1000)
+    positions = numpy.array([ref.getCurrentUserPosition(t) for t in times])
+    lags = []
+    low, high = min(initial, final), max(initial, final)
+    for event_time, value in events:
+        # the position is ambiguous before and after the motion
+        if not low < value < high:
+            continue
+        if final > initial:
+            physical_time = numpy.interp(value, positions, times)
+        else:
+            physical_time = numpy.interp(-value, -positions, times)
+        lags.append(event_time - physical_time)
+    return lags, final_instant
+
+
+def _stats(values, prefix):
+    values = numpy.asarray(values, dtype=float)
+    if len(values) == 0:
+        values = numpy.array([numpy.nan])
+    return {prefix + "_mean": float(numpy.mean(values)),
+            prefix + "_median": float(numpy.median(values)),
+            prefix + "_p99": float(numpy.percentile(values, 99)),
+            prefix + "_max": float(numpy.max(values))}
+
+
+def no_tango_limits():
+    """Returns a patch disabling the Tango attribute limits check of the
+    motor group and pseudo motor motions - the limits are not available
+    outside of the Tango server"""
+    return mock.patch("sardana.tango.core.util._check_attr_range",
+                      new=lambda *args: None)
+
+
+@no_tango_limits()
+def benchmark(mode="motor", nb_motors=1, motors_per_ctrl=10, distance=5.,
+              sleep_time=None, states_per_position=None):
+    """Measure the motion of the given number of motors.
+
+    :param mode: "motor", "group" or "pseudo" (see :obj:`MODES`)
+    :param nb_motors: number of (physical) motors moving concurrently
+    :param motors_per_ctrl: number of motors of one controller
+    :param distance: distance of each motor motion [units]
+    :param sleep_time: motion loop sleep time (default: the Pool default)
+    :param states_per_position: motion loop positions read per state read
+      (default: the Pool default)
+    :return: benchmark case parameters and results (latencies in [s]):
+      start (command to hardware start), start_event (command to moving
+      state event), position_lag, end (hardware end to state event), stop
+      and abort latency statistics (mean, median, 99th percentile and
+      maximum), number of position events per motor, CPU load per moving
+      motor and PoolMonitor state update time [s]
+    :rtype: dict
+    """
+    if sleep_time is None:
+        sleep_time = Pool.Default_MotionLoop_SleepTime
+    if states_per_position is None:
+        states_per_position = Pool.Default_MotionLoop_StatesPerPosition
+    result = dict(mode=mode, nb_motors=nb_motors,
+                  motors_per_ctrl=motors_per_ctrl, distance=distance,
+                  sleep_time=sleep_time,
+                  states_per_position=states_per_position)
+    pool, motors, moveables = create_elements(nb_motors, motors_per_ctrl,
+                                              mode)
+    pool.motion_loop_sleep_time = sleep_time
+    pool.motion_loop_states_per_position = states_per_position
+    recorder = EventRecorder()
+    elements = set(motors) | set(moveables)
+    for element in elements:
+        element.add_listener(recorder)
+    try:
+        # state update of all the motors as done by the PoolMonitor
+        monitor = PoolMonitor(pool, auto_start=False)
+        monitor._elem_ids = sorted(motor.id for motor in motors)
+        start = time.perf_counter()
+        monitor.update_state_info()
+        result["monitor_time"] = time.perf_counter() - start
+        # the resumed monitor thread updates once more before stopping
+        monitor._elem_ids = []
+        monitor.stop()
+
+        # complete motion
+        initial = {m: m.get_position(cache=False).value for m in motors}
+        targets = [get_positions(m, distance) for m in moveables]
+        timeout = 10 * (distance / VELOCITY + 2 * ACCELERATION) + 10
+        cpu_time = _get_cpu_time()
+        commands = {}
+        for moveable, target in zip(moveables, targets):
+            commands[moveable] = time.time()
+            moveable.start_move(target)
+        wait_motion(moveables, timeout)
+        end = time.time()
+        cpu_time = _get_cpu_time() - cpu_time
+        first_command = min(commands.values())
+        result["cpu_per_motor"] = \
+            cpu_time / (end - first_command) / nb_motors
+        start_latencies, position_lags, end_latencies = [], [], []
+        nb_position_events = []
+        for motor in motors:
+            # the moveable the motor was moved with
+            command = commands.get(motor, first_command)
+            start_instant = _get_hw_motion(motor).start_instant
+            start_latencies.append(start_instant - command)
+            final = motor.get_position(cache=False).value
+            events = recorder.positions.get(motor, [])
+            events = [e for e in events if e[0] >= command]
+            nb_position_events.append(len(events))
+            lags, final_instant = _position_lags(
+                motor, events, start_instant, initial[motor], final)
+            position_lags.extend(lags)
+            if mode != "group":
+                end_time = recorder.get_not_state_time(
+                    motor, State.Moving, final_instant)
+                if end_time is not None:
+                    end_latencies.append(end_time - final_instant)
+        if mode == "group":
+            last_instant = max(_get_hw_motion(m).start_instant
+                               for m in motors)
+            end_time = recorder.get_not_state_time(moveables[0],
+                                                   State.Moving,
+                                                   last_instant)
+            if end_time is not None:
+                end_latencies.append(end_time - max(
+                    _position_lags(m, [], _get_hw_motion(m).start_instant,
+                                   initial[m], m.get_position().value)[1]
+                    for m in motors))
+        start_event_latencies = []
+        for moveable, command in commands.items():
+            event_time = recorder.get_state_time(moveable, State.Moving,
+                                                 command)
+            if event_time is not None:
+                start_event_latencies.append(event_time - command)
+        result.update(_stats(start_latencies, "start"))
+        result.update(_stats(start_event_latencies, "start_event"))
+        result.update(_stats(position_lags, "position_lag"))
+        result.update(_stats(end_latencies, "end"))
+        result["position_events"] = float(numpy.mean(nb_position_events))
+
+        # stop and abort in the middle of a long motion
+        for action in ("stop", "abort"):
+            recorder.clear()
+            for moveable in moveables:
+                moveable.start_move(get_positions(moveable, 10 * distance))
+            time.sleep(2 * ACCELERATION)
+            latencies = []
+            command = time.time()
+            for moveable in moveables:
+                getattr(moveable, action)()
+            wait_motion(moveables, timeout)
+            for moveable in moveables:
+                event_time = recorder.get_not_state_time(
+                    moveable, State.Moving, command)
+                if event_time is not None:
+                    latencies.append(event_time - command)
+            result.update(_stats(latencies, action))
+    finally:
+        for element in elements:
+            element.remove_listener(recorder)
+        pool.cleanup()
+    return result
+
+
+def get_cases(quick=False):
+    """Returns the benchmark cases: 1 to 500 motors (10 per controller)
+    moved independently, in a motor group and through slit pseudo motors.
+
+    :param quick: reduced number of motors
+    :return: sequence of keyword arguments of :func:`benchmark`
+    :rtype: list<dict>
+    """
+    if quick:
+        nb_motors = (2, 20)
+    else:
+        nb_motors = (2, 10, 50, 100, 500)
+    return [dict(mode=mode, nb_motors=n) for mode in MODES
+            for n in nb_motors]
+
+
+def run(cases, output=None, verbose=True, **kwargs):
+    """Runs the benchmark cases.
+
+    :param cases: sequence of keyword arguments of :func:`benchmark`
+    :param output: JSON results file name (optional)
+    :param verbose: print the results table
+    :param kwargs: keyword arguments of :func:`benchmark` common to all the
+      cases e.g. sleep_time
+    :return: benchmark results: machine and versions information and the
+      results of each case
+    :rtype: dict
+    """
+    fmt = "{:>6} {:>6} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10} {:>8}"
+    if verbose:
+        print(fmt.format("mode", "motors", "start [ms]", "event [ms]",
+                         "lag [ms]", "end [ms]", "stop [ms]", "abort [ms]",
+                         "cpu/mot"))
+    results = []
+    for case in cases:
+        case = dict(case, **kwargs)
+        result = benchmark(**case)
+        results.append(result)
+        if verbose:
+            print(fmt.format(
+                result["mode"], result["nb_motors"],
+                *["{:.2f}".format(result[name + "_median"] * 1E3)
+                  for name in ("start", "start_event", "position_lag",
+                               "end", "stop", "abort")],
+                "{:.4f}".format(result["cpu_per_motor"])))
+    data = dict(date=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                sardana=release.version, python=platform.python_version(),
+                platform=platform.platform(), cpu_count=os.cpu_count(),
+                results=results)
+    if output is not None:
+        with open(output, "w") as output_file:
+            json.dump(data, output_file, indent=1)
+    return data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Motion benchmark")
+    parser.add_argument("-o", "--output", help="JSON results file")
+    parser.add_argument("--quick", action="store_true",
+                        help="reduced number of motors")
+    parser.add_argument("--sleep-time", type=float,
+                        help="motion loop sleep time [s]")
+    parser.add_argument("--states-per-position", type=int,
+                        help="motion loop positions read per state read")
+    args = parser.parse_args()
+    run(get_cases(args.quick), args.output, sleep_time=args.sleep_time,
+        states_per_position=args.states_per_position)
+    sys.exit(0)
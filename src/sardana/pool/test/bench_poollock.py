@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Benchmark of the pool elements locks (not part of the test suite).
+
+Run it with::
+
+    python -m sardana.pool.test.bench_poollock
+"""
+
+import time
+
+from sardana import sardanacustomsettings
+from sardana.pool.poolmonitor import PoolMonitor
+from sardana.pool.poolmotion import PoolMotion
+from sardana.pool.test import (FakePool, createPoolController,
+                               createPoolMotor, createCtrlConf,
+                               createElemConf)
+
+
+def _create_motors(nb_motors, nb_ctrls):
+    pool = FakePool()
+    motors, ctrls = [], []
+    for i in range(nb_ctrls):
+        ctrl_name = "dummymotctrl{:02d}".format(i + 1)
+        ctrl_cfg = createCtrlConf(pool, ctrl_name, "DummyMotorController",
+                                  "DummyMotorController.py")
+        ctrl = createPoolController(pool, ctrl_cfg)
+        pool.add_element(ctrl)
+        ctrls.append(ctrl)
+    for i in range(nb_motors):
+        ctrl = ctrls[i % nb_ctrls]
+        axis = i // nb_ctrls + 1
+        mot_cfg = createElemConf(pool, axis, "mot{:03d}".format(i + 1))
+        motor = createPoolMotor(pool, ctrl, mot_cfg)
+        ctrl.add_element(motor)
+        pool.add_element(motor)
+        motors.append(motor)
+    return pool, motors
+
+
+def benchmark(mode, nb_motors=500, nb_ctrls=5, nb_loops=100):
+    """Measure the monitor and motion loops locking the given motors.
+
+    :param mode: lock mode: "production" or "debug"
+    :param nb_motors: number of motors
+    :param nb_ctrls: number of controllers the motors are distributed on
+    :param nb_loops: number of iterations of each loop
+    :return: time of one monitor and one motion loop iteration [s]
+    :rtype: tuple(float, float)
+    """
+    old_mode = getattr(sardanacustomsettings, "POOL_LOCK_MODE")
+    sardanacustomsettings.POOL_LOCK_MODE = mode
+    try:
+        pool, motors = _create_motors(nb_motors, nb_ctrls)
+    finally:
+        sardanacustomsettings.POOL_LOCK_MODE = old_mode
+    monitor = PoolMonitor(pool, auto_start=False)
+    monitor._elem_ids = sorted(motor.id for motor in motors)
+    motion = PoolMotion(motors[0])
+    for motor in motors:
+        motion.add_element(motor)
+    try:
+        start = time.perf_counter()
+        for _ in range(nb_loops):
+            monitor.update_state_info()
+        monitor_time = (time.perf_counter() - start) / nb_loops
+        start = time.perf_counter()
+        for _ in range(nb_loops):
+            motion.read_state_info(serial=True)
+        motion_time = (time.perf_counter() - start) / nb_loops
+    finally:
+        monitor.stop()
+        pool.cleanup()
+    return monitor_time, motion_time
+
+
+if __name__ == "__main__":
+    print("{:>12} {:>8} {:>14} {:>14}".format(
+        "mode", "motors", "monitor [ms]", "motion [ms]"))
+    for nb_motors in (100, 500):
+        for mode in ("production", "debug"):
+            times = benchmark(mode, nb_motors)
+            print("{:>12} {:>8} {:>14.3f} {:>14.3f}".format(
+                mode, nb_motors, *[t * 1E3 for t in times]))
@@ -36,6 +36,8 @@ class FakePool(object):
     motion_loop_sleep_time = 0.1
     motion_loop_states_per_position = 10
     drift_correction = True
+    interrupt_timeout = 3.0
+    motion_start_strategy = "serial"
 
     def __init__(self, poolpath=[], loglevel=None):
         self.ctrl_manager = ControllerManager()
@@ -54,6 +56,11 @@ class FakePool(object):
     def get_element(self, id):
         return self.elements[id]
 
+    get_element_by_id = get_element
+
+    def add_listener(self, listener):
+        pass
+
     def get_element_by_full_name(self, full_name):
         return self.elements_by_full_name[full_name]
 
@@ -40,7 +40,9 @@ from sardana.pool.poolacquisition import PoolAcquisitionHardware, \
 from sardana.sardanathreadpool import get_thread_pool
 from sardana.pool.test import createControllerConfiguration, \
     createTimerableControllerConfiguration, BasePoolTestCase, FakeElement, \
-    AttributeListener
+    AttributeListener, FakePool
+from sardana.pool.test.bench_acquisition import PointRecorder, \
+    create_measurement_group
 
 
 class AcquisitionTestCase(BasePoolTestCase):
@@ -711,3 +713,48 @@ class Acquisition2DHardwareGateRefTestCase(BaseAcquisitionHardwareTestCase,
         self.channel.value_ref_enabled = True
         axis = self.channel.axis
         self.channel_ctrl.set_axis_par(axis, "value_ref_enabled", True)
+
+
+@insertTest(helper_name='acquire', synchronization="software",
+            channel_type="ct", nb_points=10)
+@insertTest(helper_name='acquire', synchronization="hardware",
+            channel_type="ct", nb_points=10)
+@insertTest(helper_name='acquire', synchronization="start",
+            channel_type="ct", nb_points=10)
+@insertTest(helper_name='acquire', synchronization="start",
+            channel_type="2d", nb_points=3)
+class MeasurementGroupPointsTestCase(TestCase):
+    """Test that each point of a measurement group acquisition is delivered
+    exactly once by each channel."""
+
+    def setUp(self):
+        self.pool = FakePool()
+
+    def acquire(self, synchronization, channel_type, nb_points,
+                nb_channels=2, integ_time=0.01, latency_time=0.01):
+        mg, channels = create_measurement_group(self.pool, channel_type,
+                                                nb_channels,
+                                                synchronization)
+        mg.set_synch_description([{
+            SynchParam.Delay: {SynchDomain.Time: 0},
+            SynchParam.Active: {SynchDomain.Time: integ_time},
+            SynchParam.Total: {SynchDomain.Time: integ_time + latency_time},
+            SynchParam.Repeats: nb_points}])
+        recorder = PointRecorder(nb_channels, nb_points)
+        for channel in channels:
+            channel.add_listener(recorder)
+        mg.prepare()
+        mg.start_acquisition()
+        start = time.time()
+        while mg.acquisition.is_running():
+            if time.time() - start > 10:
+                mg.stop()
+                self.fail("acquisition did not finish")
+            time.sleep(0.01)
+        for channel in channels:
+            channel.remove_listener(recorder)
+        numpy.testing.assert_array_equal(recorder.counts, nb_channels)
+
+    def tearDown(self):
+        self.pool.cleanup()
+        self.pool = None
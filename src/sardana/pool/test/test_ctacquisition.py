@@ -78,6 +78,8 @@ class PoolMeasurementGroupTestCase(unittest.TestCase):
         while acq.is_running():
             time.sleep(0.05)
         self.assertEqual(self._pct.value.value, integ_time, msg)
+        # the notifier is removed when the acquisition finishes
+        self.assertIsNone(self._pct.controller.ctrl._notifier)
 
     def tearDown(self):
         unittest.TestCase.tearDown(self)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import time
+import threading
+import unittest
+
+from sardana import State
+from sardana.sardanathreadpool import get_thread_pool, \
+    get_read_thread_pool
+from sardana.pool.poolaction import PoolAction, interrupt_controllers
+
+
+class SlowController(object):
+    """Controller mock which takes *delay* seconds to stop its elements"""
+
+    def __init__(self, name, delay, error=False):
+        self.name = name
+        self.delay = delay
+        self.error = error
+
+    def stop_elements(self, elements=None):
+        time.sleep(self.delay)
+        if self.error:
+            raise Exception("%s not stopped" % self.name)
+        return []
+
+    abort_elements = emergency_break = stop_elements
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+class StateController(object):
+    """Controller mock which takes *delay* seconds to read the state of its
+    elements and records the reading threads"""
+
+    def __init__(self, id_, delay=0):
+        self._id = id_
+        self.delay = delay
+        self.elements = {}
+        self.threads = []
+
+    def raw_read_axis_states(self, axes):
+        self.threads.append(threading.current_thread())
+        time.sleep(self.delay)
+        return {self.elements[axis]: (State.On, "") for axis in axes}, False
+
+
+class Element(object):
+    """Element mock of a StateController"""
+
+    def __init__(self, id_, controller, axis):
+        self._id = id_
+        self.controller = controller
+        self.axis = axis
+        controller.elements[axis] = self
+
+
+class InterruptControllersTestCase(unittest.TestCase):
+    """Unittest of interrupt_controllers function"""
+
+    def test_interrupt_concurrent(self):
+        for operation in ("stop", "abort", "emergency_break"):
+            with self.subTest(operation=operation):
+                ctrls = [SlowController("ctrl%d" % i, .2) for i in range(5)]
+                start = time.time()
+                result = interrupt_controllers(dict.fromkeys(ctrls),
+                                               operation, timeout=3)
+                self.assertLess(time.time() - start, .2 * len(ctrls))
+                self.assertEqual(list(result.keys()), ctrls)
+                for ctrl_result in result.values():
+                    self.assertGreaterEqual(ctrl_result["latency"], .2)
+                    self.assertIsNone(ctrl_result["error"])
+                    self.assertEqual(ctrl_result["error_elements"], [])
+
+    def test_interrupt_timeout_and_error(self):
+        fast = SlowController("fast", 0)
+        slow = SlowController("slow", 2)
+        failing = SlowController("failing", 0, error=True)
+        start = time.time()
+        result = interrupt_controllers({fast: None, slow: None,
+                                        failing: None}, timeout=.2)
+        self.assertLess(time.time() - start, 1)
+        self.assertIsNotNone(result[fast]["latency"])
+        self.assertIsNone(result[slow]["latency"])
+        self.assertIn("failing not stopped", result[failing]["error"])
+
+
+class PoolActionReadTestCase(unittest.TestCase):
+    """Unittest of PoolAction reading many controllers"""
+
+    def test_read_state_info_in_thread_pool(self):
+        """Test that actions run by all the workers of the thread pool
+        do not wait forever for the read jobs"""
+        th_pool = get_thread_pool()
+        ctrls = [StateController(1), StateController(2)]
+        elements = [Element(3, ctrls[0], 1), Element(4, ctrls[1], 1)]
+        actions = []
+        for _ in range(th_pool.size):
+            action = PoolAction(elements[0])
+            for element in elements:
+                action.add_element(element)
+            actions.append(action)
+        barrier = threading.Barrier(len(actions), timeout=5)
+        done = threading.Semaphore(0)
+        results = []
+
+        def read(action):
+            barrier.wait()
+            results.append(action.raw_read_state_info())
+            done.release()
+
+        for action in actions:
+            th_pool.add(read, None, action)
+        for _ in actions:
+            self.assertTrue(done.acquire(timeout=5), "read did not finish")
+        expected = {element: (State.On, "") for element in elements}
+        self.assertEqual(results, [expected] * len(actions))
+        read_pool = get_read_thread_pool()
+        for ctrl in ctrls:
+            for thread in ctrl.threads:
+                self.assertIs(thread.pool, read_pool)
+
+    def test_read_state_info_concurrent(self):
+        """Test that the controllers are read concurrently"""
+        ctrls = [StateController(i, delay=.2) for i in range(1, 4)]
+        elements = [Element(4 + i, ctrl, 1) for i, ctrl in enumerate(ctrls)]
+        action = PoolAction(elements[0])
+        for element in elements:
+            action.add_element(element)
+        start = time.time()
+        state_info = action.raw_read_state_info()
+        self.assertLess(time.time() - start, .2 * len(ctrls))
+        self.assertEqual(len(state_info), len(ctrls))
@@ -44,6 +44,24 @@ class PoolControllerTestCase(unittest.TestCase):
               'PoolController instance'
         self.assertIsInstance(self.pc, PoolController, msg)
 
+    def test_prepared(self):
+        """Verify that the preparation fingerprint is kept until any
+        controller parameter is set"""
+        fingerprint = (1, 0.1, 1, 0)
+        self.assertFalse(self.pc.is_prepared("load", fingerprint))
+        self.pc.set_prepared("load", fingerprint)
+        self.assertTrue(self.pc.is_prepared("load", fingerprint))
+        self.assertFalse(self.pc.is_prepared("load", (1, 0.2, 1, 0)))
+        self.pc.set_ctrl_par("synchronization", 0)
+        self.assertFalse(self.pc.is_prepared("load", fingerprint))
+
+    def test_prepared_load_always(self):
+        """Verify that controllers which load always are never prepared"""
+        fingerprint = (1, 0.1, 1, 0)
+        self.pc.ctrl.load_always = True
+        self.pc.set_prepared("load", fingerprint)
+        self.assertFalse(self.pc.is_prepared("load", fingerprint))
+
     def tearDown(self):
         unittest.TestCase.tearDown(self)
         self.pc = None
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests of the pool elements locks.
+
+The benchmark of the locks is in :mod:`sardana.pool.test.bench_poollock`.
+"""
+
+import time
+import threading
+import unittest
+
+from sardana import sardanacustomsettings
+from sardana.pool import poollock
+from sardana.pool.poollock import LockProfiler, ProfiledLock, create_lock, \
+    profile_action
+from sardana.pool.test import (FakePool, createPoolController,
+                               createPoolMotor, createCtrlConf,
+                               createElemConf)
+
+
+class LockModeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._mode = getattr(sardanacustomsettings, "POOL_LOCK_MODE")
+        self._profiler = poollock._LOCK_PROFILER
+
+    def tearDown(self):
+        sardanacustomsettings.POOL_LOCK_MODE = self._mode
+        poollock._LOCK_PROFILER = self._profiler
+
+    def test_production(self):
+        sardanacustomsettings.POOL_LOCK_MODE = "production"
+        lock = create_lock("mot01")
+        self.assertIsInstance(lock, type(threading.RLock()))
+
+    def test_debug(self):
+        sardanacustomsettings.POOL_LOCK_MODE = "debug"
+        lock = create_lock("mot01")
+        self.assertIsInstance(lock, ProfiledLock)
+        self.assertIsInstance(poollock.get_lock_profiler(), LockProfiler)
+
+    def test_invalid(self):
+        sardanacustomsettings.POOL_LOCK_MODE = "fast"
+        self.assertRaises(ValueError, create_lock, "mot01")
+
+
+class LockProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._profiler = poollock._LOCK_PROFILER
+        poollock._LOCK_PROFILER = self.profiler = LockProfiler()
+        self.lock = ProfiledLock("mot01", self.profiler)
+
+    def tearDown(self):
+        poollock._LOCK_PROFILER = self._profiler
+
+    def test_uncontended(self):
+        with profile_action("mot01.Motion"):
+            with self.lock:
+                # re-entrant
+                self.assertTrue(self.lock.acquire(blocking=False))
+                self.lock.release()
+        self.assertIsNone(self.profiler.get_action())
+        stats = self.profiler.get_stats()
+        self.assertEqual(list(stats), [("mot01", "mot01.Motion")])
+        self.assertEqual(stats["mot01", "mot01.Motion"]["count"], 2)
+        self.assertEqual(stats["mot01", "mot01.Motion"]["contended"], 0)
+
+    def test_contended(self):
+        acquired, release = threading.Event(), threading.Event()
+
+        def hold():
+            with self.lock:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        acquired.wait()
+        with profile_action("PoolMonitor"):
+            self.assertFalse(self.lock.acquire(blocking=False))
+        threading.Timer(0.05, release.set).start()
+        with profile_action("mot01.Motion"):
+            with self.lock:
+                pass
+        thread.join()
+        by_action = self.profiler.get_stats(by="action")
+        self.assertEqual(by_action["PoolMonitor"]["contended"], 1)
+        self.assertEqual(by_action["mot01.Motion"]["contended"], 1)
+        self.assertGreater(by_action["mot01.Motion"]["wait"], 0.01)
+        by_element = self.profiler.get_stats(by="element")
+        self.assertEqual(by_element["mot01"]["count"], 3)
+        self.assertIn("mot01", self.profiler.report())
+        self.profiler.reset()
+        self.assertEqual(self.profiler.get_stats(), {})
+
+
+class LockSemanticsTestCase(unittest.TestCase):
+    """Test of the pool elements locks semantics in all the lock modes"""
+
+    MODES = ("production", "debug")
+
+    def setUp(self):
+        self._mode = getattr(sardanacustomsettings, "POOL_LOCK_MODE")
+        self._profiler = poollock._LOCK_PROFILER
+
+    def tearDown(self):
+        sardanacustomsettings.POOL_LOCK_MODE = self._mode
+        poollock._LOCK_PROFILER = self._profiler
+
+    def _create_lock(self, mode):
+        sardanacustomsettings.POOL_LOCK_MODE = mode
+        return create_lock("mot01")
+
+    def _acquire_in_thread(self, lock, blocking=False):
+        # returns if other thread could acquire the lock (it releases it)
+        ret = []
+
+        def acquire():
+            ret.append(lock.acquire(blocking))
+            if ret[0]:
+                lock.release()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join(2)
+        return ret == [True]
+
+    def test_contention(self):
+        for mode in self.MODES:
+            with self.subTest(mode=mode):
+                lock = self._create_lock(mode)
+                events = []
+                lock.acquire()
+                self.assertFalse(self._acquire_in_thread(lock))
+
+                def wait_lock():
+                    with lock:
+                        events.append("acquired")
+
+                thread = threading.Thread(target=wait_lock)
+                thread.start()
+                time.sleep(0.05)
+                events.append("released")
+                lock.release()
+                thread.join(2)
+                self.assertEqual(events, ["released", "acquired"])
+
+    def test_reentrancy(self):
+        for mode in self.MODES:
+            with self.subTest(mode=mode):
+                lock = self._create_lock(mode)
+                self.assertTrue(lock.acquire())
+                self.assertTrue(lock.acquire(False))
+                lock.release()
+                # still owned by this thread
+                self.assertFalse(self._acquire_in_thread(lock))
+                lock.release()
+                self.assertTrue(self._acquire_in_thread(lock))
+                # not owned
+                self.assertRaises(RuntimeError, lock.release)
+
+    def test_release_on_error(self):
+        for mode in self.MODES:
+            with self.subTest(mode=mode):
+                lock = self._create_lock(mode)
+                with self.assertRaises(ValueError):
+                    with lock:
+                        with lock:
+                            raise ValueError()
+                self.assertTrue(self._acquire_in_thread(lock))
+
+    def test_element(self):
+        for mode in self.MODES:
+            with self.subTest(mode=mode):
+                sardanacustomsettings.POOL_LOCK_MODE = mode
+                pool = FakePool()
+                ctrl_cfg = createCtrlConf(pool, "dummymotctrl01",
+                                          "DummyMotorController",
+                                          "DummyMotorController.py")
+                ctrl = createPoolController(pool, ctrl_cfg)
+                pool.add_element(ctrl)
+                motor = createPoolMotor(pool, ctrl,
+                                        createElemConf(pool, 1, "mot01"))
+                try:
+                    with self.assertRaises(ValueError):
+                        with motor:
+                            self.assertTrue(motor.lock(blocking=False))
+                            motor.unlock()
+                            raise ValueError()
+                    self.assertTrue(self._acquire_in_thread(motor._lock))
+                finally:
+                    pool.cleanup()
@@ -23,13 +23,18 @@
 ##
 ##############################################################################
 
+import time
 import unittest
 
 from sardana.pool.poolmotion import PoolMotion
 from sardana.sardanadefs import State
-from sardana.pool.test import (FakePool, createPoolController,
-                               createPoolMotor, dummyPoolMotorCtrlConf01,
-                               dummyMotorConf01, dummyMotorConf02)
+from sardana.pool.test import (BasePoolTestCase, FakePool,
+                               createPoolController, createPoolMotor,
+                               dummyPoolMotorCtrlConf01, dummyMotorConf01,
+                               dummyMotorConf02)
+from sardana.pool.test.bench_motion import (MODES, EventRecorder,
+                                            create_elements, get_positions,
+                                            wait_motion, no_tango_limits)
 
 
 class PoolMotionTestCase(unittest.TestCase):
@@ -121,3 +126,93 @@ class PoolMotionTestCase(unittest.TestCase):
         self.cfg = None
         self.dummy_mot = None
         unittest.TestCase.tearDown(self)
+
+
+class PoolMotionConcurrentStartTestCase(BasePoolTestCase, unittest.TestCase):
+    """Unittest of the concurrent start of PoolMotion"""
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        self.mot1 = self.mots["_test_mot_1_1"]
+        self.mot2 = self.mots["_test_mot_2_1"]
+        self.motion = PoolMotion(self.mot1)
+        self.motion.add_element(self.mot1)
+        self.motion.add_element(self.mot2)
+        self.items = {self.mot1: (1, 1, False, 0),
+                      self.mot2: (1, 1, False, 0)}
+
+    def test_start_timeout(self):
+        """Verify that a not responding controller does not block the start
+        forever and that the motion is not started"""
+        ctrl = self.ctrls["_test_mot_ctrl_2"].ctrl
+        pre_start_all = ctrl.PreStartAll
+
+        def slow_pre_start_all():
+            time.sleep(1)
+            pre_start_all()
+
+        ctrl.PreStartAll = slow_pre_start_all
+        start = time.time()
+        with self.assertRaises(TimeoutError) as context:
+            self.motion.start_action(items=self.items,
+                                     start_strategy="concurrent",
+                                     start_timeout=.2)
+        self.assertLess(time.time() - start, 1)
+        self.assertIn("_test_mot_ctrl_2.PreStartAll",
+                      str(context.exception))
+        self.assertNotEqual(self.mot1.get_state(cache=True), State.Moving)
+        # let the slow controller thread finish
+        time.sleep(1)
+        self.assertNotEqual(self.mot2.get_state(cache=True), State.Moving)
+
+    def test_start(self):
+        """Verify that the concurrent start moves all the motors"""
+        self.motion.start_action(items=self.items,
+                                 start_strategy="concurrent",
+                                 start_timeout=1)
+        self.assertEqual(self.mot1.get_state(cache=True), State.Moving)
+        self.assertEqual(self.mot2.get_state(cache=True), State.Moving)
+        self.motion.abort_action()
+
+    def tearDown(self):
+        self.motion = None
+        BasePoolTestCase.tearDown(self)
+
+
+class ConcurrentMotionTestCase(unittest.TestCase):
+    """Test motions of more motors and controllers than the workers of the
+    Sardana thread pool"""
+
+    def test_motion(self):
+        """Verify that all the motors reach their target positions and that
+        the moveables notify the motion"""
+        for mode in MODES:
+            with self.subTest(mode=mode), no_tango_limits():
+                self._move(mode, nb_motors=12, motors_per_ctrl=2, distance=1)
+
+    def _move(self, mode, nb_motors, motors_per_ctrl, distance):
+        pool, motors, moveables = create_elements(nb_motors,
+                                                  motors_per_ctrl, mode)
+        pool.motion_loop_sleep_time = 0.01
+        recorder = EventRecorder()
+        for moveable in moveables:
+            moveable.add_listener(recorder)
+        try:
+            initial = [m.get_position(cache=False).value for m in motors]
+            command = time.time()
+            for moveable in moveables:
+                moveable.start_move(get_positions(moveable, distance))
+            wait_motion(moveables, timeout=10)
+            for motor, position in zip(motors, initial):
+                self.assertAlmostEqual(motor.get_position(cache=False).value,
+                                       position + distance)
+                self.assertEqual(motor.get_state(cache=False), State.On)
+            for moveable in moveables:
+                self.assertIsNotNone(recorder.get_state_time(
+                    moveable, State.Moving, command))
+                self.assertIsNotNone(recorder.get_not_state_time(
+                    moveable, State.Moving, command))
+        finally:
+            for moveable in moveables:
+                moveable.remove_listener(recorder)
+            pool.cleanup()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import json
+import unittest
+
+from sardana.pool.controller import MotorController
+from sardana.pool.pooltelemetry import Histogram, PoolTelemetry, \
+    get_telemetry, instrument_controller, CONTROLLER, LOCK, LOOP
+from sardana.pool.poolmotion import PoolMotion
+from sardana.pool.test import BasePoolTestCase
+
+
+class HistogramTestCase(unittest.TestCase):
+
+    def test_add(self):
+        histogram = Histogram()
+        for value in (0.5, 1, 3, 3.5, 1000):
+            histogram.add(value)
+        data = histogram.to_dict()
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(data["max"], 1000)
+        self.assertEqual(data["buckets"][:3], [1, 1, 2])
+        self.assertEqual(len(data["buckets"]), 11)
+        histogram.add(1E30)
+        self.assertEqual(histogram.buckets[-1], 1)
+
+
+class PoolTelemetryTestCase(unittest.TestCase):
+
+    def test_get_data(self):
+        telemetry = PoolTelemetry()
+        histogram = telemetry.get_histogram(CONTROLLER, "ctrl01.StateAll")
+        telemetry.add_time(CONTROLLER, "ctrl01.StateAll", 0.002)
+        telemetry.add_time(LOCK, "mot01.Motion", 0.0)
+        telemetry.get_histogram(LOOP, "mot01.Motion.action_loop")
+        data = json.loads(telemetry.encode(reset=True))
+        self.assertEqual(data[CONTROLLER]["ctrl01.StateAll"]["total"], 2000)
+        self.assertEqual(data[LOCK]["mot01.Motion"]["count"], 1)
+        # empty histograms are not reported
+        self.assertEqual(data[LOOP], {})
+        self.assertEqual(telemetry.get_data()[CONTROLLER], {})
+        # histograms remain valid after the reset
+        telemetry.add_histogram_time(histogram, 0.001)
+        self.assertEqual(telemetry.get_data()[CONTROLLER]["ctrl01.StateAll"]
+                         ["count"], 1)
+
+    def test_instrument_controller(self):
+
+        class Ctrl(MotorController):
+
+            def StateOne(self, axis):
+                return self.calls.append(axis)
+
+        ctrl = Ctrl("telemetryctrl01", {})
+        ctrl.calls = []
+        instrument_controller("telemetryctrl01", ctrl)
+        ctrl.StateOne(1)
+        ctrl.PreStateAll()
+        self.assertEqual(ctrl.calls, [1])
+        data = get_telemetry().get_data()[CONTROLLER]
+        self.assertEqual(data["telemetryctrl01.StateOne"]["count"], 1)
+        # the default implementations are not instrumented
+        self.assertNotIn("telemetryctrl01.PreStateAll", data)
+
+
+class PoolActionTelemetryTestCase(BasePoolTestCase, unittest.TestCase):
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        get_telemetry().reset()
+
+    def test_read_state_info(self):
+        mot = self.mots["_test_mot_1_1"]
+        motion = PoolMotion(mot, "telemetry.Motion")
+        motion.add_element(mot)
+        motion._iteration_start = 0
+        motion.read_state_info(serial=True)
+        motion.read_state_info(serial=True)
+        data = get_telemetry().get_data()
+        self.assertEqual(data[LOOP]["telemetry.Motion.read_state_info"]
+                         ["count"], 2)
+        self.assertEqual(data[LOOP]["telemetry.Motion.iteration"]["count"],
+                         2)
+        self.assertEqual(data[LOCK]["telemetry.Motion"]["count"], 2)
+        ctrl_name = mot.controller.name
+        self.assertEqual(data[CONTROLLER][ctrl_name + ".StateOne"]["count"],
+                         2)
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
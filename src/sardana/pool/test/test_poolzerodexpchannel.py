@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+
+import numpy
+import pytest
+
+from sardana.pool.poolzerodexpchannel import get_accumulation_class
+
+
+VALUES = numpy.sin(numpy.linspace(0, 10, 50000)) + 2
+TIMESTAMPS = numpy.cumsum(numpy.random.uniform(0.001, 0.002, len(VALUES)))
+
+
+def _trapezoid(values, timestamps):
+    return (numpy.diff(timestamps) * (values[1:] + values[:-1])).sum() / 2
+
+
+def _accumulate(ctype, values, timestamps, batch=1000, **kwargs):
+    accumulation = get_accumulation_class(ctype)(**kwargs)
+    for i in range(0, len(values), batch):
+        accumulation.append_many(values[i:i + batch],
+                                 timestamps[i:i + batch])
+    return accumulation
+
+
+@pytest.mark.parametrize("ctype, expected", [
+    ("Last", VALUES[-1]),
+    ("Sum", VALUES.sum()),
+    ("Average", VALUES.mean()),
+    ("Integral", _trapezoid(VALUES, TIMESTAMPS)
+     / (TIMESTAMPS[-1] - TIMESTAMPS[0]))
+])
+def test_accumulation_value(ctype, expected):
+    accumulation = _accumulate(ctype, VALUES, TIMESTAMPS)
+    assert accumulation.value == pytest.approx(expected)
+    assert accumulation.timestamp == TIMESTAMPS[-1]
+
+
+def test_accumulation_statistics():
+    accumulation = _accumulate("Average", VALUES, TIMESTAMPS, batch=777)
+    assert accumulation.nb_points == len(VALUES)
+    assert accumulation.variance == pytest.approx(VALUES.var())
+    assert accumulation.min == VALUES.min()
+    assert accumulation.max == VALUES.max()
+    numpy.testing.assert_array_equal(accumulation.get_value_buffer(), VALUES)
+    numpy.testing.assert_array_equal(accumulation.get_time_buffer(),
+                                     TIMESTAMPS)
+
+
+def test_accumulation_single_append():
+    accumulation = get_accumulation_class("Integral")()
+    for value, timestamp in zip(VALUES[:100], TIMESTAMPS[:100]):
+        accumulation.append(value, timestamp)
+    expected = _trapezoid(VALUES[:100], TIMESTAMPS[:100]) \
+        / (TIMESTAMPS[99] - TIMESTAMPS[0])
+    assert accumulation.value == pytest.approx(expected)
+
+
+def test_accumulation_invalid_values():
+    accumulation = get_accumulation_class("Average")()
+    accumulation.append_many([1., None, 3., None], [1., 2., 3., 4.])
+    assert accumulation.nb_points == 4
+    assert accumulation.nb_valid_points == 2
+    assert accumulation.value == 2.
+    assert accumulation.integral == 4.
+
+
+def test_accumulation_without_samples():
+    accumulation = _accumulate("Sum", VALUES, TIMESTAMPS, keep_samples=False)
+    assert accumulation.value == pytest.approx(VALUES.sum())
+    assert len(accumulation.get_value_buffer()) == 0
+    assert len(accumulation.get_time_buffer()) == 0
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+
+import unittest
+
+from sardana.sardanadefs import State
+from sardana.pool.pool import Pool
+from sardana.pool.test import (FakePool, createPoolController,
+                               createCtrlConf, createPoolMotor,
+                               createElemConf)
+
+
+class ReadPositionsPool(FakePool):
+    """FakePool with the Pool's positions reading"""
+
+    ReadPositionsCachePolicies = Pool.ReadPositionsCachePolicies
+    read_positions = Pool.read_positions
+    _read_motors = Pool._read_motors
+
+    def get_element_by_name(self, name):
+        for element in self.elements.values():
+            if element.name == name:
+                return element
+        raise KeyError("There is no element with name %s" % name)
+
+
+class ReadPositionsTestCase(unittest.TestCase):
+    """Unittest of Pool.read_positions"""
+
+    def setUp(self):
+        self.pool = ReadPositionsPool()
+        ctrl_conf = createCtrlConf(self.pool, "_test_mot_ctrl_1",
+                                   "DummyMotorController",
+                                   "DummyMotorController.py")
+        self.ctrl = createPoolController(self.pool, ctrl_conf)
+        self.pool.add_element(self.ctrl)
+        motor_conf = createElemConf(self.pool, 1, "_test_mot_1_1")
+        self.motor = createPoolMotor(self.pool, self.ctrl, motor_conf)
+        self.ctrl.add_element(self.motor)
+        self.pool.add_element(self.motor)
+
+    def tearDown(self):
+        self.pool.cleanup()
+
+    def test_unknown_name(self):
+        """Test that an unknown name does not prevent reading the others"""
+        result = self.pool.read_positions(["unknown", self.motor.name,
+                                           self.ctrl.name], "hardware")
+        self.assertEqual([data["name"] for data in result],
+                         ["unknown", self.motor.name, self.ctrl.name])
+        unknown, motor, ctrl = result
+        self.assertIsNone(unknown["state"])
+        self.assertIsNone(unknown["position"])
+        self.assertIn("KeyError", unknown["error"])
+        self.assertIsNone(motor["error"])
+        self.assertEqual(motor["state"], State.whatis(State.On))
+        self.assertEqual(motor["position"], 0)
+        self.assertEqual(motor["dial_position"], 0)
+        self.assertIsNone(ctrl["state"])
+        self.assertIn("TypeError", ctrl["error"])
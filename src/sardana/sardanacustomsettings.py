@@ -43,12 +43,26 @@ UNITTEST_POOL_NAME = "pool/demo1/1"
 LOG_FILES_SIZE = 1e7
 LOG_BCK_COUNT = 5
 
+#: Locks of the Pool elements. Available options:
+#:
+#: - "production" (default) - bare re-entrant locks
+#: - "debug" - locks recording the time spent waiting for them per element
+#:   and per action in the lock profiler
+#:   (see :func:`sardana.pool.poollock.get_lock_profiler`)
+POOL_LOCK_MODE = "production"
+
 #: Input handler for spock interactive macros. Accepted values are:
 #:
 #: - "CLI": Input via spock command line. This is the default.
 #: - "Qt": Input via Qt dialogs
 SPOCK_INPUT_HANDLER = "CLI"
 
+#: Use the on-disk cache (in the spock profile directory) of the MacroServer
+#: elements and macros information to reach the spock prompt faster. The
+#: cache is used only if it is up to date with the MacroServer elements
+#: revision and it is reconciled with the MacroServer in the background.
+SPOCK_ELEMENTS_CACHE = True
+
 #: Use this map in order to avoid ambiguity with scan recorders (file) if
 #: extension is intended to be the recorder selector.
 #: Set it to a dict<str, str> where:
@@ -23,12 +23,9 @@
 ##
 ##############################################################################
 
-"""This module contains the function to access sardana thread pool"""
+"""This module contains the functions to access sardana thread pools"""
 
-
-
-
-__all__ = ["get_thread_pool"]
+__all__ = ["get_thread_pool", "get_read_thread_pool"]
 
 __docformat__ = 'restructuredtext'
 
@@ -39,6 +36,7 @@ from taurus.core.util.threadpool import ThreadPool, Worker
 
 __thread_pool_lock = threading.Lock()
 __thread_pool = None
+__read_thread_pool = None
 
 
 class OmniWorker(Worker):
@@ -64,6 +62,19 @@ class OmniWorker(Worker):
                 Worker.run(self)
 
 
+def _create_thread_pool(name):
+    # protect older versions of Taurus (without the worker_cls
+    # argument) remove it whenever we bump Taurus dependency
+    try:
+        return ThreadPool(name=name, Psize=10, worker_cls=OmniWorker)
+    except TypeError:
+        import taurus
+        taurus.warning("Your Sardana system is affected by bug "
+                       "tango-controls/pytango#307. Please use "
+                       "Taurus with taurus-org/taurus#1081.")
+        return ThreadPool(name=name, Psize=10)
+
+
 def get_thread_pool():
     """Returns the global pool of threads for Sardana
 
@@ -74,16 +85,21 @@ def get_thread_pool():
     global __thread_pool_lock
     with __thread_pool_lock:
         if __thread_pool is None:
-            # protect older versions of Taurus (without the worker_cls
-            # argument) remove it whenever we bump Taurus dependency
-            try:
-                __thread_pool = ThreadPool(name="SardanaTP", Psize=10,
-                                           worker_cls=OmniWorker)
-            except TypeError:
-                import taurus
-                taurus.warning("Your Sardana system is affected by bug "
-                               "tango-controls/pytango#307. Please use "
-                               "Taurus with taurus-org/taurus#1081.")
-                __thread_pool = ThreadPool(name="SardanaTP", Psize=10)
-
+            __thread_pool = _create_thread_pool("SardanaTP")
         return __thread_pool
+
+
+def get_read_thread_pool():
+    """Returns the pool of threads reading the controllers for the Pool
+    actions. The action loops run in the global pool of threads and wait for
+    the read jobs, so these are executed by a separate pool - otherwise
+    the loops occupying all the workers would wait forever.
+
+    :return: the pool of threads reading the controllers
+    :rtype: taurus.core.util.ThreadPool"""
+
+    global __read_thread_pool
+    with __thread_pool_lock:
+        if __read_thread_pool is None:
+            __read_thread_pool = _create_thread_pool("SardanaReadTP")
+        return __read_thread_pool
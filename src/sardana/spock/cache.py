@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides the spock on-disk cache of the MacroServer elements"""
+
+__all__ = ['ElementsCache']
+
+import os
+import json
+import tempfile
+
+from sardana import release
+
+
+class ElementsCache(object):
+    """On-disk cache of the MacroServer elements information (elements
+    and macros), the same data as the MacroServer Elements attribute.
+
+    The cache is valid only for the MacroServer and the elements revision
+    it was saved for, and for the same cache format and sardana versions.
+    """
+
+    #: version of the cache file format
+    Version = 1
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def _get_key(self, macro_server, revision):
+        return dict(version=self.Version, sardana=release.version,
+                    macro_server=macro_server, revision=revision)
+
+    def load(self, macro_server, revision):
+        """Returns the cached elements data.
+
+        :param macro_server: MacroServer full name
+        :type macro_server: :obj:`str`
+        :param revision: current elements revision of the MacroServer
+        :type revision: :obj:`str`
+        :return: elements data or None if there is no valid cache
+        :rtype: :obj:`list` <:obj:`dict`> or None
+        """
+        try:
+            with open(self.file_name) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if cache.get('key') != self._get_key(macro_server, revision):
+            return None
+        return cache.get('elements')
+
+    def save(self, macro_server, revision, elements):
+        """Saves the elements data. The file is replaced atomically so
+        concurrent spock sessions never read a partial cache.
+
+        :param macro_server: MacroServer full name
+        :type macro_server: :obj:`str`
+        :param revision: elements revision of the MacroServer
+        :type revision: :obj:`str`
+        :param elements: elements data
+        :type elements: :obj:`list` <:obj:`dict`>
+        """
+        cache = dict(key=self._get_key(macro_server, revision),
+                     elements=elements)
+        directory = os.path.dirname(os.path.abspath(self.file_name))
+        fd, tmp_name = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(tmp_name, self.file_name)
+        except Exception:
+            os.remove(tmp_name)
+            raise
+
+    def clear(self):
+        """Removes the cache file."""
+        try:
+            os.remove(self.file_name)
+        except OSError:
+            pass
@@ -31,6 +31,7 @@ __all__ = ['GUIViewer', 'SpockBaseDoor', 'QSpockDoor', 'SpockDoor',
 
 import os
 import ctypes
+import threading
 import PyTango
 
 from taurus.core import TaurusEventType, TaurusSWDevState, TaurusDevState
@@ -39,6 +40,7 @@ from sardana.sardanautils import is_pure_str, is_non_str_seq
 from sardana.spock import genutils
 from sardana.util.parser import ParamParser
 from sardana.spock.inputhandler import SpockInputHandler, InputHandler
+from sardana.spock.cache import ElementsCache
 from sardana import sardanacustomsettings
 
 CHANGE_EVTS = TaurusEventType.Change, TaurusEventType.Periodic
@@ -591,22 +593,133 @@ class SpockDoor(SpockBaseDoor):
         return self.processRecordData(data)
 
 
+def run_macro_magic(macro_name, parameter_s=''):
+    """Run a macro from its magic command and return its result. It is the
+    single implementation behind all the macro magic commands.
+
+    :param macro_name: macro name
+    :type macro_name: :obj:`str`
+    :param parameter_s: macro parameters as typed in the command line
+    :type parameter_s: :obj:`str`
+    """
+    door = genutils.get_door()
+    ms = genutils.get_macro_server()
+    params_def = ms.getMacroInfoObj(macro_name).parameters
+    parameters = split_macro_parameters(parameter_s, params_def)
+    door.runMacro(macro_name, parameters, synch=True)
+    macro = door.getLastRunningMacro()
+    if macro is not None:  # maybe none if macro was aborted
+        return macro.getResult()
+
+
+class MacroMagic(object):
+    """Magic command of a macro. It only keeps the macro name and
+    documentation, the call is dispatched to :func:`run_macro_magic`."""
+
+    def __init__(self, macro_name, doc=None):
+        self.__name__ = macro_name
+        self.__doc__ = doc
+
+    def __call__(self, parameter_s=''):
+        return run_macro_magic(self.__name__, parameter_s)
+
+
+class OldMacroMagic(MacroMagic):
+    """Magic command of a macro for IPython < 1"""
+
+    def __call__(self, shell, parameter_s=''):
+        return run_macro_magic(self.__name__, parameter_s)
+
+
 class SpockMacroServer(BaseMacroServer):
     """A CLI version of the MacroServer device"""
 
     def __init__(self, name, **kw):
         self._local_magic = {}
         self._local_var = set()
+        self._reconciled_elements = None
         self.call__init__(BaseMacroServer, name, **kw)
 
     def on_elements_changed(self, evt_src, evt_type, evt_value):
         return BaseMacroServer.on_elements_changed(self, evt_src, evt_type,
                                                    evt_value)
 
+    def _getElementsCache(self):
+        if not getattr(sardanacustomsettings, 'SPOCK_ELEMENTS_CACHE', True):
+            return None
+        try:
+            profile_dir = genutils.get_shell().profile_dir.location
+        except Exception:
+            return None
+        return ElementsCache(os.path.join(profile_dir, 'elements_cache.json'))
+
+    def _saveElementsCache(self, cache, revision):
+        elements = [element.getData() for element in self.getElements()]
+        try:
+            cache.save(self.getFullName(), revision, elements)
+        except Exception:
+            self.debug("Could not save elements cache", exc_info=1)
+
+    def _subscribeElements(self):
+        """Reimplemented to add the elements from the on-disk cache (if it
+        is up to date) and to subscribe to the elements changes in the
+        background. Otherwise the elements are obtained from the
+        MacroServer and the cache is updated."""
+        cache = self._getElementsCache()
+        revision = None
+        if cache is not None:
+            revision = self.getElementsRevision()
+        elements = None
+        if revision is not None:
+            elements = cache.load(self.getFullName(), revision)
+        if elements is None:
+            BaseMacroServer._subscribeElements(self)
+            if revision is not None:
+                self._saveElementsCache(cache, revision)
+            return
+        for element_data in elements:
+            element_data['manager'] = self
+            self._addElement(element_data)
+        thread = threading.Thread(name='SpockElementsReconcile',
+                                  target=self._reconcileElements,
+                                  args=(cache, ))
+        thread.daemon = True
+        thread.start()
+
+    def _reconcileElements(self, cache):
+        # elements changed since the cache was loaded are added again by the
+        # first event and the ones which are not in it any more are removed
+        try:
+            self._reconciled_elements = set()
+            BaseMacroServer._subscribeElements(self)
+            full_names = self._reconciled_elements
+            self._reconciled_elements = None
+            for element in list(self.getElements()):
+                if element.full_name not in full_names:
+                    self._removeElement(dict(full_name=element.full_name))
+            revision = self.getElementsRevision()
+            if revision is not None:
+                self._saveElementsCache(cache, revision)
+        except Exception:
+            self._reconciled_elements = None
+            self.warning("Could not reconcile elements with the MacroServer")
+            self.debug("Details:", exc_info=1)
+
     _SKIP_ELEMENTS = 'controller', 'motorgroup', 'instrument', \
         'controllerclass', 'controllerlib', 'macrolib'
 
     def _addElement(self, element_data):
+        reconciled = self._reconciled_elements
+        if reconciled is not None:
+            full_name = element_data['full_name']
+            reconciled.add(full_name)
+            element = self.getElementInfo(full_name)
+            if element is not None:
+                data = dict(element_data)
+                data.pop('manager', None)
+                if element.getData() == data:
+                    return element
+                self._removeElement(element_data)
         element = BaseMacroServer._addElement(self, element_data)
         elem_type = element.type
         if "MacroCode" in element.interfaces:
@@ -631,31 +744,13 @@ class SpockMacroServer(BaseMacroServer):
     def _addMacro(self, macro_info):
         macro_name = str(macro_info.name)
 
+        doc = macro_info.doc + "\nWARNING: do not rely on the" \
+                               " file path below\n"
         # IPython < 1 magic commands have different API
         if genutils.get_ipython_version_list() < [1, 0]:
-            def macro_fn(shell, parameter_s='', name=macro_name):
-                door = genutils.get_door()
-                ms = genutils.get_macro_server()
-                params_def = ms.getMacroInfoObj(name).parameters
-                parameters = split_macro_parameters(parameter_s, params_def)
-                door.runMacro(macro_name, parameters, synch=True)
-                macro = door.getLastRunningMacro()
-                if macro is not None:  # maybe none if macro was aborted
-                    return macro.getResult()
+            macro_fn = OldMacroMagic(macro_name, doc)
         else:
-            def macro_fn(parameter_s='', name=macro_name):
-                door = genutils.get_door()
-                ms = genutils.get_macro_server()
-                params_def = ms.getMacroInfoObj(name).parameters
-                parameters = split_macro_parameters(parameter_s, params_def)
-                door.runMacro(macro_name, parameters, synch=True)
-                macro = door.getLastRunningMacro()
-                if macro is not None:  # maybe none if macro was aborted
-                    return macro.getResult()
-
-        macro_fn.__name__ = macro_name
-        macro_fn.__doc__ = macro_info.doc + "\nWARNING: do not rely on the" \
-                                            " file path below\n"
+            macro_fn = MacroMagic(macro_name, doc)
 
         # register magic command
         genutils.expose_magic(macro_name, macro_fn)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests of the spock elements cache"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from sardana.spock.cache import ElementsCache
+
+
+class ElementsCacheTestCase(unittest.TestCase):
+
+    ELEMENTS = [dict(name="mot01", full_name="motor/motctrl01/1",
+                     type="Motor", interfaces=["Object", "Moveable"])]
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        file_name = os.path.join(self.dir_name, "elements_cache.json")
+        self.cache = ElementsCache(file_name)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_name)
+
+    def test_load(self):
+        self.assertIsNone(self.cache.load("ms", "rev1"))
+        self.cache.save("ms", "rev1", self.ELEMENTS)
+        self.assertEqual(self.cache.load("ms", "rev1"), self.ELEMENTS)
+        self.assertEqual(os.listdir(self.dir_name), ["elements_cache.json"])
+
+    def test_invalid(self):
+        self.cache.save("ms", "rev1", self.ELEMENTS)
+        self.assertIsNone(self.cache.load("ms", "rev2"))
+        self.assertIsNone(self.cache.load("other_ms", "rev1"))
+        self.cache.clear()
+        self.assertIsNone(self.cache.load("ms", "rev1"))
+
+    def test_corrupted(self):
+        with open(self.cache.file_name, "w") as cache_file:
+            cache_file.write("{")
+        self.assertIsNone(self.cache.load("ms", "rev1"))
@@ -32,8 +32,10 @@ __docformat__ = 'restructuredtext'
 import logging
 import weakref
 import operator
+import threading
 
 from taurus.core.util.containers import LIFO
+from sardana.util.thread import get_flush_scheduler
 import collections
 
 
@@ -85,4 +87,80 @@ class AttributeLogHandler(logging.Handler):
     def finish(self):
         pass
 
-AttributeBufferedLogHandler = AttributeLogHandler
+
+class AttributeBufferedLogHandler(AttributeLogHandler):
+    """Log handler which sends the log lines to the attribute in batches.
+
+    The pending lines are sent in one push *flush_period* seconds after the
+    first of them was logged or as soon as there are *flush_lines* of them.
+    Records of WARNING level or above, :meth:`sync` (e.g. ``flushOutput``)
+    and :meth:`finish` send the pending lines immediately.
+
+    Handlers may share a *flush_group* (list of handlers): a flush of any of
+    them sends first the pending lines of the others, so e.g. an error is
+    never sent before the output which preceded it.
+    """
+
+    def __init__(self, dev, attr_name, level=logging.NOTSET, max_buff_size=0,
+                 flush_period=0.1, flush_lines=100, flush_group=None):
+        AttributeLogHandler.__init__(self, dev, attr_name, level=level,
+                                     max_buff_size=max_buff_size)
+        self._flush_period = flush_period
+        self._flush_lines = flush_lines
+        if flush_group is None:
+            flush_group = []
+        flush_group.append(self)
+        self._flush_group = flush_group
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._nb_lines = 0
+        self._nb_pushes = 0
+
+    def emit(self, record):
+        output = self.getRecordMessage(record)
+        self.appendBuffer(output)
+        with self._pending_lock:
+            first = len(self._pending) == 0
+            self._pending.extend(output)
+            flush = (record.levelno >= logging.WARNING
+                     or self._flush_period <= 0
+                     or len(self._pending) >= self._flush_lines)
+        if flush:
+            self.sync()
+        elif first:
+            get_flush_scheduler().schedule(self.sync, self._flush_period)
+
+    def sendPending(self):
+        """Sends the pending lines of this handler"""
+        with self._send_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            get_flush_scheduler().cancel(self.sync)
+            if len(pending) == 0:
+                return
+            # do not exceed the attribute maximum dimension
+            max_lines = self._attr.get_max_dim_x()
+            for i in range(0, len(pending), max_lines):
+                self.sendText(pending[i:i + max_lines])
+                self._nb_pushes += 1
+            self._nb_lines += len(pending)
+
+    def sync(self):
+        """Sends the pending lines of all the handlers of the flush group"""
+        for handler in self._flush_group:
+            if handler is not self:
+                handler.sendPending()
+        self.sendPending()
+
+    def finish(self):
+        self.sync()
+
+    def getBatchingRatio(self):
+        """Returns the average number of lines sent in one push
+
+        :return: lines per push (0 if nothing was sent yet)
+        :rtype: float"""
+        if self._nb_pushes == 0:
+            return 0.
+        return self._nb_lines / self._nb_pushes
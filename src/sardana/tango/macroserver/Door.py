@@ -25,12 +25,13 @@
 
 import json
 import time
+import base64
 import threading
 
 from lxml import etree
 
 from PyTango import Util, DevFailed, Except, DevVoid, DevLong, \
-    DevLong64, DevString, DevState, DevEncoded, \
+    DevLong64, DevDouble, DevString, DevState, DevEncoded, \
     DevVarStringArray, ArgType, \
     READ, READ_WRITE, SCALAR, SPECTRUM
 
@@ -43,7 +44,7 @@ from sardana.macroserver.macro import Macro
 from sardana.macroserver.msdoor import BaseInputHandler
 from sardana.macroserver.msexception import MacroServerException
 from sardana.tango.core.util import throw_sardana_exception
-from sardana.tango.core.attributehandler import AttributeLogHandler
+from sardana.tango.core.attributehandler import AttributeBufferedLogHandler
 from sardana.tango.core.SardanaDevice import SardanaDevice, SardanaDeviceClass
 from sardana.macroserver.msexception import InputCancelled
 
@@ -65,6 +66,8 @@ class TangoInputHandler(BaseInputHandler):
         input_data = json.dumps(input_data)
         self._value = None
         self._input_waitting = True
+        # the prompt should not precede the output logged before
+        self._door.flushLogHandlers()
         try:
             self._door.set_attribute(self._attr, value=input_data)
             res = self.input_wait(timeout=timeout)
@@ -240,15 +243,27 @@ class Door(SardanaDevice):
 
     def _setupLogHandlers(self, levels):
         self._handler_dict = {}
+        flush_group = []
         for level in levels:
-            handler = AttributeLogHandler(self, level,
-                                          max_buff_size=self.MaxMsgBufferSize)
+            handler = AttributeBufferedLogHandler(
+                self, level, max_buff_size=self.MaxMsgBufferSize,
+                flush_period=self.LogFlushPeriod,
+                flush_lines=self.LogFlushLines,
+                flush_group=flush_group)
             filter = LogFilter(level=getattr(self, level))
             handler.addFilter(filter)
             self.addLogHandler(handler)
+            # the door shares the logger with this device - register the
+            # handler also in the door so its flushOutput flushes the handler
+            self.door.addLogHandler(handler)
             format = None
             self._handler_dict[level] = handler, filter, format
 
+    def flushLogHandlers(self):
+        """Sends immediately the log lines pending in the log handlers"""
+        for handler, _, _ in list(self._handler_dict.values()):
+            handler.sync()
+
     def on_door_changed(self, event_source, event_type, event_value):
         # during server startup and shutdown avoid processing element
         # creation events
@@ -265,6 +280,10 @@ class Door(SardanaDevice):
         except DevFailed:
             return
 
+        if name in ("state", "result"):
+            # macro ended - its output must arrive before
+            self.flushLogHandlers()
+
         if name == "state":
             event_value = self.calculate_tango_state(event_value)
         elif name == "status":
@@ -307,6 +326,10 @@ class Door(SardanaDevice):
             mstack = '\n    -[%s]\t%s' % (mstate, macro.getCommand()) + mstack
             macro = macro.getParentMacro()
         self._status += mstack
+        ratios = ["%s: %.1f" % (level, handler.getBatchingRatio())
+                  for level, (handler, _, _) in
+                  getattr(self, "_handler_dict", {}).items()]
+        self._status += '\n Log lines per push: ' + ', '.join(ratios)
         return self._status
 
     def read_attr_hardware(self, data):
@@ -441,6 +464,20 @@ class Door(SardanaDevice):
         return self.get_state() in [Macro.Finished, Macro.Abort,
                                     Macro.Exception]
 
+    def GetMacroProfile(self):
+        profile = self.macro_executor.getLastMacroProfile()
+        if profile is None:
+            return json.dumps(None)
+        profile = dict(profile)
+        cprofile = profile["cprofile"]
+        if cprofile is not None:
+            profile["cprofile"] = base64.b64encode(cprofile).decode()
+        return json.dumps(profile)
+
+    def is_GetMacroProfile_allowed(self):
+        return self.get_state() in [Macro.Finished, Macro.Abort,
+                                    Macro.Exception]
+
 
 class DoorClass(SardanaDeviceClass):
 
@@ -456,6 +493,17 @@ class DoorClass(SardanaDeviceClass):
              'Maximum size for the Output, Result, Error, Warning, Debug and '
              'Info buffers',
              [512]],
+        'LogFlushPeriod':
+            [DevDouble,
+             'Maximum time (in seconds) the log lines are buffered before '
+             'being sent to the Output, Error, Warning, Debug and Info '
+             'attributes (0 means no buffering)',
+             [0.1]],
+        'LogFlushLines':
+            [DevLong,
+             'Maximum number of log lines buffered before being sent to '
+             'the Output, Error, Warning, Debug and Info attributes',
+             [100]],
         'MacroServerName':
             [DevString,
              'Name of the macro server device to connect to. [default: None, '
@@ -491,6 +539,11 @@ class DoorClass(SardanaDeviceClass):
                 'optional list of environment names'],
              [DevVarStringArray, 'Macro environment as a list of '
                 'pairs keys, value']],
+        'GetMacroProfile':
+            [[DevVoid, ""],
+             [DevString, 'Profile of the last profiled macro (JSON with '
+                'the macro name, the phases summary and the base64 encoded '
+                'cProfile statistics)']],
         #        'ReloadMacro':
         #            [[DevVarStringArray, "Macro(s) name(s)"],
         #            [DevVarStringArray, "[OK] if successfull or a traceback " \
@@ -27,6 +27,7 @@
 
 import os.path
 import sys
+import hashlib
 
 from PyTango import Util, Except, DevVoid, DevLong, DevString, DevState, \
     DevEncoded, DevVarStringArray, READ, READ_WRITE, SCALAR, SPECTRUM, DebugIt
@@ -44,6 +45,7 @@ class MacroServer(SardanaDevice):
     """The MacroServer tango class"""
 
     ElementsCache = None
+    ElementsRevisionCache = None
     EnvironmentCache = None
 
     def __init__(self, cl, name):
@@ -230,21 +232,33 @@ class MacroServer(SardanaDevice):
         elements = self.macro_server.get_elements_info()
         value = dict(new=elements)
         value = CodecFactory().getCodec('utf8_json').encode(('', value))
+        self.ElementsRevisionCache = hashlib.sha1(value[1]).hexdigest()
         self.ElementsCache = value
         return value
 
+    def getElementsRevision(self):
+        """Returns the revision of the elements: a hash of the encoded
+        element list, so it changes only when the elements change (also
+        across server restarts)"""
+        self.getElements()
+        return self.ElementsRevisionCache
+
     #@DebugIt()
     def read_Elements(self, attr):
         fmt, data = self.getElements()
         attr.set_value(fmt, data)
 
+    def read_ElementsRevision(self, attr):
+        attr.set_value(self.getElementsRevision())
+
     def is_Elements_allowed(self, req_type):
         return SardanaServer.server_state == State.Running
 
     is_DoorList_allowed = \
         is_MacroList_allowed = \
         is_MacroLibList_allowed = \
-        is_TypeList_allowed = is_Elements_allowed
+        is_TypeList_allowed = \
+        is_ElementsRevision_allowed = is_Elements_allowed
 
     def GetMacroInfo(self, macro_names):
         """GetMacroInfo(list<string> macro_names):
@@ -456,6 +470,11 @@ class MacroServerClass(SardanaDeviceClass):
                      {'label': "Elements",
                       'description': "the list of all elements "
                       "(a JSON encoded dict)", }],
+        'ElementsRevision': [[DevString, SCALAR, READ],
+                             {'label': "Elements revision",
+                              'description': "the revision of the list of "
+                              "all elements (changes whenever the Elements "
+                              "change)", }],
         'Environment': [[DevEncoded, SCALAR, READ_WRITE],
                         {'label': 'Environment',
                          'description': "The macro server environment "
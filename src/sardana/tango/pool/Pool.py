@@ -44,6 +44,7 @@ from sardana import State, SardanaServer, ElementType, Interface, \
     TYPE_ACQUIRABLE_ELEMENTS, TYPE_PSEUDO_ELEMENTS
 from sardana.pool.pool import Pool as POOL
 from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
+from sardana.pool.pooltelemetry import get_telemetry
 from sardana.tango.core.util import get_tango_version_number
 import collections
 
@@ -123,6 +124,8 @@ class Pool(PyTango.Device_4Impl, Logger):
         p.set_acq_loop_sleep_time(self.AcqLoop_SleepTime / 1000)
         p.set_acq_loop_states_per_value(self.AcqLoop_StatesPerValue)
         p.set_drift_correction(self.DriftCorrection)
+        p.set_interrupt_timeout(self.InterruptTimeout / 1000)
+        p.set_motion_start_strategy(self.MotionStartStrategy)
         if self.RemoteLog is None:
             p.clear_remote_logging()
         else:
@@ -975,6 +978,18 @@ class Pool(PyTango.Device_4Impl, Logger):
     def Abort(self):
         self.pool.abort()
 
+    def ReadPositions(self, argin):
+        argin = json.loads(argin)
+        if isinstance(argin, dict):
+            names = argin["names"]
+            cache_policy = argin.get("cache_policy", "auto")
+        else:
+            names, cache_policy = argin, "auto"
+        return json.dumps(self.pool.read_positions(names, cache_policy))
+
+    def GetTelemetry(self, reset):
+        return get_telemetry().encode(reset=reset)
+
     def SendToController(self, stream):
         ctrl_name, stream = stream[:2]
         try:
@@ -1301,6 +1316,65 @@ Sends a string to a controller.
     {1}
 """.format(SEND_TO_CONTROLLER_PAR_IN_DOC, SEND_TO_CONTROLLER_PAR_OUT_DOC)
 
+READ_POSITIONS_PAR_IN_DOC = """\
+Must give either:
+
+        * A JSON encoded list of moveable names
+        * A JSON encoded dict with keys 'names' (list of moveable names) and
+          'cache_policy' (optional, one of 'auto', 'cache' or 'hardware',
+          default is 'auto')
+
+    Examples::
+
+        data = dict(names=["mot01", "mot02"], cache_policy="hardware")
+        pool.ReadPositions(json.dumps(data))
+        pool.ReadPositions(json.dumps(["mot01", "mot02"]))
+
+"""
+
+READ_POSITIONS_PAR_OUT_DOC = """\
+a JSON encoded list of dicts (one per moveable) with keys: 'name',
+'position', 'dial_position' (None for pseudo motors), 'state' and 'error'
+(None or error description); unknown names are reported with 'state' None
+and the error
+"""
+
+READ_POSITIONS_DOC = """\
+Tango command to read positions, dial positions and states of many
+moveables at once. Hardware is accessed with a single request per
+controller.
+
+:param argin:
+    {0}
+:type argin: :obj:`str`
+:return:
+    {1}
+:rtype: :obj:`str`
+""".format(READ_POSITIONS_PAR_IN_DOC, READ_POSITIONS_PAR_OUT_DOC)
+
+GET_TELEMETRY_PAR_IN_DOC = "clear the telemetry after reading it"
+
+GET_TELEMETRY_PAR_OUT_DOC = """\
+a JSON encoded dict with keys: 'since' and 'now' (timestamps of the
+recording period) and 'controller', 'loop', 'lock' and 'queue' (dicts of
+histograms with keys: 'count', 'total', 'max' and 'buckets' - bucket 0
+counts values lower than 1 and bucket i values in [2**(i-1), 2**i);
+times are in microseconds)
+"""
+
+GET_TELEMETRY_DOC = """\
+Tango command to read the telemetry of the pool: latency histograms of
+the controller methods, of the action loops and of the element locks
+and the depth of the thread pool jobs queue.
+
+:param argin:
+    {0}
+:type argin: :obj:`bool`
+:return:
+    {1}
+:rtype: :obj:`str`
+""".format(GET_TELEMETRY_PAR_IN_DOC, GET_TELEMETRY_PAR_OUT_DOC)
+
 Pool.CreateController.__doc__ = CREATE_CONTROLLER_DOC
 Pool.CreateElement.__doc__ = CREATE_ELEMENT_DOC
 Pool.CreateInstrument.__doc__ = CREATE_INSTRUMENT_DOC
@@ -1313,6 +1387,8 @@ Pool.ReloadControllerClass.__doc__ = RELOAD_CONTROLLER_CLASS_INFO_DOC
 Pool.RenameElement.__doc__ = RENAME_ELEMENT_CLASS_INFO_DOC
 Pool.Stop.__doc__ = STOP_DOC
 Pool.Abort.__doc__ = ABORT_DOC
+Pool.ReadPositions.__doc__ = READ_POSITIONS_DOC
+Pool.GetTelemetry.__doc__ = GET_TELEMETRY_DOC
 
 
 class PoolClass(PyTango.DeviceClass):
@@ -1340,6 +1416,20 @@ class PoolClass(PyTango.DeviceClass):
              "Sleep time in the motion loop in mS [default: %dms]" %
              int(POOL.Default_MotionLoop_SleepTime * 1000),
              int(POOL.Default_MotionLoop_SleepTime * 1000)],
+        'MotionStartStrategy':
+            [PyTango.DevString,
+             "Strategy of starting motions involving many controllers: "
+             "serial (one controller after another) or concurrent "
+             "(controllers are accessed concurrently and their StartAll are "
+             "synchronized to minimize the start skew) [default: %s]" %
+             POOL.Default_MotionStartStrategy,
+             POOL.Default_MotionStartStrategy],
+        'InterruptTimeout':
+            [PyTango.DevLong,
+             "Maximum time to wait for the controllers to stop or abort in mS "
+             "(controllers are stopped or aborted concurrently) "
+             "[default: %dms]" % int(POOL.Default_InterruptTimeout * 1000),
+             int(POOL.Default_InterruptTimeout * 1000)],
         'MotionLoop_StatesPerPosition':
             [PyTango.DevLong,
              "Number of State reads done before doing a position read in the "
@@ -1450,6 +1540,12 @@ class PoolClass(PyTango.DeviceClass):
         'Abort':
             [[PyTango.DevVoid, ABORT_PAR_IN_DOC],
              [PyTango.DevVoid, ABORT_PAR_OUT_DOC]],
+        'ReadPositions':
+            [[PyTango.DevString, READ_POSITIONS_PAR_IN_DOC],
+             [PyTango.DevString, READ_POSITIONS_PAR_OUT_DOC]],
+        'GetTelemetry':
+            [[PyTango.DevBoolean, GET_TELEMETRY_PAR_IN_DOC],
+             [PyTango.DevString, GET_TELEMETRY_PAR_OUT_DOC]],
         'SendToController':
             [[PyTango.DevVarStringArray, SEND_TO_CONTROLLER_PAR_IN_DOC],
              [PyTango.DevString, SEND_TO_CONTROLLER_PAR_OUT_DOC]],
@@ -32,7 +32,7 @@ __docformat__ = 'restructuredtext'
 import time
 
 from PyTango import Except
-from PyTango import DevVoid, DevDouble, DevString
+from PyTango import DevVoid, DevDouble, DevString, DevBoolean
 from PyTango import DispLevel, DevState, AttrQuality
 from PyTango import READ, READ_WRITE, SCALAR, SPECTRUM
 
@@ -82,6 +82,7 @@ class ZeroDExpChannel(PoolExpChannelDevice):
                                          full_name=full_name, id=self.Id, axis=self.Axis,
                                          ctrl_id=self.Ctrl_id)
         zerod.add_listener(self.on_zerod_changed)
+        zerod.keep_samples = self.KeepAccumulationBuffer
 
         # force a state read to initialize the state attribute
         #state = zerod.state
@@ -197,10 +198,12 @@ class ZeroDExpChannel(PoolExpChannelDevice):
         self.zerod.start_acquisition()
 
     def read_AccumulationBuffer(self, attr):
-        attr.set_value(self.zerod.get_accumulation_buffer())
+        buff = self.zerod.get_accumulation_buffer()
+        attr.set_value(buff[-attr.get_max_dim_x():])
 
     def read_TimeBuffer(self, attr):
-        attr.set_value(self.zerod.get_time_buffer())
+        buff = self.zerod.get_time_buffer()
+        attr.set_value(buff[-attr.get_max_dim_x():])
 
     def read_AccumulationType(self, attr):
         attr.set_value(self.zerod.get_accumulation_type())
@@ -231,6 +234,11 @@ class ZeroDExpChannelClass(PoolExpChannelDeviceClass):
 
     #    Device Properties
     device_property_list = {
+        'KeepAccumulationBuffer': [DevBoolean,
+                                   "Keep the acquired samples in the "
+                                   "accumulation buffer (False calculates "
+                                   "only the accumulation statistics)",
+                                   True],
     }
     device_property_list.update(PoolExpChannelDeviceClass.device_property_list)
 
@@ -31,6 +31,7 @@ __all__ = ['BaseInputHandler', 'BaseDoor', 'BaseMacroServer',
 __docformat__ = 'restructuredtext'
 
 import sys
+import copy
 import time
 import uuid
 import math
@@ -60,7 +61,7 @@ from sardana.sardanautils import recur_map
 from .macro import MacroInfo, Macro, MacroNode, ParamFactory, \
     SingleParamNode, ParamNode, createMacroNode
 from .sardana import BaseSardanaElementContainer, BaseSardanaElement
-from .pool import getChannelConfigs
+from .pool import getChannelConfigs, _clear_aliases
 from itertools import zip_longest
 
 CHANGE_EVT_TYPES = TaurusEventType.Change, TaurusEventType.Periodic
@@ -174,11 +175,156 @@ class MacroServerDevice(TangoDevice):
 
 
 class ExperimentConfiguration(object):
+    """Experiment configuration of a door: environment variables and the
+    configurations of the measurement groups.
+
+    The decoded configurations of the measurement groups are cached and
+    kept up to date with the Configuration attribute change events so
+    only the new, removed or changed (in error) measurement groups need to
+    be read.
+    """
 
     def __init__(self, door):
         self._door = door
+        self._lock = threading.RLock()
+        # CaselessDict<str, tuple<BaseSardanaElement, dict>>
+        # where key is the measurement group full name and value is its
+        # element info and its decoded configuration
+        self._mnt_grp_configs = CaselessDict()
+        # CaselessDict<str, TangoAttribute>
+        # where key is the measurement group full name and value is its
+        # Configuration attribute
+        self._mnt_grp_cfg_attrs = CaselessDict()
+
+    def _subscribeMntGrp(self, full_name):
+        if full_name in self._mnt_grp_cfg_attrs:
+            return
+        try:
+            attr = Factory().getAttribute(full_name + "/configuration")
+            attr.addListener(self._onMntGrpConfigurationChanged)
+        except Exception:
+            from taurus.core.util.log import debug
+            debug('Cannot subscribe to Measurement group "%s" '
+                  'configuration', full_name, exc_info=1)
+            return
+        self._mnt_grp_cfg_attrs[full_name] = attr
+
+    def _unsubscribeMntGrp(self, full_name):
+        attr = self._mnt_grp_cfg_attrs.pop(full_name, None)
+        if attr is not None:
+            attr.removeListener(self._onMntGrpConfigurationChanged)
+
+    def _onMntGrpConfigurationChanged(self, evt_src, evt_type, evt_value):
+        with self._lock:
+            for full_name, attr in list(self._mnt_grp_cfg_attrs.items()):
+                if attr is evt_src:
+                    break
+            else:
+                return
+            cached = self._mnt_grp_configs.get(full_name)
+            if cached is None:
+                # not read yet, it will be read on the next get
+                return
+            if evt_type == TaurusEventType.Error:
+                self._mnt_grp_configs.pop(full_name)
+            elif evt_type in CHANGE_EVT_TYPES:
+                try:
+                    config = CodecFactory().decode(('json', evt_value.rvalue))
+                except Exception:
+                    self._mnt_grp_configs.pop(full_name)
+                    return
+                self._mnt_grp_configs[full_name] = cached[0], config
 
-    def get(self, cache=False):
+    def invalidate(self, mnt_grps=None):
+        """Discards the cached configurations of the given measurement
+        groups so they are read again on the next
+        :meth:`~ExperimentConfiguration.get`.
+
+        :param mnt_grps: measurement groups names or full names
+            (default: all)
+        :type mnt_grps: seq<str> or None
+        """
+        with self._lock:
+            if mnt_grps is None:
+                self._mnt_grp_configs.clear()
+                return
+            mnt_grps = set(map(str.lower, mnt_grps))
+            for full_name, (mnt_grp, _) in \
+                    list(self._mnt_grp_configs.items()):
+                if (full_name.lower() in mnt_grps
+                        or mnt_grp.name.lower() in mnt_grps):
+                    self._mnt_grp_configs.pop(full_name)
+
+    def _getMntGrpConfigs(self, mnt_grps, cache=True):
+        """Returns the decoded configurations of the given measurement
+        groups reading only the ones which are not cached.
+
+        :param mnt_grps: measurement groups element info
+        :type mnt_grps: CaselessDict<str, BaseSardanaElement>
+        :param cache: use the cached configurations
+        :type cache: bool
+        :return: measurement groups configurations
+        :rtype: CaselessDict<str, dict>
+        """
+        with self._lock:
+            cached = self._mnt_grp_configs
+            # forget the measurement groups removed or changed since the
+            # last call (Elements events create new element info objects)
+            for full_name in list(cached.keys()):
+                mnt_grp = mnt_grps.get(full_name)
+                if not cache or mnt_grp is not cached[full_name][0]:
+                    cached.pop(full_name)
+            removed = [full_name for full_name in self._mnt_grp_cfg_attrs
+                       if full_name not in mnt_grps]
+            missing = [full_name for full_name in mnt_grps
+                       if full_name not in cached]
+        for full_name in removed:
+            self._unsubscribeMntGrp(full_name)
+
+        if len(missing) > 0:
+            mnt_grp_grps = PyTango.Group("grp")
+            # use full names cause we may be using a different Tango database
+            mnt_grp_grps.add(missing)
+
+            codec = CodecFactory().getCodec('json')
+            replies = mnt_grp_grps.read_attribute("configuration")
+            for full_name, reply in zip(missing, replies):
+                mnt_grp = mnt_grps[full_name]
+                try:
+                    config = codec.decode(('json', reply.get_data().value))[1]
+                except Exception as e:
+                    from taurus.core.util.log import warning
+                    warning('Cannot load Measurement group "%s": %s',
+                            repr(mnt_grp.name), repr(e))
+                    continue
+                with self._lock:
+                    cached[full_name] = mnt_grp, config
+            # subscribe after reading so no change gets lost: the first
+            # event brings the current configuration
+            for full_name in missing:
+                self._subscribeMntGrp(full_name)
+
+        ret = CaselessDict()
+        with self._lock:
+            for full_name, mnt_grp in mnt_grps.items():
+                try:
+                    _, config = cached[full_name]
+                except KeyError:
+                    continue
+                # callers are free to modify the returned configurations
+                ret[mnt_grp.name] = copy.deepcopy(config)
+        return ret
+
+    def get(self, cache=True):
+        """Returns the ExperimentConfiguration dictionary.
+
+        :param cache: use the cached measurement groups configurations
+            (only the ones not cached yet are read). If False, read all of
+            them.
+        :type cache: bool
+        :return: experiment configuration
+        :rtype: dict
+        """
         door = self._door
         macro_server = door.macro_server
         env = door.getEnvironment()
@@ -194,7 +340,6 @@ class ExperimentConfiguration(object):
         ret['ScanFile'] = scan_file
         mnt_grps = macro_server.getElementsOfType("MeasurementGroup")
         mnt_grps_names = [mnt_grp.name for mnt_grp in list(mnt_grps.values())]
-        mnt_grps_full_names = list(mnt_grps.keys())
 
         active_mnt_grp = env.get('ActiveMntGrp')
         if active_mnt_grp is None and len(mnt_grps):
@@ -202,25 +347,8 @@ class ExperimentConfiguration(object):
             door.putEnvironment('ActiveMntGrp', active_mnt_grp)
 
         ret['ActiveMntGrp'] = active_mnt_grp
-        ret['MntGrpConfigs'] = mnt_grp_configs = CaselessDict()
-
-        if len(mnt_grps) == 0:
-            return ret
-
-        mnt_grp_grps = PyTango.Group("grp")
-        # use full names cause we may be using a different Tango database
-        mnt_grp_grps.add(mnt_grps_full_names)
-
-        codec = CodecFactory().getCodec('json')
-        replies = mnt_grp_grps.read_attribute("configuration")
-        for mnt_grp, reply in zip(mnt_grps_names, replies):
-            try:
-                mnt_grp_configs[mnt_grp] = \
-                    codec.decode(('json', reply.get_data().value))[1]
-            except Exception as e:
-                from taurus.core.util.log import warning
-                warning('Cannot load Measurement group "%s": %s',
-                        repr(mnt_grp), repr(e))
+        ret['MntGrpConfigs'] = self._getMntGrpConfigs(
+            CaselessDict(mnt_grps), cache=cache)
         return ret
 
     def set(self, conf, mnt_grps=None):
@@ -267,6 +395,10 @@ class ExperimentConfiguration(object):
                 msg_error += 'Measurement Group {0}:\n'\
                              '{1}\n\n'.format(mnt_grp, desc)
 
+        # the change events will bring the new configurations but do not
+        # return the old ones in the meantime
+        self.invalidate(mnt_grps)
+
         if len(msg_error) > 0:
             raise RuntimeError(msg_error)
 
@@ -690,6 +822,32 @@ class BaseDoor(MacroServerDevice):
         data = codec.decode(data)
         return data
 
+    @staticmethod
+    def splitRecordData(data):
+        """Splits the decoded record data into the packets of the single
+        records. The *record_data_batch* packets (columnar, sent by the
+        JsonRecorder when its batching is enabled) are split into
+        *record_data* packets, any other data is returned as it is.
+
+        :param data: decoded record data (format, packet)
+        :type data: :obj:`tuple`
+        :return: decoded record data of the single records
+        :rtype: :obj:`list` <:obj:`tuple`>
+        """
+        if data is None or not isinstance(data[1], dict) \
+                or data[1].get('type') != 'record_data_batch':
+            return [data]
+        fmt, packet = data
+        columns = packet['data']
+        nb_records = max([len(values) for values in columns.values()] or [0])
+        records = []
+        for i in range(nb_records):
+            record = dict(packet, type='record_data',
+                          data={name: values[i]
+                                for name, values in columns.items()})
+            records.append((fmt, record))
+        return records
+
     def processRecordData(self, data):
         pass
 
@@ -833,15 +991,8 @@ class BaseMacroServer(MacroServerDevice):
         self._elements = BaseSardanaElementContainer()
         self.call__init__(MacroServerDevice, name, **kw)
 
-        self.__elems_attr = self.getAttribute("Elements")
-        try:
-            serialization_mode = TaurusSerializationMode.TangoSerial
-        except AttributeError:
-            serialization_mode = TaurusSerializationMode.Serial
-        self.__elems_attr.setSerializationMode(serialization_mode)
-        self.__elems_attr.addListener(self.on_elements_changed)
-        self.__elems_attr.setSerializationMode(
-            TaurusSerializationMode.Concurrent)
+        self.__elems_attr = None
+        self._subscribeElements()
 
         self.__env_attr = self.getAttribute('Environment')
         try:
@@ -856,6 +1007,32 @@ class BaseMacroServer(MacroServerDevice):
     NO_CLASS_TYPES = 'ControllerClass', 'ControllerLibrary', \
                      'MacroLibrary', 'Instrument', 'Meta', 'ParameterType'
 
+    def _subscribeElements(self):
+        """Subscribe to the elements changes. The current elements are
+        added (in the calling thread) during the subscription."""
+        self.__elems_attr = self.getAttribute("Elements")
+        try:
+            serialization_mode = TaurusSerializationMode.TangoSerial
+        except AttributeError:
+            serialization_mode = TaurusSerializationMode.Serial
+        self.__elems_attr.setSerializationMode(serialization_mode)
+        self.__elems_attr.addListener(self.on_elements_changed)
+        self.__elems_attr.setSerializationMode(
+            TaurusSerializationMode.Concurrent)
+
+    def getElementsRevision(self):
+        """Returns the revision of the MacroServer elements. It changes
+        whenever any element changes.
+
+        :return: elements revision or None if the MacroServer does not
+            provide it
+        :rtype: :obj:`str` or None
+        """
+        try:
+            return self.read_attribute("ElementsRevision").value
+        except PyTango.DevFailed:
+            return None
+
     def on_environment_changed(self, evt_src, evt_type, evt_value):
         try:
             return self._on_environment_changed(evt_src, evt_type, evt_value)
@@ -965,6 +1142,10 @@ class BaseMacroServer(MacroServerDevice):
             element_data['manager'] = self
             element = self._addElement(element_data)
             changed.add(element)
+        # like the measurement groups configurations (cached per element
+        # info) the controllers aliases are resolved again
+        if removed or changed:
+            _clear_aliases()
         return ret
 
     def _addElement(self, element_data):
@@ -33,6 +33,8 @@ import time
 
 from taurus.core.util.containers import CaselessDict
 
+from sardana.util.profiler import profiled
+
 
 def _get_tango_devstate_match(states):
     """
@@ -383,27 +385,60 @@ class Motion(BaseMotion):
         for i, moveable in enumerate(self.moveable_list):
             moveable.waitMove(timeout=timeout, id=id[i])
 
+    def _startMotion(self, new_pos, timeout=None):
+        start, ids = 0, []
+        for moveable in self.moveable_list:
+            end = start + moveable.getSize()
+            pos = new_pos[start:end]
+            id = moveable.startMove(pos, timeout=timeout)
+            ids.append(id)
+            start = end
+        return ids
+
+    def _waitMotion(self, ids, timeout=None):
+        for moveable, id in zip(self.moveable_list, ids):
+            moveable.waitMove(id=id, timeout=timeout)
+        states = [m.getState() for m in self.moveable_list]
+        state = _get_tango_devstate_match(states)
+        return state, self.readPosition()
+
+    @profiled("motion.move")
     def move(self, new_pos, timeout=None):
         start_time = time.time()
         if len(self.moveable_list) == 1:
             moveable = self.moveable_list[0]
             ret = moveable.move(new_pos, timeout=timeout)
         else:
-            start, ids = 0, []
-            for moveable in self.moveable_list:
-                end = start + moveable.getSize()
-                pos = new_pos[start:end]
-                id = moveable.startMove(pos, timeout=timeout)
-                ids.append(id)
-                start = end
-            for moveable, id in zip(self.moveable_list, ids):
-                moveable.waitMove(id=id, timeout=timeout)
-            states, positions = self.readState(), self.readPosition()
-            state = _get_tango_devstate_match(states)
-            ret = state, positions
+            ids = self._startMotion(new_pos, timeout=timeout)
+            ret = self._waitMotion(ids, timeout=timeout)
         self.__total_motion_time = time.time() - start_time
         return ret
 
+    @profiled("motion.move")
+    def startMotion(self, new_pos, timeout=None):
+        """Starts the motion as :meth:`move` does but without waiting for
+        its end. Use :meth:`waitMotion` to wait for it.
+
+        :param new_pos: positions
+        :type new_pos: seq<float>
+        :return: motion ids to be passed to :meth:`waitMotion`
+        :rtype: list"""
+        self.__motion_start_time = time.time()
+        return self._startMotion(new_pos, timeout=timeout)
+
+    @profiled("motion.move")
+    def waitMotion(self, ids, timeout=None):
+        """Waits for the end of the motion started with
+        :meth:`startMotion`.
+
+        :param ids: motion ids returned by :meth:`startMotion`
+        :type ids: list
+        :return: state and positions as :meth:`move` returns
+        :rtype: tuple(DevState, list<float>)"""
+        ret = self._waitMotion(ids, timeout=timeout)
+        self.__total_motion_time = time.time() - self.__motion_start_time
+        return ret
+
     def iterMove(self, new_pos, timeout=None):
         """ generator for motor positions"""
         assert len(
@@ -30,7 +30,8 @@ It contains specific part of sardana device pool"""
 __all__ = ["InterruptException", "StopException", "AbortException",
            "ReleaseException",
            "BaseElement", "ControllerClass", "ControllerLibrary",
-           "PoolElement", "Controller", "ComChannel", "ExpChannel",
+           "PoolElement", "Controller", "ComChannel", "IndexedBuffer",
+           "ExpChannel",
            "CTExpChannel", "ZeroDExpChannel", "OneDExpChannel",
            "TwoDExpChannel", "PseudoCounter", "Motor", "PseudoMotor",
            "MotorGroup", "TriggerGate",
@@ -52,6 +53,7 @@ import numpy
 import threading
 import PyTango
 import collections
+import collections.abc
 
 from PyTango import DevState, AttrDataFormat, AttrQuality, DevFailed, \
     DeviceProxy, AttributeProxy
@@ -68,6 +70,7 @@ from taurus.core.util.event import EventGenerator, AttributeEventWait, \
 from taurus.core.tango import TangoDevice, FROM_TANGO_TO_STR_TYPE
 
 from sardana import sardanacustomsettings
+from sardana.util.profiler import profiled
 from .sardana import BaseSardanaElementContainer, BaseSardanaElement
 from .motion import Moveable, MoveableSource
 
@@ -102,6 +105,149 @@ def _is_referable(channel):
     return "valueref" in list(map(str.lower, channel.get_attribute_list()))
 
 
+# CaselessDict<str, str> where key is a device name and value is its alias
+_ALIASES = CaselessDict()
+
+
+def _get_alias(dev_name):
+    # The configuration changes are frequent and the controllers do not
+    # change their names in the meantime so resolve each alias only once
+    # instead of building a DeviceProxy on every configuration event.
+    try:
+        return _ALIASES[dev_name]
+    except KeyError:
+        alias = DeviceProxy(dev_name).alias()
+        _ALIASES[dev_name] = alias
+        return alias
+
+
+def _clear_aliases():
+    # Forget the resolved aliases e.g. when the elements change (a device
+    # may be deleted and created again with a different alias).
+    _ALIASES.clear()
+
+
+def _stack_values(values):
+    # Stack values of the same shape into one contiguous array along the
+    # first dimension (the conversion is done by numpy in a single call).
+    # Values which can not be stacked e.g. spectra of different lengths
+    # are returned as a list of arrays.
+    try:
+        array = numpy.asarray(values)
+    except ValueError:
+        array = None
+    if array is None or array.dtype == object:
+        return list(map(numpy.asarray, values))
+    return array
+
+
+class IndexedBuffer(collections.abc.Mapping):
+    """Buffer of values addressed by their acquisition index.
+
+    Each chunk of values is stored as it comes (lists of scalars or of
+    spectra are converted to one array per chunk, arrays are not copied)
+    and index-addressable arrays map every index to its chunk and row, so
+    storing a chunk costs no per value work. :meth:`contents` returns all
+    the values in one array.
+
+    The buffer is a read-only mapping of index to value, like the
+    dictionaries used before.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Remove all the values."""
+        with self._lock:
+            self._chunks = []
+            self._chunk = numpy.full(0, -1, dtype=int)
+            self._row = numpy.zeros(0, dtype=int)
+
+    def extend(self, indexes, values):
+        """Store values at the given indexes.
+
+        :param indexes: indexes of the values
+        :type indexes: seq<int>
+        :param values: values (scalars, spectra or images)
+        :type values: seq or numpy.ndarray
+        """
+        indexes = numpy.asarray(indexes, dtype=int)
+        if len(indexes) == 0:
+            return
+        if not isinstance(values[0], numpy.ndarray):
+            values = _stack_values(values)
+        with self._lock:
+            size = indexes.max() + 1
+            capacity = len(self._chunk)
+            if size > capacity:
+                capacity = max(size, 2 * capacity)
+                chunk = numpy.full(capacity, -1, dtype=int)
+                chunk[:len(self._chunk)] = self._chunk
+                row = numpy.zeros(capacity, dtype=int)
+                row[:len(self._row)] = self._row
+                self._chunk, self._row = chunk, row
+            self._chunk[indexes] = len(self._chunks)
+            self._row[indexes] = numpy.arange(len(indexes))
+            self._chunks.append(values)
+
+    def indexes(self):
+        """Return the indexes of the stored values (sorted).
+
+        :return: indexes
+        :rtype: numpy.ndarray
+        """
+        with self._lock:
+            return numpy.flatnonzero(self._chunk >= 0)
+
+    def contents(self):
+        """Return the stored values ordered by their indexes.
+
+        Values of different shapes (e.g. spectra of different lengths) are
+        returned in an array of objects.
+
+        :return: values with the index along the first dimension
+        :rtype: numpy.ndarray
+        """
+        with self._lock:
+            chunks = list(map(_stack_values, self._chunks))
+            indexes = numpy.flatnonzero(self._chunk >= 0)
+            chunk, row = self._chunk[indexes], self._row[indexes]
+        if len(chunks) == 0:
+            return numpy.empty(0)
+        try:
+            array = numpy.concatenate(chunks)
+        except ValueError:
+            array = None
+        if array is None or array.ndim != numpy.ndim(chunks[0]):
+            # values of different shapes
+            array = numpy.empty(len(indexes), dtype=object)
+            for i, (chunk_idx, row_idx) in enumerate(zip(chunk, row)):
+                array[i] = chunks[chunk_idx][row_idx]
+            return array
+        offsets = numpy.cumsum([0] + [len(values) for values in chunks])
+        return array[offsets[chunk] + row]
+
+    def __getitem__(self, index):
+        # the arrays are replaced and updated by extend and clear
+        with self._lock:
+            try:
+                chunk = self._chunk[index] if index >= 0 else -1
+            except (IndexError, TypeError):
+                chunk = -1
+            if chunk < 0:
+                raise KeyError(index)
+            return self._chunks[chunk][self._row[index]]
+
+    def __iter__(self):
+        return iter(self.indexes().tolist())
+
+    def __len__(self):
+        with self._lock:
+            return int(numpy.count_nonzero(self._chunk >= 0))
+
+
 class InterruptException(Exception):
     pass
 
@@ -705,7 +851,7 @@ class ExpChannel(PoolElement):
         self._last_value_ref_pattern = None
         self._last_value_ref_enabled = None
 
-        self._value_buffer = {}
+        self._value_buffer = IndexedBuffer()
         self._value_buffer_cb = None
         codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
         self._value_buffer_codec = CodecFactory().getCodec(codec_name)
@@ -759,10 +905,7 @@ class ExpChannel(PoolElement):
         if value_buffer is None:
             return
         _, value_buffer = self._value_buffer_codec.decode(value_buffer)
-        indexes = value_buffer["index"]
-        values = value_buffer["value"]
-        for index, value in zip(indexes, values):
-            self._value_buffer[index] = value
+        self._value_buffer.extend(value_buffer["index"], value_buffer["value"])
 
     def getValueRefObj(self):
         """Return ValueRef attribute event generator object.
@@ -1473,9 +1616,8 @@ class MGConfiguration(object):
         for ctrl_name, ctrl_data in list(self.controllers.items()):
             try:
                 if ctrl_name != '__tango__':
-                    proxy = DeviceProxy(ctrl_name)
                     ctrl_full_name = ctrl_name
-                    ctrl_name = proxy.alias()
+                    ctrl_name = _get_alias(ctrl_full_name)
                     self.controllers_alias[ctrl_full_name] = ctrl_name
 
                 controllers_names[ctrl_name] = ctrl_data
@@ -1548,17 +1690,6 @@ class MGConfiguration(object):
                     dev_name = "tango://{0}:{1}/{2}".format(host, port,
                                                             dev_name)
                 dev_data = tg_dev_chs.get(dev_name)
-                # technical debt: read Value or ValueRef attribute
-                # ideally the source configuration should include this info
-                # Use DeviceProxy instead of taurus to avoid crashes in Py3
-                # See: tango-controls/pytango#292
-                # channel = Device(dev_name)
-                # if (isinstance(channel, ExpChannel)
-                #         and channel.isReferable()
-                #         and channel_data.get("value_ref_enabled", False)):
-                if (_is_referable(dev_name)
-                        and channel_data.get("value_ref_enabled", False)):
-                    attr_name += "Ref"
                 if dev_data is None:
                     # Build tango device
                     dev = None
@@ -1568,6 +1699,17 @@ class MGConfiguration(object):
                         self.tango_dev_channels_in_error += 1
                     tg_dev_chs[dev_name] = dev_data = [dev, CaselessDict()]
                 dev, attr_data = dev_data
+                # technical debt: read Value or ValueRef attribute
+                # ideally the source configuration should include this info
+                # Use DeviceProxy instead of taurus to avoid crashes in Py3
+                # See: tango-controls/pytango#292
+                # channel = Device(dev_name)
+                # if (isinstance(channel, ExpChannel)
+                #         and channel.isReferable()
+                #         and channel_data.get("value_ref_enabled", False)):
+                if (channel_data.get("value_ref_enabled", False)
+                        and _is_referable(dev or dev_name)):
+                    attr_name += "Ref"
                 attr_data[attr_name] = channel_data
 
                 # get attribute configuration
@@ -1685,7 +1827,7 @@ class MGConfiguration(object):
             channels_info.pop(idx)
         return channels_info
 
-    def getTangoDevChannels(self, only_enabled=False):
+    def getTangoDevChannels(self, only_enabled=False, exclude=None):
         """Returns Tango channels (attributes) that could be used to read
         measurement group results in a form of dict where key is a device name
         and value is a list with two elements:
@@ -1695,32 +1837,41 @@ class MGConfiguration(object):
 
         :param only_enabled: flag to filter out disabled channels
         :type only_enabled: bool
+        :param exclude: channels full names to filter out (optional)
+        :type exclude: seq<str>
         :return: dict with Tango channels
         :rtype: dict<str, list[DeviceProxy, CaselessDict<str, dict>]>
         """
-        if not only_enabled:
+        if not only_enabled and not exclude:
             return self.tango_dev_channels
+        if exclude:
+            exclude = CaselessDict([(name, None) for name in exclude])
         tango_dev_channels = {}
         for dev_name, dev_data in list(self.tango_dev_channels.items()):
             dev_proxy, attrs = dev_data[0], copy.deepcopy(dev_data[1])
             for attr_name, channel_data in list(attrs.items()):
-                if not channel_data["enabled"]:
+                if only_enabled and not channel_data["enabled"]:
+                    attrs.pop(attr_name)
+                elif exclude and channel_data["full_name"] in exclude:
                     attrs.pop(attr_name)
+            if len(attrs) == 0:
+                continue
             tango_dev_channels[dev_name] = [dev_proxy, attrs]
         return tango_dev_channels
 
-    def read(self, parallel=True):
+    def read(self, parallel=True, exclude=None):
         if parallel:
-            return self._read_parallel()
-        return self._read()
+            return self._read_parallel(exclude)
+        return self._read(exclude)
 
-    def _read_parallel(self):
+    def _read_parallel(self, exclude=None):
         self.prepare()
         ret = CaselessDict(self.cache)
         dev_replies = {}
 
         # deposit read requests
-        tango_dev_channels = self.getTangoDevChannels(only_enabled=True)
+        tango_dev_channels = self.getTangoDevChannels(only_enabled=True,
+                                                      exclude=exclude)
         for _, dev_data in list(tango_dev_channels.items()):
             dev, attrs = dev_data
             if dev is None:
@@ -1749,10 +1900,11 @@ class MGConfiguration(object):
 
         return ret
 
-    def _read(self):
+    def _read(self, exclude=None):
         self.prepare()
         ret = CaselessDict(self.cache)
-        tango_dev_channels = self.getTangoDevChannels(only_enabled=True)
+        tango_dev_channels = self.getTangoDevChannels(only_enabled=True,
+                                                      exclude=exclude)
         for _, dev_data in list(tango_dev_channels.items()):
             dev, attrs = dev_data
             try:
@@ -2316,8 +2468,8 @@ class MGConfiguration(object):
     def _getMonitor(self):
         return self.channels[self.monitor]
 
-    def getValues(self, parallel=True):
-        return self.read(parallel=parallel)
+    def getValues(self, parallel=True, exclude=None):
+        return self.read(parallel=parallel, exclude=exclude)
 
     def _getCounters(self):
         return [c for c in self.getChannels() if c['full_name'] != self.timer]
@@ -2409,6 +2561,8 @@ class MeasurementGroup(PoolElement):
         self._configuration = None
         self._channels = None
         self._last_integ_time = None
+        self._last_nb_starts = None
+        self._last_moveable = None
         self.call__init__(PoolElement, name, **kw)
 
         self._flg_event = threading.Event()
@@ -2425,7 +2579,21 @@ class MeasurementGroup(PoolElement):
         codec_name = getattr(sardanacustomsettings, "VALUE_REF_BUFFER_CODEC")
         self._value_ref_buffer_codec = CodecFactory().getCodec(codec_name)
 
+        self._count_session = False
+        self._count_session_timeout = None
+        self._count_session_cfg_changed = False
+        self._count_session_lock = threading.Lock()
+        self._count_session_event = threading.Event()
+        # dict<str, TangoAttributeEG> where key is a channel full name and
+        # value is its value buffer event generator
+        self._count_session_channels = CaselessDict()
+        self._count_session_values = CaselessDict()
+        # whether a count waits for the value buffer events - events of
+        # finished counts are ignored
+        self._count_session_armed = False
+
     def cleanUp(self):
+        self.stopCountSession()
         PoolElement.cleanUp(self)
         f = self.factory()
         f.removeExistingAttribute(self.__cfg_attr)
@@ -2460,6 +2628,7 @@ class MeasurementGroup(PoolElement):
             return
         self.info("Configuration changed")
         self._setConfiguration(evt_value.rvalue)
+        self._count_session_cfg_changed = True
         self._flg_event.set()
 
     def getValueBuffers(self):
@@ -2476,6 +2645,7 @@ class MeasurementGroup(PoolElement):
         return self._getAttrEG('IntegrationTime')
 
     def setIntegrationTime(self, ctime):
+        self._last_integ_time = ctime
         self.getIntegrationTimeObj().write(ctime)
 
     def putIntegrationTime(self, ctime):
@@ -3068,8 +3238,8 @@ class MeasurementGroup(PoolElement):
     def getCountersInfo(self):
         return self.getConfiguration().getCountersInfoList()
 
-    def getValues(self, parallel=True):
-        return self.getConfiguration().getValues(parallel)
+    def getValues(self, parallel=True, exclude=None):
+        return self.getConfiguration().getValues(parallel, exclude)
 
     def getChannels(self):
         return self.getConfiguration().getChannels()
@@ -3146,8 +3316,14 @@ class MeasurementGroup(PoolElement):
         return self._getAttrEG('NbStarts')
 
     def setNbStarts(self, starts):
+        self._last_nb_starts = starts
         self.getNbStartsObj().write(starts)
 
+    def putNbStarts(self, starts):
+        if self._last_nb_starts == starts:
+            return
+        self.setNbStarts(starts)
+
     def getNbStarts(self):
         return self._getAttrValue('NbStarts')
 
@@ -3166,8 +3342,16 @@ class MeasurementGroup(PoolElement):
     def setMoveable(self, moveable=None):
         if moveable is None:
             moveable = 'None'  # Tango attribute is of type DevString
+        self._last_moveable = moveable
         self.getMoveableObj().write(moveable)
 
+    def putMoveable(self, moveable=None):
+        if moveable is None:
+            moveable = 'None'  # Tango attribute is of type DevString
+        if self._last_moveable == moveable:
+            return
+        self.setMoveable(moveable)
+
     def valueBufferChanged(self, channel, value_buffer):
         """Receive value buffer updates, pre-process them, and call
         the subscribed callback.
@@ -3182,9 +3366,9 @@ class MeasurementGroup(PoolElement):
             return
         _, value_buffer = self._value_buffer_codec.decode(value_buffer)
         values = value_buffer["value"]
-        if isinstance(values[0], list):
-            np_values = list(map(numpy.array, values))
-            value_buffer["value"] = np_values
+        # spectra and images are passed as one array per chunk
+        if len(values) > 0 and isinstance(values[0], (list, numpy.ndarray)):
+            value_buffer["value"] = _stack_values(values)
         self._value_buffer_cb(channel, value_buffer)
 
     def subscribeValueBuffer(self, cb=None):
@@ -3314,6 +3498,148 @@ class MeasurementGroup(PoolElement):
                     channel.valueRefBufferChanged)
         self._value_ref_buffer_channels = None
 
+    def startCountSession(self, timeout=1):
+        """Start counting session.
+
+        Within the session the configuration, integration time, number of
+        starts and moveable are written to the server only when they change
+        and the values of the scalar channels arrive with the value buffer
+        events instead of being read after each count. Channels which do not
+        report the value buffer events within the timeout are read instead
+        for the rest of the session.
+
+        .. note::
+            The counting session API has been included in Sardana on
+            a provisional basis. Backwards incompatible changes (up to and
+            including removal of the API) may occur if deemed necessary
+            by the core developers.
+
+        :param timeout: maximum time to wait for the value buffer events
+          after the count finishes (seconds)
+        :type timeout: :obj:`float`
+        """
+        if self._count_session:
+            self.stopCountSession()
+        # other clients may have changed the parameters meanwhile
+        self._last_integ_time = None
+        self._last_nb_starts = None
+        self._last_moveable = None
+        self._count_session_timeout = timeout
+        self._count_session_cfg_changed = True
+        self._count_session = True
+
+    def stopCountSession(self):
+        """Stop counting session started with
+        `~sardana.taurus.core.tango.sardana.pool.MeasurementGroup.startCountSession`.
+        """
+        if not self._count_session:
+            return
+        self._count_session = False
+        self._unsubscribeCountSession()
+
+    def isCountSessionActive(self):
+        return self._count_session
+
+    def _subscribeCountSession(self):
+        cfg = self.getConfiguration()
+        cfg.prepare()
+        channels = CaselessDict()
+        for channel_data in cfg.getChannels():
+            if not channel_data.get("enabled", True):
+                continue
+            # external (Tango attribute) channels do not have value buffer
+            if channel_data.get("_controller_name", "__tango__") \
+                    == "__tango__":
+                continue
+            # avoid transferring spectra and images in value buffer events
+            if channel_data.get("ndim", 0) > 0:
+                continue
+            if channel_data.get("value_ref_enabled", False):
+                continue
+            full_name = channel_data["full_name"]
+            try:
+                channel = Device(full_name)
+                value_buffer_obj = channel.getValueBufferObj()
+                value_buffer_obj.subscribeEvent(
+                    self._countSessionValueBufferChanged, full_name, False)
+            except Exception:
+                self.debug("Could not subscribe to %s value buffer, its "
+                           "value will be read", full_name, exc_info=1)
+                continue
+            channels[full_name] = value_buffer_obj
+        with self._count_session_lock:
+            self._count_session_channels = channels
+
+    def _unsubscribeCountSession(self, channels=None):
+        with self._count_session_lock:
+            if channels is None:
+                channels = list(self._count_session_channels.keys())
+            value_buffer_objs = []
+            for full_name in channels:
+                value_buffer_obj = self._count_session_channels.pop(full_name)
+                value_buffer_objs.append((full_name, value_buffer_obj))
+        for full_name, value_buffer_obj in value_buffer_objs:
+            try:
+                value_buffer_obj.unsubscribeEvent(
+                    self._countSessionValueBufferChanged, full_name)
+            except Exception:
+                self.debug("Could not unsubscribe from %s value buffer",
+                           full_name, exc_info=1)
+
+    def _prepareCountSession(self):
+        if not self._count_session_cfg_changed:
+            return
+        self._count_session_cfg_changed = False
+        self._unsubscribeCountSession()
+        self._subscribeCountSession()
+
+    def _armCountSession(self):
+        with self._count_session_lock:
+            self._count_session_armed = True
+            self._count_session_values = CaselessDict()
+            if len(self._count_session_channels) == 0:
+                self._count_session_event.set()
+            else:
+                self._count_session_event.clear()
+
+    def _countSessionValueBufferChanged(self, full_name, value_buffer):
+        if value_buffer is None:
+            return
+        _, value_buffer = self._value_buffer_codec.decode(value_buffer)
+        with self._count_session_lock:
+            channels = self._count_session_channels
+            if full_name not in channels:
+                return
+            # each start of a prepared acquisition publishes its value
+            # with the index 0, so the count takes the first event of each
+            # channel after arming and ignores the late ones
+            values = self._count_session_values
+            if not self._count_session_armed or full_name in values:
+                return
+            values[full_name] = value_buffer["value"][-1]
+            if len(values) == len(channels):
+                self._count_session_event.set()
+
+    def _getCountValues(self):
+        if not self._count_session:
+            return self.getValues()
+        exclude = list(self._count_session_channels.keys())
+        values = self.getValues(exclude=exclude)
+        if not self._count_session_event.wait(self._count_session_timeout):
+            with self._count_session_lock:
+                missing = [name for name in self._count_session_channels
+                           if name not in self._count_session_values]
+            self.warning("Value buffer events of %s did not arrive, their "
+                         "values will be read in this counting session",
+                         ", ".join(missing))
+            self._unsubscribeCountSession(missing)
+            values.update(self.getValues(
+                exclude=list(self._count_session_channels.keys())))
+        with self._count_session_lock:
+            self._count_session_armed = False
+            values.update(self._count_session_values)
+        return values
+
     def _start(self, *args, **kwargs):
         try:
             self.Start()
@@ -3329,7 +3655,8 @@ class MeasurementGroup(PoolElement):
     def prepare(self):
         self.command_inout("Prepare")
 
-    def count_raw(self, start_time=None):
+    @profiled("mg.count_raw")
+    def count_raw(self, start_time=None, post_count_cb=None):
         """Raw count and report count values.
 
         Simply start and wait until finish, no configuration nor preparation.
@@ -3343,22 +3670,32 @@ class MeasurementGroup(PoolElement):
         :param start_time: start time of the whole count operation, if not
           passed a current timestamp will be used
         :type start_time: :obj:`float`
+        :param post_count_cb: callable executed as soon as the counting
+          finishes and before the values are read (optional), it allows to
+          overlap other operations e.g. motion with the values readout
+        :type post_count_cb: callable
         :return: channel names and values (or value references - experimental)
         :rtype: :obj:`dict` where keys are channel full names and values are
           channel values (or value references - experimental)
         """
         if start_time is None:
             start_time = time.time()
+        if self._count_session:
+            self._prepareCountSession()
+            self._armCountSession()
         PoolElement.go(self)
+        if post_count_cb is not None:
+            post_count_cb()
         state = self.getStateEG().readValue()
         if state == Fault:
             msg = "Measurement group ended acquisition with Fault state"
             raise Exception(msg)
-        values = self.getValues()
+        values = self._getCountValues()
         ret = state, values
         self._total_go_time = time.time() - start_time
         return ret
 
+    @profiled("mg.count")
     def go(self, *args, **kwargs):
         """Count and report count values.
 
@@ -3376,16 +3713,26 @@ class MeasurementGroup(PoolElement):
           channel values (or value references - experimental)
         """
         start_time = time.time()
-        cfg = self.getConfiguration()
-        cfg.prepare()
+        post_count_cb = kwargs.get("post_count_cb")
+        if self._count_session:
+            self._prepareCountSession()
+        else:
+            cfg = self.getConfiguration()
+            cfg.prepare()
         integration_time = args[0]
         if integration_time is None or integration_time == 0:
+            if post_count_cb is not None:
+                post_count_cb()
             return self.getStateEG().readValue(), self.getValues()
         self.putIntegrationTime(integration_time)
-        self.setMoveable(None)
-        self.setNbStarts(1)
+        if self._count_session:
+            self.putMoveable(None)
+            self.putNbStarts(1)
+        else:
+            self.setMoveable(None)
+            self.setNbStarts(1)
         self.prepare()
-        return self.count_raw(start_time)
+        return self.count_raw(start_time, post_count_cb=post_count_cb)
 
     def count_continuous(self, synch_description, value_buffer_cb=None,
                          value_ref_buffer_cb=None):
@@ -3668,6 +4015,33 @@ class Pool(TangoDevice, MoveableSource):
             moveable = self.createMotorGroup(name, names)
         return moveable
 
+    def readPositions(self, names, cache_policy="auto"):
+        """Read positions, dial positions and states of many moveables
+        with a single request (hardware is accessed once per controller).
+
+        :param names: moveable names
+        :type names: seq<str>
+        :param cache_policy: ``"auto"``, ``"cache"`` or ``"hardware"``
+            (see :meth:`sardana.pool.pool.Pool.read_positions`)
+        :type cache_policy: str
+        :return: list of dicts (one per moveable) with name, position,
+                 dial_position, state and error
+        :rtype: list<dict>"""
+        argin = dict(names=list(names), cache_policy=cache_policy)
+        ret = self.command_inout("ReadPositions", json.dumps(argin))
+        return json.loads(ret)
+
+    def getTelemetry(self, reset=False):
+        """Read the Pool telemetry: latency histograms of the controller
+        methods, of the action loops and of the element locks and the depth
+        of the jobs queue (see Pool's GetTelemetry command).
+
+        :param reset: clear the telemetry after reading it
+        :type reset: bool
+        :return: telemetry data
+        :rtype: dict"""
+        return json.loads(self.command_inout("GetTelemetry", reset))
+
     def __findMotorGroupWithElems(self, names):
         names_lower = list(map(str.lower, names))
         len_names = len(names)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Benchmark of the client side value buffer handling (not part of the
+test suite).
+
+Run it with::
+
+    python -m sardana.taurus.core.tango.sardana.test.bench_valuebuffer
+"""
+
+import time
+
+import numpy
+
+from taurus.core.util.codecs import CodecFactory
+
+from sardana import sardanacustomsettings
+from sardana.taurus.core.tango.sardana.pool import IndexedBuffer
+
+
+def _decode_loop(codec, chunks):
+    # value buffer handling before the IndexedBuffer
+    value_buffer = {}
+    for chunk in chunks:
+        _, data = codec.decode(chunk)
+        values = data["value"]
+        if isinstance(values[0], list):
+            values = list(map(numpy.array, values))
+        # values were stored one by one
+        for index, value in zip(data["index"], values):
+            value_buffer[index] = value
+    return value_buffer
+
+
+def _decode_vectorized(codec, chunks):
+    value_buffer = IndexedBuffer()
+    for chunk in chunks:
+        _, data = codec.decode(chunk)
+        value_buffer.extend(data["index"], data["value"])
+    return value_buffer
+
+
+def benchmark(nb_points=10000, shape=(), chunk_size=100, codec_name=None,
+              repeat=3):
+    """Compare the value buffer handling of the loop and vectorized paths.
+
+    :param nb_points: number of acquired points
+    :param shape: shape of the value (``()`` for scalars)
+    :param chunk_size: number of values per value buffer event
+    :param codec_name: codec of the events (default: VALUE_BUFFER_CODEC)
+    :param repeat: number of runs of each path (the best one is taken)
+    :return: points per second of the loop and the vectorized paths
+    :rtype: tuple(float, float)
+    """
+    if codec_name is None:
+        codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
+    codec = CodecFactory().getCodec(codec_name)
+    values = numpy.random.random((nb_points,) + tuple(shape))
+    chunks = []
+    for start in range(0, nb_points, chunk_size):
+        end = min(start + chunk_size, nb_points)
+        # like PoolExpChannelDevice._encode_value_chunk: a list of scalars
+        # or a list of arrays (lists if the codec can not encode arrays)
+        if len(shape) == 0 or codec_name == "json":
+            value = values[start:end].tolist()
+        else:
+            value = list(values[start:end])
+        data = dict(index=list(range(start, end)), value=value)
+        chunks.append(codec.encode(("", data)))
+    rates = []
+    for decode in (_decode_loop, _decode_vectorized):
+        best = float("inf")
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            value_buffer = decode(codec, chunks)
+            nb_values = len(value_buffer)
+            best = min(best, time.perf_counter() - start_time)
+            assert nb_values == nb_points
+            del value_buffer
+        rates.append(nb_points / best)
+    return tuple(rates)
+
+
+if __name__ == "__main__":
+    print("{:>10} {:>12} {:>8} {:>14} {:>14}".format(
+        "points", "shape", "chunk", "loop [pt/s]", "vector [pt/s]"))
+    for nb_points, shape, chunk_size in ((100000, (), 1000),
+                                         (10000, (1024,), 100),
+                                         (1000, (256, 256), 10)):
+        rates = benchmark(nb_points, shape, chunk_size)
+        print("{:>10} {:>12} {:>8} {:>14.0f} {:>14.0f}".format(
+            nb_points, str(shape), chunk_size, *rates))
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests of the client side experiment configuration cache"""
+
+import json
+import unittest
+from unittest import mock
+
+from taurus.core.taurusbasetypes import TaurusEventType
+from taurus.core.util.containers import CaselessDict
+
+from sardana.taurus.core.tango.sardana import macroserver, pool
+from sardana.taurus.core.tango.sardana.macroserver import \
+    ExperimentConfiguration
+
+
+class _MntGrp(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.full_name = "tango://host:10000/mntgrp/pool/" + name
+
+
+class _Group(object):
+
+    def __init__(self, configs, reads):
+        self._configs = configs
+        self._reads = reads
+        self._names = []
+
+    def add(self, names):
+        self._names.extend(names)
+
+    def read_attribute(self, attr_name):
+        replies = []
+        for name in self._names:
+            self._reads.append(name)
+            reply = mock.Mock()
+            reply.get_data().value = json.dumps(self._configs[name])
+            replies.append(reply)
+        return replies
+
+
+class ExperimentConfigurationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        mnt_grps = [_MntGrp("mg1"), _MntGrp("mg2")]
+        self.mnt_grps = CaselessDict((mg.full_name, mg) for mg in mnt_grps)
+        self.configs = {mg.full_name: {"label": mg.name} for mg in mnt_grps}
+        self.reads = []
+        self.attrs = {}
+        door = mock.Mock()
+        door.getEnvironment.return_value = dict(ActiveMntGrp="mg1")
+        door.macro_server.getElementsOfType.return_value = self.mnt_grps
+        self.expconf = ExperimentConfiguration(door)
+        group = mock.patch.object(
+            macroserver.PyTango, "Group",
+            side_effect=lambda _: _Group(self.configs, self.reads))
+        factory = mock.patch.object(macroserver, "Factory")
+        group.start()
+        self.addCleanup(group.stop)
+        factory.start().return_value.getAttribute.side_effect = \
+            self._getAttribute
+        self.addCleanup(factory.stop)
+
+    def _getAttribute(self, name):
+        return self.attrs.setdefault(name, mock.Mock())
+
+    def _get_labels(self):
+        configs = self.expconf.get()["MntGrpConfigs"]
+        return {name: cfg["label"] for name, cfg in configs.items()}
+
+    def _change(self, mnt_grp, label):
+        attr = self.attrs[mnt_grp.full_name + "/configuration"]
+        value = mock.Mock(rvalue=json.dumps({"label": label}))
+        self.expconf._onMntGrpConfigurationChanged(
+            attr, TaurusEventType.Change, value)
+
+    def test_cache(self):
+        self.assertEqual(self._get_labels(), {"mg1": "mg1", "mg2": "mg2"})
+        self.assertEqual(len(self.reads), 2)
+        self.assertEqual(len(self.attrs), 2)
+        # cached configurations are not read again
+        self._get_labels()
+        self.assertEqual(len(self.reads), 2)
+        # callers can not modify the cache
+        self.expconf.get()["MntGrpConfigs"]["mg1"]["label"] = "modified"
+        self.assertEqual(self._get_labels()["mg1"], "mg1")
+
+    def test_change_event(self):
+        self._get_labels()
+        mg1 = list(self.mnt_grps.values())[0]
+        self._change(mg1, "new")
+        self.assertEqual(self._get_labels(), {"mg1": "new", "mg2": "mg2"})
+        self.assertEqual(len(self.reads), 2)
+
+    def test_elements_change(self):
+        self._get_labels()
+        mg1, mg2 = list(self.mnt_grps.values())
+        # mg1 was changed (new element info) and mg2 was deleted
+        self.mnt_grps.pop(mg2.full_name)
+        self.mnt_grps[mg1.full_name] = _MntGrp("mg1")
+        self.configs[mg1.full_name] = {"label": "recreated"}
+        self.assertEqual(self._get_labels(), {"mg1": "recreated"})
+        self.assertEqual(self.reads[2:], [mg1.full_name])
+        attr = self.attrs[mg2.full_name + "/configuration"]
+        attr.removeListener.assert_called_once_with(
+            self.expconf._onMntGrpConfigurationChanged)
+
+    def test_invalidate(self):
+        self._get_labels()
+        self.expconf.invalidate(["mg2"])
+        self._get_labels()
+        self.assertEqual(self.reads[2:], [list(self.mnt_grps)[1]])
+        self.expconf.get(cache=False)
+        self.assertEqual(len(self.reads), 5)
+
+    def test_elements_change_aliases(self):
+        self.addCleanup(pool._ALIASES.clear)
+        pool._ALIASES["tango://host:10000/controller/dummy/ctrl01"] = "ctrl01"
+        ms = mock.Mock()
+        value = mock.Mock(rvalue=("json", json.dumps(
+            {"new": [{"full_name": "mg3"}]})))
+        macroserver.BaseMacroServer._on_elements_changed(
+            ms, None, TaurusEventType.Change, value)
+        self.assertEqual(len(pool._ALIASES), 1)
+        value = mock.Mock(rvalue=("json", json.dumps(
+            {"change": [{"full_name": "ctrl01"}]})))
+        macroserver.BaseMacroServer._on_elements_changed(
+            ms, None, TaurusEventType.Change, value)
+        self.assertEqual(len(pool._ALIASES), 0)
@@ -24,6 +24,7 @@
 ##############################################################################
 
 
+import time
 import uuid
 import numpy
 
@@ -84,6 +85,142 @@ class TestMeasurementGroup(SarTestTestCase, TestCase):
         SarTestTestCase.tearDown(self)
 
 
+@insertTest(helper_name="count_session", test_method_doc="count with PC",
+            elements=["_test_ct_1_1", "_test_ct_1_2", "_test_pc_1_1"])
+@insertTest(helper_name="count_session",
+            test_method_doc="count with Tango attribute",
+            elements=["_test_ct_1_1", "_test_mt_1_1/position"])
+@insertTest(helper_name="count_session", test_method_doc="count with 1D",
+            elements=["_test_ct_1_1", "_test_1d_1_1"])
+@insertTest(helper_name="count_session", test_method_doc="count with 0D",
+            elements=["_test_ct_1_1", "_test_0d_1_1"])
+@insertTest(helper_name="count_session", test_method_doc="count with CT",
+            elements=["_test_ct_1_1", "_test_ct_1_2"])
+@insertTest(helper_name="step_scan_session",
+            test_method_doc="step scan with CT",
+            elements=["_test_ct_1_1", "_test_ct_1_2"])
+class TestMeasurementGroupCountSession(SarTestTestCase, TestCase):
+
+    def setUp(self):
+        SarTestTestCase.setUp(self)
+        registerExtensions()
+
+    def count_session(self, elements, repetitions=3):
+        mg_name = str(uuid.uuid1())
+        argin = [mg_name] + elements
+        self.pool.CreateMeasurementGroup(argin)
+        try:
+            mg = Device(mg_name)
+            mg.startCountSession()
+            try:
+                for integ_time in [.1] * (repetitions - 1) + [.2]:
+                    _, values = mg.count(integ_time)
+                    self.assertEqual(len(values), len(elements))
+                    for channel_name, value in values.items():
+                        msg = "Value (%s) for %s is not numerical" % \
+                              (value, channel_name)
+                        self.assertTrue(is_numerical(value), msg)
+                self.assertEqual(mg.getIntegrationTime(), .2)
+            finally:
+                mg.stopCountSession()
+        finally:
+            mg.cleanUp()
+            self.pool.DeleteElement(mg_name)
+
+    def step_scan_session(self, elements, nb_points=5, integ_time=.1):
+        """Count as the step scans do: prepare once for all the points and
+        start once per point"""
+        mg_name = str(uuid.uuid1())
+        argin = [mg_name] + elements
+        self.pool.CreateMeasurementGroup(argin)
+        try:
+            mg = Device(mg_name)
+            mg.startCountSession(timeout=1)
+            try:
+                mg.putIntegrationTime(integ_time)
+                mg.setNbStarts(nb_points)
+                mg.prepare()
+                for _ in range(nb_points):
+                    start = time.time()
+                    _, values = mg.count_raw()
+                    # the values arrived with the value buffer events
+                    self.assertLess(time.time() - start, integ_time + 1)
+                    self.assertEqual(len(values), len(elements))
+                    for channel_name, value in values.items():
+                        msg = "Value (%s) for %s is not numerical" % \
+                              (value, channel_name)
+                        self.assertTrue(is_numerical(value), msg)
+                # no channel fell back to reading the values
+                self.assertEqual(len(mg._count_session_channels),
+                                 len(elements))
+            finally:
+                mg.stopCountSession()
+        finally:
+            mg.cleanUp()
+            self.pool.DeleteElement(mg_name)
+
+    def tearDown(self):
+        SarTestTestCase.tearDown(self)
+
+
+class TestMeasurementGroupCountSessionEvents(TestCase):
+    """Test the value buffer events handling of the counting session
+    (without the Pool server)."""
+
+    def setUp(self):
+        import threading
+        from taurus.core.util.codecs import CodecFactory
+        from taurus.core.util.containers import CaselessDict
+        from sardana import sardanacustomsettings
+        from sardana.taurus.core.tango.sardana.pool import MeasurementGroup
+
+        mg = MeasurementGroup.__new__(MeasurementGroup)
+        codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
+        mg._value_buffer_codec = CodecFactory().getCodec(codec_name)
+        mg._count_session = True
+        mg._count_session_timeout = 1
+        mg._count_session_lock = threading.Lock()
+        mg._count_session_event = threading.Event()
+        mg._count_session_channels = CaselessDict({"ct01": None})
+        mg._count_session_values = CaselessDict()
+        mg._count_session_armed = False
+        # the values of the channels without value buffer events
+        mg.getValues = lambda exclude=None: {}
+        self.mg = mg
+
+    def _push(self, index, value):
+        data = dict(index=index, value=value)
+        value_buffer = self.mg._value_buffer_codec.encode(('', data))
+        self.mg._countSessionValueBufferChanged("ct01", value_buffer)
+
+    def test_stale_event(self):
+        mg = self.mg
+        mg._armCountSession()
+        self._push([0], [1.])
+        self.assertTrue(mg._count_session_event.is_set())
+        # duplicated event of the same count
+        self._push([0], [5.])
+        self.assertEqual(mg._getCountValues()["ct01"], 1.)
+        # count finished, its late (duplicated) event arrives
+        self._push([0], [1.])
+        mg._armCountSession()
+        self.assertFalse(mg._count_session_event.is_set())
+        self.assertEqual(len(mg._count_session_values), 0)
+        self._push([0], [2.])
+        self.assertTrue(mg._count_session_event.is_set())
+        self.assertEqual(mg._getCountValues()["ct01"], 2.)
+
+    def test_starts(self):
+        """Each start of a prepared acquisition (e.g. step scan point)
+        publishes its value with the index 0"""
+        mg = self.mg
+        for value in (1., 2., 3.):
+            mg._armCountSession()
+            self._push([0], [value])
+            self.assertTrue(mg._count_session_event.is_set())
+            self.assertEqual(mg._getCountValues()["ct01"], value)
+
+
 class TestMeasurementGroupValueRef(SarTestTestCase, TestCase):
 
     def setUp(self):
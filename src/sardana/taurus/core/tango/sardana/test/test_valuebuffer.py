@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests of the client side value buffer handling.
+
+The benchmark of the value buffer handling is in
+:mod:`sardana.taurus.core.tango.sardana.test.bench_valuebuffer`.
+"""
+
+import threading
+import unittest
+
+import numpy
+
+from taurus.core.util.codecs import CodecFactory
+
+from sardana import sardanacustomsettings
+from sardana.taurus.core.tango.sardana.pool import ExpChannel, \
+    IndexedBuffer, _stack_values
+
+
+class IndexedBufferTestCase(unittest.TestCase):
+
+    def test_scalars(self):
+        buffer_ = IndexedBuffer()
+        buffer_.extend([0, 1, 2], [1, 2, 3])
+        buffer_.extend([3, 4], [4.5, 5.5])
+        self.assertEqual(len(buffer_), 5)
+        self.assertEqual(list(buffer_), [0, 1, 2, 3, 4])
+        self.assertEqual(buffer_[3], 4.5)
+        numpy.testing.assert_array_equal(buffer_.contents(),
+                                         [1, 2, 3, 4.5, 5.5])
+        buffer_.clear()
+        self.assertEqual(len(buffer_), 0)
+
+    def test_spectra(self):
+        buffer_ = IndexedBuffer()
+        values = numpy.arange(3 * 4).reshape(3, 4)
+        buffer_.extend([2, 0, 1], values.tolist())
+        self.assertEqual(buffer_.contents().shape, (3, 4))
+        numpy.testing.assert_array_equal(buffer_[2], values[0])
+        numpy.testing.assert_array_equal(buffer_.contents()[0], values[1])
+
+    def test_growth(self):
+        buffer_ = IndexedBuffer()
+        nb_values = 3000
+        indexes = numpy.arange(nb_values)
+        for chunk in numpy.array_split(indexes, 7):
+            buffer_.extend(chunk, chunk * 2)
+            # merge the chunks on each access
+            self.assertEqual(len(buffer_), chunk[-1] + 1)
+        self.assertEqual(len(buffer_), nb_values)
+        numpy.testing.assert_array_equal(buffer_.contents(), indexes * 2)
+
+    def test_missing(self):
+        buffer_ = IndexedBuffer()
+        buffer_.extend([1, 3], [10, 30])
+        self.assertEqual(list(buffer_.items()), [(1, 10), (3, 30)])
+        self.assertNotIn(0, buffer_)
+        self.assertNotIn(2, buffer_)
+        self.assertNotIn(-1, buffer_)
+        self.assertNotIn(5000, buffer_)
+        self.assertRaises(KeyError, buffer_.__getitem__, 2)
+
+    def test_ragged(self):
+        buffer_ = IndexedBuffer()
+        buffer_.extend([0, 1], [[1, 2], [3, 4]])
+        self.assertEqual(buffer_.contents().shape, (2, 2))
+        buffer_.extend([2], [[5, 6, 7]])
+        self.assertEqual(len(buffer_), 3)
+        numpy.testing.assert_array_equal(buffer_[1], [3, 4])
+        numpy.testing.assert_array_equal(buffer_[2], [5, 6, 7])
+
+    def test_stack_values(self):
+        stacked = _stack_values([numpy.zeros((2, 3)), numpy.ones((2, 3))])
+        self.assertIsInstance(stacked, numpy.ndarray)
+        self.assertEqual(stacked.shape, (2, 2, 3))
+        ragged = _stack_values([[1, 2], [3]])
+        self.assertEqual(len(ragged), 2)
+        numpy.testing.assert_array_equal(ragged[1], [3])
+
+
+class ExpChannelValueBufferTestCase(unittest.TestCase):
+    """Test of the value buffer events handling of the ExpChannel"""
+
+    def setUp(self):
+        codec_name = getattr(sardanacustomsettings, "VALUE_BUFFER_CODEC")
+        self.codec = CodecFactory().getCodec(codec_name)
+        self.json = codec_name == "json"
+        self.channel = ExpChannel.__new__(ExpChannel)
+        self.channel._value_buffer = IndexedBuffer()
+        self.channel._value_buffer_codec = self.codec
+
+    def _push(self, indexes, values):
+        # like PoolExpChannelDevice._encode_value_chunk: a list of scalars
+        # or a list of arrays (lists if the codec can not encode arrays)
+        if self.json or numpy.ndim(values) == 1:
+            values = numpy.asarray(values).tolist()
+        else:
+            values = list(values)
+        data = dict(index=list(indexes), value=values)
+        self.channel.valueBufferChanged(self.codec.encode(("", data)))
+
+    def _check(self, values):
+        value_buffer = self.channel.getValueBuffer()
+        # indexes are continuous and ordered
+        self.assertEqual(list(value_buffer), list(range(len(values))))
+        numpy.testing.assert_array_equal(value_buffer.contents(), values)
+        for index in (0, len(values) // 2, len(values) - 1):
+            numpy.testing.assert_array_equal(value_buffer[index],
+                                             values[index])
+
+    def test_scalars(self):
+        values = numpy.random.random(1000)
+        for start in range(0, 1000, 100):
+            self._push(range(start, start + 100), values[start:start + 100])
+        self._check(values)
+
+    def test_spectra(self):
+        values = numpy.random.random((100, 64))
+        for start in range(0, 100, 10):
+            self._push(range(start, start + 10), values[start:start + 10])
+        self._check(values)
+
+    def test_unordered_chunks(self):
+        values = numpy.random.random(300)
+        for start in (200, 0, 100):
+            self._push(range(start, start + 100), values[start:start + 100])
+        self._check(values)
+
+    def test_concurrent_access(self):
+        """Test reading the buffer while the events are stored"""
+        values = numpy.arange(20000, dtype=float)
+        errors = []
+
+        def read():
+            value_buffer = self.channel.getValueBuffer()
+            while not done.is_set():
+                for index in list(value_buffer)[-10:]:
+                    try:
+                        if value_buffer[index] != index:
+                            errors.append(index)
+                    except Exception as e:
+                        errors.append(e)
+
+        done = threading.Event()
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for start in range(0, len(values), 10):
+                self._push(range(start, start + 10),
+                           values[start:start + 10])
+        finally:
+            done.set()
+            reader.join()
+        self.assertEqual(errors, [])
+        self._check(values)
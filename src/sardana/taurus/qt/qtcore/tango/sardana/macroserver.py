@@ -77,7 +77,8 @@ class QDoor(BaseDoor, Qt.QObject):
         if t not in CHANGE_EVTS:
             return
         res = BaseDoor.recordDataReceived(self, s, t, v)
-        self.recordDataUpdated.emit(res)
+        for record_data in self.splitRecordData(res):
+            self.recordDataUpdated.emit(record_data)
         return res
 
     def macroStatusReceived(self, s, t, v):
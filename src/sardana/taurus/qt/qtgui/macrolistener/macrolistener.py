@@ -39,6 +39,7 @@ to be used within a TaurusGui for managing panels for:
 
 from builtins import object
 
+import time
 import datetime
 import collections
 
@@ -54,6 +55,7 @@ from taurus.qt.qtgui.base import TaurusBaseComponent
 from taurus.core.util.containers import ArrayBuffer, LoopList
 
 from sardana.taurus.core.tango.sardana import PlotType
+from sardana.util.decimation import MinMaxDecimator
 
 
 __all__ = ['MacroBroker', 'DynamicPlotManager', 'assertPlotAvailability']
@@ -88,6 +90,12 @@ def empty_data(nb_points):
 
 class MultiPlotWidget(Qt.QWidget):
 
+    # refresh period limits (in seconds), between them the period adapts
+    # to keep the rendering below ~1/RenderLoadFactor of the GUI time
+    MinUpdatePeriod = 0.2
+    MaxUpdatePeriod = 2.0
+    RenderLoadFactor = 10
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = Qt.QVBoxLayout(self)
@@ -130,6 +138,7 @@ class MultiPlotWidget(Qt.QWidget):
                              symbolSize=5, symbolPen=pen, symbolBrush=pen)
                 curve_item = plot_widget.plot(name=curve['label'], **style)
                 curve_item.curve_data = empty_data(nb_points)
+                curve_item.decimator = MinMaxDecimator()
                 plot_curves[curve['name']] = curve_item
             plot_widgets[plot_widget] = plot_curves
         self._plots = plot_widgets
@@ -156,19 +165,37 @@ class MultiPlotWidget(Qt.QWidget):
         if self._event_nb == self._last_event_nb:
             return
         self._last_event_nb = self._event_nb
+        start_time = time.time()
         for plot_widget, curves in self._plots.items():
             x_axis = plot_widget.x_axis
-            x_data = x_axis['data']
+            x_data = x_axis['data'].contents()
+            # points discarded by the buffers once they got full
+            offset = self._event_nb - len(x_data)
+            # there is no point to draw more than 2 points per pixel
+            nb_bins = max(int(plot_widget.getViewBox().width()), 1)
             for curve_name, curve_item in curves.items():
-                y_data = curve_item.curve_data
-                curve_item.setData(x_data.contents(), y_data.contents())
+                y_data = curve_item.curve_data.contents()
+                decimator = curve_item.decimator
+                if decimator.nb_bins != nb_bins:
+                    decimator.nb_bins = nb_bins
+                    decimator.reset()
+                x, y = decimator.update(x_data, y_data, offset)
+                curve_item.setData(x, y)
+        self._adapt_update_period(time.time() - start_time)
+
+    def _adapt_update_period(self, render_time):
+        if self._timer is None:
+            return
+        period = render_time * self.RenderLoadFactor
+        period = min(max(period, self.MinUpdatePeriod), self.MaxUpdatePeriod)
+        self._timer.setInterval(int(period * 1000))
 
     def _start_update(self):
         self._end_update()
         timer = Qt.QTimer()
         timer.timeout.connect(self.do_update)
-        # refresh curves at a fix rate of ~5Hz
-        timer.start(200)
+        # refresh curves at ~5Hz, slower if rendering takes long
+        timer.start(int(self.MinUpdatePeriod * 1000))
         self._timer = timer
 
     def _end_update(self):
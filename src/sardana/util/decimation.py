@@ -0,0 +1,120 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides the decimation of curves for plotting"""
+
+__all__ = ["MinMaxDecimator"]
+
+import numpy
+
+
+class MinMaxDecimator(object):
+    """Incrementally reduce a curve to at most *2 x nb_bins* points plus
+    the minimum and maximum of the last, not yet complete, bin.
+
+    Consecutive points are grouped in bins and only the minimum and the
+    maximum of each bin are kept (in their original order), so peaks and
+    spikes remain visible. Only the points appended since the last
+    :meth:`update` are binned. When the number of bins exceeds *nb_bins*
+    the bin size is doubled by merging pairs of already calculated bins.
+    """
+
+    def __init__(self, nb_bins=1024):
+        self.nb_bins = max(int(nb_bins), 1)
+        self.reset()
+
+    def reset(self):
+        self.bin_size = 1
+        self._nb_binned = 0
+        self._offset = 0
+        self._x = numpy.empty(0)
+        self._y = numpy.empty(0)
+
+    @staticmethod
+    def _min_max(x, y, bin_size):
+        # x and y are 1D arrays with a length multiple of bin_size
+        nb_bins = len(y) // bin_size
+        y_bins = y.reshape(nb_bins, bin_size)
+        # NaNs (e.g. missing values) must not win the min/max selection
+        nan = numpy.isnan(y_bins)
+        idx_min = numpy.where(nan, numpy.inf, y_bins).argmin(axis=1)
+        idx_max = numpy.where(nan, -numpy.inf, y_bins).argmax(axis=1)
+        # keep the original order of the minimum and the maximum
+        first = numpy.minimum(idx_min, idx_max)
+        second = numpy.maximum(idx_min, idx_max)
+        start = numpy.arange(nb_bins) * bin_size
+        idx = numpy.empty(2 * nb_bins, dtype=int)
+        idx[0::2] = start + first
+        idx[1::2] = start + second
+        return x[idx], y[idx]
+
+    def update(self, x, y, offset=0):
+        """Returns the decimated curve.
+
+        :param x: all the x values of the curve
+        :type x: numpy.array
+        :param y: all the y values of the curve
+        :type y: numpy.array
+        :param offset: number of points dropped from the beginning of the
+            curve (e.g. by a circular buffer) since it was started
+        :type offset: int
+        :return: decimated x and y values
+        :rtype: tuple(numpy.array, numpy.array)
+        """
+        nb_points = min(len(x), len(y))
+        if offset != self._offset or nb_points < self._nb_binned:
+            self.reset()
+            self._offset = offset
+        if self.bin_size == 1:
+            if nb_points <= 2 * self.nb_bins:
+                return x[:nb_points], y[:nb_points]
+            self.bin_size = 2
+            while nb_points > 2 * self.nb_bins * self.bin_size:
+                self.bin_size *= 2
+        while True:
+            start = self._nb_binned
+            bin_size = self.bin_size
+            end = start + (nb_points - start) // bin_size * bin_size
+            if end > start:
+                x_new, y_new = self._min_max(x[start:end], y[start:end],
+                                             bin_size)
+                self._x = numpy.concatenate((self._x, x_new))
+                self._y = numpy.concatenate((self._y, y_new))
+                self._nb_binned = end
+            if len(self._y) <= 2 * self.nb_bins:
+                break
+            # double the bin size merging pairs of bins, the last bin
+            # without a pair is binned again from the original points
+            if len(self._y) % 4:
+                self._x = self._x[:-2]
+                self._y = self._y[:-2]
+                self._nb_binned -= bin_size
+            self._x, self._y = self._min_max(self._x, self._y, 4)
+            self.bin_size *= 2
+        # points not filling a complete bin yet are reduced as a whole
+        x_tail = x[self._nb_binned:nb_points]
+        y_tail = y[self._nb_binned:nb_points]
+        if len(y_tail) > 2:
+            x_tail, y_tail = self._min_max(x_tail, y_tail, len(y_tail))
+        return (numpy.concatenate((self._x, x_tail)),
+                numpy.concatenate((self._y, y_tail)))
@@ -22,9 +22,9 @@
 ##############################################################################
 
 import time
+import bisect
 import threading
 import math
-import copy
 import numpy
 import traceback
 
@@ -56,6 +56,9 @@ class FunctionGenerator(EventGenerator, Logger):
     """
 
     MAX_NAP_TIME = 0.1
+    #: time (in seconds) before the event which is busy waited (instead of
+    #: sleeping) in order to reduce the time domain events jitter
+    SPIN_TIME = 0.002
 
     def __init__(self, name="FunctionGenerator"):
         EventGenerator.__init__(self)
@@ -67,8 +70,13 @@ class FunctionGenerator(EventGenerator, Logger):
         self._position = None
         self._initial_domain_in_use = None
         self._active_domain_in_use = None
-        self._active_events = list()
-        self._passive_events = list()
+        # event groups: list of tuples with: initial in initial domain,
+        # initial in active domain, total in initial domain, total in active
+        # domain, active and repeats
+        self._groups = []
+        # index of the first event of each group
+        self._group_starts = []
+        self._nb_events = 0
         self._started = False
         self._stopped = False
         self._running = False
@@ -117,27 +125,46 @@ class FunctionGenerator(EventGenerator, Logger):
     active_domain_in_use = property(get_active_domain_in_use,
                                     set_active_domain_in_use)
 
-    def add_active_event(self, event):
-        self._active_events.append(event)
-
-    def set_active_events(self, events):
-        self._active_events = events
+    def get_nb_events(self):
+        return self._nb_events
+
+    nb_events = property(get_nb_events)
+
+    def get_events(self, index):
+        """Returns the active event (in the initial domain) and the passive
+        event (in the active domain) of the given index. Events are
+        calculated from the configuration groups on demand.
+
+        :param index: event index
+        :type index: int
+        :return: active and passive events
+        :rtype: tuple<float, float>"""
+        i = bisect.bisect_right(self._group_starts, index) - 1
+        initial, initial_in_active_domain, total, total_in_active_domain, \
+            active, _ = self._groups[i]
+        repeat = index - self._group_starts[i]
+        active_event = initial + repeat * total
+        passive_event = (initial_in_active_domain
+                         + repeat * total_in_active_domain + active)
+        return active_event, passive_event
+
+    def iter_events(self, start=0):
+        """Iterates over the active and passive events (see
+        :meth:`get_events`) starting from the given index."""
+        for index in range(start, self._nb_events):
+            yield self.get_events(index)
 
     def get_active_events(self):
-        return self._active_events
-
-    active_events = property(get_active_events, set_active_events)
-
-    def add_passive_event(self, event):
-        self._passive_events.append(event)
+        """Returns the active events which were not fired yet."""
+        return [a for a, _ in self.iter_events(self._id or 0)]
 
-    def set_passive_events(self, events):
-        self._passive_events = events
+    active_events = property(get_active_events)
 
     def get_passive_events(self):
-        return self._passive_events
+        """Returns the passive events which were not fired yet."""
+        return [p for _, p in self.iter_events(self._id or 0)]
 
-    passive_events = property(get_passive_events, set_passive_events)
+    passive_events = property(get_passive_events)
 
     def set_direction(self, direction):
         self._direction = direction
@@ -189,7 +216,7 @@ class FunctionGenerator(EventGenerator, Logger):
     def run(self):
         self._running = True
         try:
-            while len(self.active_events) > 0 and not self.is_stopped():
+            while self._id < self._nb_events and not self.is_stopped():
                 self.wait_active()
                 self.fire_active()
                 self.wait_passive()
@@ -214,6 +241,14 @@ class FunctionGenerator(EventGenerator, Logger):
                 break
             time.sleep(nap)
 
+    def wait_until(self, timestamp):
+        """Waits until the given time with a high precision: sleeps (with
+        naps, so the stop is detected) until just before it and busy waits
+        the rest."""
+        self.sleep(timestamp - self.SPIN_TIME - time.time())
+        while time.time() < timestamp and not self.is_stopped():
+            pass
+
     def fire_start(self):
         self.fire_event(EventType("start"), self._id)
         self._start_fired = True
@@ -222,11 +257,9 @@ class FunctionGenerator(EventGenerator, Logger):
             self.warning(msg)
 
     def wait_active(self):
-        candidate = self.active_events[0]
+        candidate, _ = self.get_events(self._id)
         if self.initial_domain_in_use == SynchDomain.Time:
-            now = time.time()
-            candidate += self._start_time
-            self.sleep(candidate - now)
+            self.wait_until(candidate + self._start_time)
         else:
             while True:
                 if self.is_stopped():
@@ -242,8 +275,8 @@ class FunctionGenerator(EventGenerator, Logger):
     def fire_active(self):
         # check if some events needs to be skipped
         i = 0
-        while i < len(self.active_events) - 1:
-            candidate = self.active_events[i + 1]
+        while self._id + i < self._nb_events - 1:
+            candidate, _ = self.get_events(self._id + i + 1)
             if self.initial_domain_in_use is SynchDomain.Time:
                 candidate += self._start_time
                 now = time.time()
@@ -257,19 +290,16 @@ class FunctionGenerator(EventGenerator, Logger):
         if not self._start_fired:
             self.fire_start()
         self.fire_event(EventType("active"), self._id)
-        self.active_events = self.active_events[i + 1:]
-        self.passive_events = self.passive_events[i:]
 
     def wait_passive(self):
+        _, candidate = self.get_events(self._id)
         if self.active_domain_in_use == SynchDomain.Time:
-            now = time.time()
-            candidate = self._start_time + self.passive_events[0]
-            self.sleep(candidate - now)
+            self.wait_until(self._start_time + candidate)
         else:
             while True:
                 if self._position_event.isSet():
                     self._position_event.clear()
-                    if self._condition(self._position, self.passive_events[0]):
+                    if self._condition(self._position, candidate):
                         break
                 else:
                     self._position_event.wait(self.MAX_NAP_TIME)
@@ -278,18 +308,19 @@ class FunctionGenerator(EventGenerator, Logger):
 
     def fire_passive(self):
         self.fire_event(EventType("passive"), self._id)
-        self.set_passive_events(self.passive_events[1:])
-        if len(self.passive_events) == 0:
+        if self._id == self._nb_events - 1:
             self.fire_end()
 
     def fire_end(self):
         self.fire_event(EventType("end"), self._id)
 
     def set_configuration(self, configuration):
-        # make a copy since we may inject the initial time
-        configuration = copy.deepcopy(configuration)
-        active_events = []
-        passive_events = []
+        """Sets the synchronization description. Events are not calculated
+        here but on demand (see :meth:`get_events`), so the memory usage
+        does not depend on the number of repeats."""
+        groups = []
+        group_starts = []
+        nb_events = 0
         self._direction = None
         # create short variables for commodity
         Time = SynchDomain.Time
@@ -302,15 +333,12 @@ class FunctionGenerator(EventGenerator, Logger):
 
         for i, group in enumerate(configuration):
             # inject delay as initial time - generation will be
-            # relative to the start time
-            initial_param = group.get(Initial)
-            if initial_param is None:
-                initial_param = dict()
+            # relative to the start time (copy to not modify configuration)
+            initial_param = dict(group.get(Initial) or {})
             if Time not in initial_param:
                 delay_param = group.get(Delay)
                 if Time in delay_param:
                     initial_param[Time] = delay_param[Time]
-                group[Initial] = initial_param
             # determine active domain in use
             msg = "no initial value in group %d" % i
             if self.initial_domain in initial_param:
@@ -342,32 +370,49 @@ class FunctionGenerator(EventGenerator, Logger):
             active = active_param[active_domain_in_use]
             initial_in_initial_domain = initial_param[initial_domain_in_use]
             initial_in_active_domain = initial_param[active_domain_in_use]
-            active_event_in_initial_domain = initial_in_initial_domain
-            active_event_in_active_domain = initial_in_active_domain
+            total_in_initial_domain = total_in_active_domain = 0
             if repeats > 1:
                 total_param = group[Total]
                 total_in_initial_domain = total_param[initial_domain_in_use]
                 total_in_active_domain = total_param[active_domain_in_use]
-                for _ in range(repeats):
-                    passive_event = active_event_in_active_domain + active
-                    active_events.append(active_event_in_initial_domain)
-                    passive_events.append(passive_event)
-                    active_event_in_initial_domain += total_in_initial_domain
-                    active_event_in_active_domain += total_in_active_domain
-            else:
-                active_events.append(active_event_in_initial_domain)
-                passive_event = active_event_in_active_domain + active
-                passive_events.append(passive_event)
+            if repeats < 1:
+                continue
+            groups.append((initial_in_initial_domain,
+                           initial_in_active_domain,
+                           total_in_initial_domain,
+                           total_in_active_domain,
+                           active,
+                           repeats))
+            group_starts.append(nb_events)
+            nb_events += repeats
+
+        self._groups = groups
+        self._group_starts = group_starts
+        self._nb_events = nb_events
+        self._id = 0
 
         # determine direction
         if self.direction is None:
-            if strictly_increasing(active_events):
+            if self._events_monotonic(1):
                 self.direction = 1
-            elif strictly_decreasing(active_events):
+            elif self._events_monotonic(-1):
                 self.direction = -1
             else:
                 msg = "active values indicate contradictory directions"
                 raise ValueError(msg)
 
-        self.active_events = active_events
-        self.passive_events = passive_events
+    def _events_monotonic(self, direction):
+        """Checks whether the active events are strictly monotonic in the
+        given direction (1 - increasing, -1 - decreasing) without calculating
+        all of them."""
+        last_event = None
+        for index, (initial, _, total, _, _, repeats) in \
+                zip(self._group_starts, self._groups):
+            if repeats > 1 and total * direction <= 0:
+                return False
+            first_event, _ = self.get_events(index)
+            if last_event is not None and \
+                    (first_event - last_event) * direction <= 0:
+                return False
+            last_event, _ = self.get_events(index + repeats - 1)
+        return True
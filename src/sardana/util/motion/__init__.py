@@ -25,8 +25,10 @@
 
 """This is the main device pool module"""
 
-__all__ = ["MotionPath", "Motion", "BaseMotor", "Motor"]
+__all__ = ["MotionPath", "Motion", "BaseMotor", "Motor",
+           "calculate_motion_durations"]
 
 __docformat__ = 'restructuredtext'
 
-from .motion import MotionPath, Motion, BaseMotor, Motor
+from .motion import MotionPath, Motion, BaseMotor, Motor, \
+    calculate_motion_durations
@@ -25,13 +25,16 @@
 
 """This module contains the definition for a simulated motor"""
 
-__all__ = ["MotionPath", "Motion", "BaseMotor", "Motor", "DemoMotor"]
+__all__ = ["MotionPath", "Motion", "BaseMotor", "Motor", "DemoMotor",
+           "calculate_motion_durations"]
 
 __docformat__ = 'restructuredtext'
 
 import time
 from math import pow, sqrt
 
+import numpy
+
 
 class MotionPath(object):
     """Active motion path description"""
@@ -274,6 +277,77 @@ class MotionPath(object):
               self.displacement_reach_min_vel)
 
 
+def calculate_motion_durations(motor, initial_user_pos, final_user_pos):
+    """Calculate durations of many motions at once.
+
+    Vectorized (NumPy) equivalent of the :attr:`MotionPath.duration`
+    calculation (without the active time) for all the pairs of initial
+    and final positions.
+
+    :param motor: motor performing the motions
+    :type motor: :class:`BaseMotor`
+    :param initial_user_pos: initial positions of the motions
+    :type initial_user_pos: :class:`numpy.ndarray` or seq<float>
+    :param final_user_pos: final positions of the motions
+    :type final_user_pos: :class:`numpy.ndarray` or seq<float>
+    :return: durations of the motions
+    :rtype: :class:`numpy.ndarray`
+    """
+    initial_pos = numpy.asarray(initial_user_pos, dtype='d') \
+        * motor.step_per_unit
+    final_pos = numpy.asarray(final_user_pos, dtype='d') * motor.step_per_unit
+    displacement = numpy.abs(final_pos - initial_pos)
+    positive_displacement = final_pos > initial_pos
+    displmnt_not_cnst = motor.displacement_reach_max_vel + \
+        motor.displacement_reach_min_vel
+    small_motion = displacement < displmnt_not_cnst
+    inf = float('inf')
+
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # motions long enough to reach the maximum velocity
+        max_vel = numpy.full(displacement.shape, motor.max_vel)
+        delta_vel = numpy.full(displacement.shape,
+                               abs(motor.max_vel - motor.min_vel))
+        at_max_vel_displacement = displacement - displmnt_not_cnst
+
+        # small motions (maximum velocity is not reached)
+        if numpy.any(small_motion):
+            accel = numpy.where(positive_displacement, motor.accel,
+                                -motor.accel)
+            decel = numpy.where(positive_displacement, motor.decel,
+                                -motor.decel)
+            cnst = 2 * accel * decel * displacement / (decel - accel)
+            small_max_vel = numpy.sqrt(numpy.abs(pow(motor.min_vel, 2)
+                                                 + cnst))
+            max_vel = numpy.where(small_motion, small_max_vel, max_vel)
+            delta_vel = numpy.where(small_motion,
+                                    numpy.abs(small_max_vel - motor.min_vel),
+                                    delta_vel)
+            at_max_vel_displacement = numpy.where(
+                small_motion, 0.0, at_max_vel_displacement)
+
+        infinite_delta_vel = delta_vel == inf
+        # time to reach maximum velocity
+        if motor.accel == 0:
+            max_vel_time = numpy.zeros(displacement.shape)
+        else:
+            max_vel_time = numpy.where(infinite_delta_vel, 0,
+                                       numpy.abs(delta_vel / motor.accel))
+        # time to reach minimum velocity
+        if motor.decel == 0:
+            min_vel_time = numpy.zeros(displacement.shape)
+        else:
+            min_vel_time = numpy.where(infinite_delta_vel, 0,
+                                       numpy.abs(delta_vel / motor.decel))
+        # time at maximum velocity
+        at_max_vel_time = numpy.where(
+            small_motion | (numpy.abs(max_vel) == inf), 0,
+            numpy.abs(at_max_vel_displacement / max_vel))
+
+    duration = max_vel_time + at_max_vel_time + min_vel_time
+    return numpy.where(displacement == 0, 0.0, duration)
+
+
 class Motion(object):
     """Active motion description"""
 
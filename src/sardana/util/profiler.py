@@ -0,0 +1,228 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides a wall-clock time profiler of execution phases
+(e.g. motion, acquisition or hooks of a macro) with an optional cProfile
+of the profiled thread"""
+
+__all__ = ["PhaseProfiler", "get_phase_profiler", "profile_phase",
+           "profiled"]
+
+import io
+import time
+import pstats
+import cProfile
+import marshal
+import threading
+import functools
+
+_local = threading.local()
+
+
+class PhaseProfiler(object):
+    """Aggregates the wall-clock time spent in the execution phases of one
+    thread. The time is attributed to the innermost phase so the phases
+    times (including the ``None`` phase - code outside of any phase) sum up
+    to the total time.
+
+    :param use_cprofile: run also cProfile on the profiled thread
+    :type use_cprofile: :obj:`bool`
+    """
+
+    def __init__(self, use_cprofile=False):
+        self._stack = []
+        # dict<str, list<int, float>> where key is the phase name and value
+        # is the number of calls and the (exclusive) time
+        self._phases = {}
+        self._start = None
+        self._total = 0.0
+        self._cprofile = None
+        if use_cprofile:
+            self._cprofile = cProfile.Profile()
+
+    def start(self):
+        """Starts profiling the current thread"""
+        _local.profiler = self
+        self._start = time.perf_counter()
+        self._stack = [[None, self._start]]
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self):
+        """Stops profiling"""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        now = time.perf_counter()
+        # close the phases interrupted by an exception
+        while len(self._stack) > 1:
+            self.exit(now)
+        self._add(None, now - self._stack[0][1])
+        self._total = now - self._start
+        if getattr(_local, "profiler", None) is self:
+            _local.profiler = None
+
+    def _add(self, phase, duration, calls=1):
+        data = self._phases.get(phase)
+        if data is None:
+            self._phases[phase] = data = [0, 0.0]
+        data[0] += calls
+        data[1] += duration
+
+    def enter(self, phase):
+        """Enters the given phase
+
+        :param phase: phase name
+        :type phase: :obj:`str`"""
+        now = time.perf_counter()
+        outer = self._stack[-1]
+        self._add(outer[0], now - outer[1], 0)
+        self._stack.append([phase, now])
+
+    def exit(self, now=None):
+        """Exits the current phase"""
+        # phases exited after stopping were already closed by stop
+        if len(self._stack) < 2:
+            return
+        if now is None:
+            now = time.perf_counter()
+        phase, start = self._stack.pop()
+        self._add(phase, now - start)
+        # the outer phase continues
+        self._stack[-1][1] = now
+
+    def wrap(self, func, phase):
+        """Returns the given callable profiled in the given phase
+
+        :param func: callable
+        :param phase: phase name
+        :type phase: :obj:`str`
+        :return: profiled callable"""
+        return profiled(phase)(func)
+
+    def get_summary(self):
+        """Returns the phases summary sorted by time
+
+        :return: dictionary with the total time and the list of phases
+            (dicts with name, calls, time and percentage of the total time)
+        :rtype: :obj:`dict`"""
+        total = self._total
+        phases = []
+        for name, (calls, duration) in self._phases.items():
+            if name is None:
+                name = "other"
+            percent = 100 * duration / total if total > 0 else 0
+            phases.append(dict(name=name, calls=calls, time=duration,
+                               percent=percent))
+        phases.sort(key=lambda x: -x["time"])
+        return dict(total=total, phases=phases)
+
+    def format_summary(self, top=20):
+        """Returns the phases summary as a table
+
+        :param top: maximum number of phases
+        :type top: :obj:`int`
+        :return: summary table
+        :rtype: :obj:`str`"""
+        summary = self.get_summary()
+        lines = ["{:<40} {:>8} {:>10} {:>6}".format("phase", "calls",
+                                                    "time [s]", "%")]
+        for phase in summary["phases"][:top]:
+            lines.append("{name:<40} {calls:>8} {time:>10.3f} "
+                         "{percent:>6.1f}".format(**phase))
+        lines.append("{:<40} {:>8} {:>10.3f}".format("total", "",
+                                                     summary["total"]))
+        return "\n".join(lines)
+
+    def has_cprofile(self):
+        """Returns whether cProfile was run"""
+        return self._cprofile is not None
+
+    def get_cprofile_stats(self):
+        """Returns the cProfile statistics serialized in the format of the
+        :meth:`pstats.Stats.dump_stats` files (loadable with :mod:`pstats`)
+
+        :return: statistics or None if cProfile was not run
+        :rtype: :obj:`bytes`"""
+        if self._cprofile is None:
+            return None
+        self._cprofile.create_stats()
+        return marshal.dumps(self._cprofile.stats)
+
+    def format_cprofile_stats(self, top=20, sort="cumulative"):
+        """Returns the top functions of the cProfile statistics
+
+        :return: statistics report or None if cProfile was not run
+        :rtype: :obj:`str`"""
+        if self._cprofile is None:
+            return None
+        stream = io.StringIO()
+        stats = pstats.Stats(self._cprofile, stream=stream)
+        stats.sort_stats(sort).print_stats(top)
+        return stream.getvalue()
+
+
+def get_phase_profiler():
+    """Returns the phase profiler of the current thread
+
+    :return: phase profiler or None if the thread is not profiled
+    :rtype: :class:`PhaseProfiler` or None"""
+    return getattr(_local, "profiler", None)
+
+
+class profile_phase(object):
+    """Context manager attributing the time spent in its block to the given
+    phase of the current thread profiler. It does nothing if the current
+    thread is not profiled.
+
+    :param phase: phase name
+    :type phase: :obj:`str`"""
+
+    __slots__ = ("_phase", "_profiler")
+
+    def __init__(self, phase):
+        self._phase = phase
+        self._profiler = getattr(_local, "profiler", None)
+
+    def __enter__(self):
+        if self._profiler is not None:
+            self._profiler.enter(self._phase)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._profiler is not None:
+            self._profiler.exit()
+        return False
+
+
+def profiled(phase):
+    """Decorator attributing the time spent in the decorated callable to the
+    given phase of the current thread profiler (see :class:`profile_phase`).
+
+    :param phase: phase name
+    :type phase: :obj:`str`"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_phase(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,113 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import numpy
+
+from unittest import TestCase
+
+from sardana.util.decimation import MinMaxDecimator
+
+
+def curve(nb_points, seed=0):
+    rng = numpy.random.RandomState(seed)
+    x = numpy.arange(nb_points, dtype=float)
+    y = rng.normal(size=nb_points)
+    return x, y
+
+
+def update_in_chunks(decimator, x, y, chunk, offset=0):
+    """Update the decimator as if the curve was growing by chunk points
+    and yield the decimated curves"""
+    for end in range(chunk, len(y) + chunk, chunk):
+        yield end, decimator.update(x[:end], y[:end], offset)
+
+
+class MinMaxDecimatorTestCase(TestCase):
+
+    def test_few_points(self):
+        """Test that the curve is not decimated below the point budget"""
+        x, y = curve(20)
+        x_dec, y_dec = MinMaxDecimator(10).update(x, y)
+        numpy.testing.assert_array_equal(x_dec, x)
+        numpy.testing.assert_array_equal(y_dec, y)
+
+    def test_point_budget(self):
+        """Test that the decimated curve does not exceed the point budget"""
+        nb_bins = 16
+        x, y = curve(5000)
+        for chunk in (1, 7, 100, 5000):
+            decimator = MinMaxDecimator(nb_bins)
+            for end, (x_dec, y_dec) in update_in_chunks(decimator, x, y,
+                                                        chunk):
+                # plus the minimum and maximum of the incomplete bin
+                self.assertLessEqual(len(y_dec), 2 * nb_bins + 2,
+                                     (chunk, end))
+                self.assertEqual(len(x_dec), len(y_dec))
+
+    def test_extrema(self):
+        """Test that the minimum and maximum of the curve are kept"""
+        x, y = curve(3000)
+        y[1234], y[2345] = 100, -100
+        y[[10, 500]] = numpy.nan
+        for chunk in (1, 33, 3000):
+            decimator = MinMaxDecimator(8)
+            for end, (_, y_dec) in update_in_chunks(decimator, x, y, chunk):
+                self.assertIn(numpy.nanmax(y[:end]), y_dec, (chunk, end))
+                self.assertIn(numpy.nanmin(y[:end]), y_dec, (chunk, end))
+
+    def test_x_monotonic(self):
+        """Test that the decimated x values keep their order"""
+        x, y = curve(3000)
+        for chunk in (1, 33, 3000):
+            decimator = MinMaxDecimator(8)
+            for end, (x_dec, _) in update_in_chunks(decimator, x, y, chunk):
+                self.assertTrue(numpy.all(numpy.diff(x_dec) > 0),
+                                (chunk, end))
+
+    def test_offset(self):
+        """Test that dropping points from the beginning of the curve
+        decimates it again"""
+        x, y = curve(1000)
+        decimator = MinMaxDecimator(8)
+        decimator.update(x, y)
+        x_dec, y_dec = decimator.update(x[100:], y[100:], offset=100)
+        x_exp, y_exp = MinMaxDecimator(8).update(x[100:], y[100:])
+        numpy.testing.assert_array_equal(x_dec, x_exp)
+        numpy.testing.assert_array_equal(y_dec, y_exp)
+        self.assertTrue(numpy.all(x_dec >= 100))
+
+    def test_reset(self):
+        """Test that a shorter curve (e.g. a new scan) and reset() start
+        the decimation again"""
+        x, y = curve(1000)
+        decimator = MinMaxDecimator(8)
+        decimator.update(x, y)
+        x_new, y_new = curve(500, seed=1)
+        x_exp, y_exp = MinMaxDecimator(8).update(x_new, y_new)
+        x_dec, y_dec = decimator.update(x_new, y_new)
+        numpy.testing.assert_array_equal(y_dec, y_exp)
+        decimator.reset()
+        self.assertEqual(decimator.bin_size, 1)
+        x_dec, y_dec = decimator.update(x_new, y_new)
+        numpy.testing.assert_array_equal(x_dec, x_exp)
+        numpy.testing.assert_array_equal(y_dec, y_exp)
@@ -235,5 +235,24 @@ class FuncGeneratorTestCase(TestCase):
         for a, b in zip(passive_events, passive_events_ok):
             self.assertAlmostEqual(a, b, 10, msg)
 
+    def test_configuration_long(self):
+        repeats = 10 ** 6
+        configuration = [{SynchParam.Initial: {SynchDomain.Position: 0.},
+                          SynchParam.Delay: {SynchDomain.Time: 0.1},
+                          SynchParam.Active: {SynchDomain.Time: .01},
+                          SynchParam.Total: {SynchDomain.Position: .2,
+                                             SynchDomain.Time: .02},
+                          SynchParam.Repeats: repeats}]
+        self.func_generator.initial_domain = SynchDomain.Time
+        self.func_generator.active_domain = SynchDomain.Time
+        start = time.time()
+        self.func_generator.set_configuration(configuration)
+        self.assertLess(time.time() - start, 0.1)
+        self.assertEqual(self.func_generator.nb_events, repeats)
+        active_event, passive_event = self.func_generator.get_events(
+            repeats - 1)
+        self.assertAlmostEqual(active_event, .1 + (repeats - 1) * .02)
+        self.assertAlmostEqual(passive_event, .11 + (repeats - 1) * .02)
+
     def tearDown(self):
         self.func_generator.remove_listener(self.listener)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests for motion utilities."""
+
+import numpy
+from unittest import TestCase
+from taurus.test import insertTest
+
+from sardana.util.motion import Motor, MotionPath, calculate_motion_durations
+
+
+@insertTest(helper_name="durations", min_vel=0, max_vel=float("inf"),
+            accel_time=0, decel_time=0)
+@insertTest(helper_name="durations", min_vel=0, max_vel=10, accel_time=0,
+            decel_time=0)
+@insertTest(helper_name="durations", min_vel=1, max_vel=10, accel_time=2,
+            decel_time=1, step_per_unit=100)
+@insertTest(helper_name="durations", min_vel=0, max_vel=10, accel_time=1,
+            decel_time=1)
+class CalculateMotionDurationsTestCase(TestCase):
+    """Compare vectorized motion durations with :class:`MotionPath`."""
+
+    def durations(self, min_vel, max_vel, accel_time, decel_time,
+                  step_per_unit=1):
+        motor = Motor(min_vel=min_vel, max_vel=max_vel,
+                      accel_time=accel_time, decel_time=decel_time)
+        motor.setStepPerUnit(step_per_unit)
+        rng = numpy.random.RandomState(0)
+        # mix of long, small, negative and null displacements
+        initial = rng.uniform(-20, 20, 200)
+        final = initial + rng.uniform(-20, 20, 200) * \
+            rng.choice([0, 0.01, 1], 200)
+        durations = calculate_motion_durations(motor, initial, final)
+        for i, f, duration in zip(initial, final, durations):
+            expected = MotionPath(motor, i, f).duration
+            self.assertAlmostEqual(duration, expected, places=9)
@@ -0,0 +1,109 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.tango-controls.org/static/sardana/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import time
+import marshal
+import threading
+from unittest import TestCase
+
+from sardana.util.profiler import PhaseProfiler, get_phase_profiler, \
+    profile_phase, profiled
+
+
+@profiled("sleep")
+def sleep(duration):
+    time.sleep(duration)
+
+
+class PhaseProfilerTestCase(TestCase):
+
+    def _get_phases(self, profiler):
+        summary = profiler.get_summary()
+        return {phase["name"]: phase for phase in summary["phases"]}
+
+    def test_disabled(self):
+        self.assertIsNone(get_phase_profiler())
+        with profile_phase("phase"):
+            pass
+        sleep(0)
+
+    def test_phases(self):
+        profiler = PhaseProfiler()
+        profiler.start()
+        try:
+            self.assertIs(get_phase_profiler(), profiler)
+            with profile_phase("outer"):
+                time.sleep(0.02)
+                sleep(0.01)
+                sleep(0.01)
+            # wrapped callables e.g. hooks
+            profiler.wrap(time.sleep, "hook")(0.01)
+        finally:
+            profiler.stop()
+        self.assertIsNone(get_phase_profiler())
+        phases = self._get_phases(profiler)
+        self.assertEqual(phases["sleep"]["calls"], 2)
+        self.assertEqual(phases["outer"]["calls"], 1)
+        self.assertEqual(phases["hook"]["calls"], 1)
+        # time is exclusive of the inner phases
+        self.assertGreaterEqual(phases["sleep"]["time"], 0.02)
+        self.assertLess(phases["outer"]["time"], 0.02 + 0.01)
+        total = sum(phase["time"] for phase in phases.values())
+        self.assertAlmostEqual(total, profiler.get_summary()["total"])
+        self.assertIn("outer", profiler.format_summary())
+
+    def test_other_thread(self):
+        profiler = PhaseProfiler()
+        profiler.start()
+        try:
+            thread = threading.Thread(target=sleep, args=(0,))
+            thread.start()
+            thread.join()
+        finally:
+            profiler.stop()
+        self.assertNotIn("sleep", self._get_phases(profiler))
+
+    def test_exception(self):
+        profiler = PhaseProfiler()
+        profiler.start()
+        try:
+            with profile_phase("phase"):
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        with profile_phase("unfinished"):
+            profiler.stop()
+        phases = self._get_phases(profiler)
+        self.assertEqual(phases["phase"]["calls"], 1)
+        self.assertEqual(phases["unfinished"]["calls"], 1)
+
+    def test_cprofile(self):
+        profiler = PhaseProfiler(use_cprofile=True)
+        profiler.start()
+        sleep(0)
+        profiler.stop()
+        stats = marshal.loads(profiler.get_cprofile_stats())
+        self.assertTrue(any(func[2] == "sleep" for func in stats))
+        self.assertIn("sleep", profiler.format_cprofile_stats())
+        self.assertIsNone(PhaseProfiler().get_cprofile_stats())
@@ -23,9 +23,10 @@
 
 import time
 import random
+import threading
 
 from sardana.sardanathreadpool import get_thread_pool
-from sardana.util.thread import CountLatch
+from sardana.util.thread import CountLatch, FlushScheduler, RateLimiter
 from unittest import TestCase
 
 
@@ -46,3 +47,77 @@ class CountLatchTestCase(TestCase):
         self.assertEqual(pool.getNumOfBusyWorkers(), 0, msg)
         msg = "jobs queue is not empty"
         self.assertEqual(pool.qsize, 0, msg)
+
+
+class FlushSchedulerTestCase(TestCase):
+
+    def setUp(self):
+        self.scheduler = FlushScheduler()
+        self.calls = []
+        self.event = threading.Event()
+
+    def _callback(self):
+        self.calls.append(("callback", threading.current_thread()))
+        self.event.set()
+
+    def _other_callback(self):
+        self.calls.append(("other", threading.current_thread()))
+
+    def test_schedule(self):
+        self.scheduler.schedule(self._callback, 0.1)
+        # already scheduled callbacks keep their deadline
+        self.scheduler.schedule(self._callback, 0)
+        self.scheduler.schedule(self._other_callback, 0.01)
+        self.assertTrue(self.event.wait(2))
+        names = [name for name, _ in self.calls]
+        self.assertEqual(names, ["other", "callback"])
+        # all the callbacks are called from the same thread
+        threads = set(thread for _, thread in self.calls)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads.pop(), threading.current_thread())
+        self.event.clear()
+        self.scheduler.schedule(self._callback, 0)
+        self.assertTrue(self.event.wait(2))
+        self.assertIs(self.calls[-1][1], self.calls[0][1])
+
+    def test_cancel(self):
+        self.scheduler.schedule(self._callback, 0.05)
+        self.scheduler.cancel(self._callback)
+        self.assertFalse(self.event.wait(0.2))
+        self.assertEqual(self.calls, [])
+
+
+class RateLimiterTestCase(TestCase):
+
+    def setUp(self):
+        self.calls = 0
+        self.started = threading.Event()
+
+    def _slow_call(self):
+        self.started.set()
+        time.sleep(0.2)
+        self.calls += 1
+
+    def _call(self):
+        self.calls += 1
+
+    def test_merge(self):
+        limiter = RateLimiter(self._call, 5)
+        for _ in range(5):
+            limiter()
+        self.assertEqual(self.calls, 1)
+        time.sleep(0.4)
+        # the first call and one postponed call with the latest values
+        self.assertEqual(self.calls, 2)
+
+    def test_cancel(self):
+        limiter = RateLimiter(self._slow_call, 20)
+        limiter._last_call = time.time()
+        limiter()
+        self.assertTrue(self.started.wait(1))
+        limiter.cancel()
+        # the postponed call in progress finished before cancel returned
+        self.assertEqual(self.calls, 1)
+        limiter()
+        time.sleep(0.1)
+        self.assertEqual(self.calls, 1)
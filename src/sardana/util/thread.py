@@ -23,7 +23,8 @@
 
 import time
 import ctypes
-from threading import Condition
+import logging
+from threading import Condition, Lock, Thread
 
 
 class CountLatch(object):
@@ -63,6 +64,151 @@ class CountLatch(object):
         self.condition.release()
 
 
+class FlushScheduler(object):
+    """Calls the scheduled callbacks when their deadlines expire.
+
+    All the callbacks are called from a single long-lived daemon thread
+    (started on the first schedule) so the objects which send their data
+    in batches (e.g. recorders, log handlers) do not need to start a timer
+    thread per batch.
+
+    .. note::
+        The FlushScheduler class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including removal of the module) may occur if
+        deemed necessary by the core developers.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._deadlines = {}
+        self._thread = None
+
+    def schedule(self, callback, delay):
+        """Schedule callback to be called in delay seconds. If the callback
+        is already scheduled its deadline is not changed.
+
+        :param callback: callable without arguments
+        :param delay: delay in seconds
+        """
+        with self._condition:
+            if callback in self._deadlines:
+                return
+            self._deadlines[callback] = time.time() + delay
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="FlushScheduler")
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, callback):
+        """Cancel the callback (if it is scheduled).
+
+        :param callback: callable previously scheduled
+        """
+        with self._condition:
+            self._deadlines.pop(callback, None)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                now = time.time()
+                due = [callback for callback, deadline
+                       in self._deadlines.items() if deadline <= now]
+                if len(due) == 0:
+                    timeout = None
+                    if len(self._deadlines) > 0:
+                        timeout = min(self._deadlines.values()) - now
+                    self._condition.wait(timeout)
+                    continue
+                for callback in due:
+                    del self._deadlines[callback]
+            for callback in due:
+                try:
+                    callback()
+                except Exception:
+                    logging.getLogger(__name__).exception(
+                        "Error in scheduled flush %r", callback)
+
+
+__flush_scheduler_lock = Lock()
+__flush_scheduler = None
+
+
+def get_flush_scheduler():
+    """Returns the global flush scheduler.
+
+    :return: flush scheduler
+    :rtype: FlushScheduler
+    """
+    global __flush_scheduler
+    with __flush_scheduler_lock:
+        if __flush_scheduler is None:
+            __flush_scheduler = FlushScheduler()
+        return __flush_scheduler
+
+
+class RateLimiter(object):
+    """Calls the given function at most *rate* times per second (no limit if
+    *rate* is not positive). Calls which come too early are postponed and
+    merged into one call, so the latest values are always rendered.
+
+    After :meth:`cancel` the function is not called anymore.
+
+    .. note::
+        The RateLimiter class has been included in Sardana
+        on a provisional basis. Backwards incompatible changes
+        (up to and including removal of the module) may occur if
+        deemed necessary by the core developers.
+    """
+
+    def __init__(self, func, rate):
+        self._func = func
+        self._period = 1. / rate if rate > 0 else 0
+        self._lock = Lock()
+        # serializes the function calls so cancel can wait for them
+        self._call_lock = Lock()
+        self._last_call = 0
+        self._postponed = False
+        self._cancelled = False
+
+    def __call__(self):
+        with self._lock:
+            if self._cancelled or self._postponed:
+                # postponed call will render the latest values
+                return
+            delay = self._last_call + self._period - time.time()
+            if delay > 0:
+                self._postponed = True
+                get_flush_scheduler().schedule(self._postponed_call, delay)
+                return
+            self._last_call = time.time()
+        self._call()
+
+    def _postponed_call(self):
+        with self._lock:
+            if not self._postponed:
+                return
+            self._postponed = False
+            self._last_call = time.time()
+        self._call()
+
+    def _call(self):
+        with self._call_lock:
+            if not self._cancelled:
+                self._func()
+
+    def cancel(self):
+        """Cancel the postponed call (if any) and wait until the call in
+        progress (if any) finishes"""
+        with self._lock:
+            self._cancelled = True
+            self._postponed = False
+        get_flush_scheduler().cancel(self._postponed_call)
+        with self._call_lock:
+            pass
+
+
 _asyncexc = ctypes.pythonapi.PyThreadState_SetAsyncExc
 # first define the async exception function args. This is
 # absolutely necessary for 64 bits machines.